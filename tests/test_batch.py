@@ -0,0 +1,51 @@
+"""--memory-limit-mb in the single-browser path, with a stand-in scraper (no browser)"""
+from wisata_scraper import __main__ as cli
+from wisata_scraper import engine
+
+
+class FakeScraper:
+    """Stops the first crawl of 'museum_angkut' at the memory cap"""
+    instances = []
+
+    def __init__(self, **options):
+        self.options = options
+        self.memory_exceeded = False
+        self.calls = []
+        self.restarts = 0
+        FakeScraper.instances.append(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def restart(self):
+        self.restarts += 1
+
+    def scrape_place(self, place_key, mode=engine.MODE_MAIN, resume=None):
+        self.calls.append((place_key, resume))
+        self.memory_exceeded = place_key == 'museum_angkut' and resume is None
+        return [f'{place_key} resumed' if resume else place_key]
+
+
+def test_run_batch_resumes_after_memory_stop(monkeypatch):
+    monkeypatch.setattr(engine, 'ReviewScraper', FakeScraper)
+    FakeScraper.instances = []
+
+    results = engine.run_batch(['museum_angkut', 'jatim_park_2'], memory_limit_mb=800)
+    scraper, = FakeScraper.instances
+    assert scraper.options['memory_limit_mb'] == 800
+    assert scraper.calls == [('museum_angkut', None), ('museum_angkut', True), ('jatim_park_2', None)]
+    assert scraper.restarts == 1
+    assert results == {'museum_angkut': ['museum_angkut resumed'], 'jatim_park_2': ['jatim_park_2']}
+
+
+def test_cli_passes_memory_limit_to_single_worker(monkeypatch):
+    monkeypatch.setattr(engine, 'ReviewScraper', FakeScraper)
+    FakeScraper.instances = []
+
+    assert cli.main(['jatim_park_2', '--memory-limit-mb', '900']) == 0
+    assert FakeScraper.instances[0].options['memory_limit_mb'] == 900
+    assert cli.main(['jatim_park_2']) == 0
+    assert FakeScraper.instances[1].options['memory_limit_mb'] is None
@@ -0,0 +1,73 @@
+"""The vectorized cleaners give the same frame as the notebook's row-wise ones"""
+import numpy as np
+import pandas as pd
+
+from wisata_scraper import cleaning_reference as reference
+from wisata_scraper.cleaning import (
+    ICON_CLOSE,
+    ICON_OPEN,
+    check_parity,
+    clean_review_text,
+    clean_reviewer_name,
+    standardize_visit_time,
+)
+
+ICON_COUNT = f'{ICON_OPEN} 5 {ICON_CLOSE}'
+
+
+def fixture_frame():
+    review_text = [
+        'Tempatnya bagus 👍👍 anak-anak senang ⭐️⭐️⭐️⭐️⭐️',
+        'Diterjemahkan oleh Google ・ Great place, very clean (Asli) Tempat yang bagus',
+        'Translated by Google Nice museum. See original (Indonesian) Museum bagus',
+        'Waktu antrean Maks 10 mnt Sebaiknya buat reservasi Tidak yakin. Parkir luas',
+        'Antre 1 jam+ di loket, 10-30 mnt untuk masuk. Queue time 30-60 min',
+        f'Foto {ICON_COUNT} +5 fasilitas lengkap +12',
+        '・ Bersih\n・ Murah\n・ Ramah ,,',
+        'Ramai sekali pada akhir pekan. Datang lagi, hari biasa',
+        'Bagus. Akhir pekan',
+        '...',
+        '',
+        np.nan,
+        '\u200bTiket\u00ad mahal ⭐  tapi   worth it!!',
+    ]
+    count = len(review_text)
+    reviewer_name = ['Budi Santoso', 'Dewi ・ Lestari', 'Translated by Google Rizky', 'A', '😀😀',
+                     np.nan, '', ' Local Guide ', 'Andi ✨', '  Sari  ', 'B.', '・', 'Joko 👍']
+    visit_time = ['Akhir pekan', 'weekend', 'Diterjemahkan oleh Google ・ hari biasa', 'HARI LIBUR NASIONAL',
+                  'Akhir p', '', np.nan, 'libur nasional', 'public holiday', 'weekdays', '⭐ Hari biasa',
+                  'Pagi', 'akhir pekan ']
+    assert len(reviewer_name) == len(visit_time) == count
+    return pd.DataFrame({
+        'reviewer_name': reviewer_name,
+        'rating': [5, 4, 5, 3, 2, 5, 4, 3, 5, 1, 2, 3, 4],
+        'visit_time': visit_time,
+        'review_text': review_text,
+    })
+
+
+def test_cleaning_matches_reference():
+    df = fixture_frame()
+
+    expected = df.copy()
+    expected['review_text'] = df['review_text'].apply(reference.clean_review_text).astype(object)
+    expected['reviewer_name'] = df['reviewer_name'].apply(reference.clean_reviewer_name).astype(object)
+    expected['visit_time'] = df['visit_time'].apply(reference.clean_visit_time).astype(object)
+
+    got = df.copy()
+    got['review_text'] = clean_review_text(df['review_text']).astype(object)
+    got['reviewer_name'] = clean_reviewer_name(df['reviewer_name']).astype(object)
+    got['visit_time'] = standardize_visit_time(df['visit_time']).astype(object)
+
+    pd.testing.assert_frame_equal(got, expected)
+    # The fixture does exercise the rules
+    assert got['review_text'].iloc[10] == got['review_text'].iloc[11] == ''
+    assert 'Diterjemahkan' not in got['review_text'].iloc[1] and '・' not in got['review_text'].iloc[6]
+    assert 'mnt' not in got['review_text'].iloc[3]
+    assert ICON_OPEN not in got['review_text'].iloc[5]
+    assert got['visit_time'].iloc[6] == 'Tidak diketahui'
+
+
+def test_check_parity_reports_no_mismatches():
+    mismatches = check_parity(fixture_frame())
+    assert mismatches == {'review_text': [], 'reviewer_name': [], 'visit_time': []}
@@ -0,0 +1,35 @@
+"""safe_execute_script against a stand-in driver (no browser)"""
+from selenium.common.exceptions import JavascriptException, NoSuchWindowException
+from urllib3.exceptions import MaxRetryError
+
+from wisata_scraper.driver import safe_execute_script
+
+
+class StubDriver:
+    def __init__(self, error=None):
+        self.error = error
+        self.calls = []
+
+    @property
+    def current_url(self):
+        raise AssertionError("safe_execute_script probed the driver")
+
+    def execute_script(self, script, *args):
+        self.calls.append((script, args))
+        if self.error is not None:
+            raise self.error
+        return len(args)
+
+
+def test_one_round_trip_per_call():
+    driver = StubDriver()
+    assert safe_execute_script(driver, 'return arguments.length', 1, 2) == 2
+    assert driver.calls == [('return arguments.length', (1, 2))]
+
+
+def test_failures_return_none():
+    for error in (JavascriptException('boom'), NoSuchWindowException('closed'),
+                  MaxRetryError(None, '/session/x/execute/sync', 'Connection refused')):
+        driver = StubDriver(error)
+        assert safe_execute_script(driver, 'return 1') is None
+        assert len(driver.calls) == 1
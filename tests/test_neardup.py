@@ -0,0 +1,77 @@
+"""Near-duplicate clustering on known duplicate and distinct reviews"""
+import numpy as np
+import pandas as pd
+
+from wisata_scraper.neardup import (
+    MinHasher,
+    _candidate_pairs,
+    drop_near_duplicates,
+    find_near_duplicates,
+    normalize_for_shingles,
+    shingle_hashes,
+)
+
+FULL = ('Museum Angkut sangat keren, koleksi mobil antik dari berbagai negara tertata rapi. '
+        'Spot fotonya banyak dan anak-anak senang sekali, tapi antre tiketnya lumayan lama.')
+OTHER = ('Jatim Park 2 cocok untuk keluarga, kebun binatangnya bersih dan hewannya terawat. '
+         'Makanan di dalam agak mahal, bawa minum sendiri lebih hemat.')
+
+
+def reviews():
+    return pd.DataFrame({
+        'wisata': ['museum_angkut'] * 5 + ['jatim_park_2'] * 3,
+        'reviewer_name': ['Budi', 'Budi', 'budi ', 'Dewi', 'Budi', 'Sari', 'Sari', 'Rizky'],
+        'rating': [5, 5, 5, 4, 5, 4, 4, 3],
+        'review_text': [
+            FULL,
+            FULL[:120] + '... Lainnya',                                  # truncated copy
+            'Diterjemahkan oleh Google ' + FULL,                         # leftover marker
+            FULL,                                                        # same text, other reviewer
+            'Pantai Balekambang bersih, ombaknya besar dan pemandangannya indah sekali saat sore.',
+            OTHER,
+            OTHER.replace('agak mahal', 'cukup mahal'),                  # one-word edit
+            OTHER,                                                       # same text, other reviewer
+        ],
+        'visit_time': ['Tidak diketahui', 'Akhir pekan', '', '', '', '', 'Hari biasa', ''],
+    }, index=[10, 11, 12, 13, 14, 20, 21, 22])
+
+
+def test_clusters_known_pairs():
+    df = reviews()
+    clusters = find_near_duplicates(df)
+    groups = sorted(sorted(members) for members in clusters.groupby('cluster')['index'].apply(list))
+    assert groups == [[10, 11, 12], [20, 21]]
+
+    canonical = clusters.groupby('cluster')['canonical_index'].first().sort_values().tolist()
+    assert canonical == [12, 21]   # longest text
+    assert sorted(drop_near_duplicates(df, clusters).index) == [12, 13, 14, 21, 22]
+
+    # Without the reviewer check the other reviewer's identical copy joins the cluster
+    loose = find_near_duplicates(df, same_reviewer=False)
+    assert 13 in loose['index'].tolist() and 22 in loose['index'].tolist()
+    assert 14 not in loose['index'].tolist()
+
+
+def test_candidate_pairs_groups_each_band():
+    hasher = MinHasher()
+    texts = [FULL, FULL, OTHER, OTHER.replace('agak mahal', 'cukup mahal'),
+             'Pantai Balekambang bersih, ombaknya besar dan pemandangannya indah sekali saat sore.']
+    signatures = np.vstack([hasher.signature(shingle_hashes(normalize_for_shingles(text))) for text in texts])
+    pairs = _candidate_pairs(signatures, [''] * len(texts), bands=16)
+    assert (0, 1) in pairs and (2, 3) in pairs
+    assert not any(4 in pair for pair in pairs)
+    assert not any(left in (0, 1) and right in (2, 3) for left, right in pairs)
+
+    # Same result as scanning for each bucket's members
+    expected = set()
+    rows = signatures.shape[1] // 16
+    for band in range(16):
+        _, inverse = np.unique(signatures[:, band * rows:(band + 1) * rows], axis=0, return_inverse=True)
+        inverse = inverse.ravel()
+        for bucket in set(inverse.tolist()):
+            members = np.flatnonzero(inverse == bucket).tolist()
+            expected.update((members[i], members[j]) for i in range(len(members)) for j in range(i + 1, len(members)))
+    assert pairs == expected
+
+    # Prefix buckets pair texts the bands miss
+    assert (3, 4) in _candidate_pairs(signatures, ['', '', '', 'x', 'x'], bands=16)
@@ -0,0 +1,21 @@
+"""Reading saved review files back"""
+import json
+
+from wisata_scraper.output import read_reviews
+
+
+def test_jsonl_values_read_back_as_written(tmp_path):
+    rows = [
+        {'reviewer_name': 'Budi', 'rating': 5, 'date': '2 bulan lalu', 'visit_time': 'Akhir pekan',
+         'review_text': 'Bagus', 'review_id': '1690000000000', 'fingerprint': '0012',
+         'scraped_at': '2025-07-25T16:00:08'},
+        {'reviewer_name': 'Dewi', 'rating': 4, 'date': '2025-07-20', 'visit_time': '',
+         'review_text': 'Ramai', 'review_id': 'ChZabc', 'fingerprint': 'ff01',
+         'scraped_at': '2025-07-25T16:05:00'},
+    ]
+    path = tmp_path / 'museum_angkut_ALL_reviews_20250725_160008.jsonl'
+    path.write_text(''.join(json.dumps(row) + '\n' for row in rows), encoding='utf-8')
+
+    # No date guessing on 'date'/'*_at' columns, no numeric casting of ids
+    df = read_reviews(str(path))
+    assert df.to_dict('records') == rows
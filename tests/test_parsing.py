@@ -0,0 +1,69 @@
+"""parse_review_text against the old parser, and its edge cases (tests/fixtures/reviews_sample.csv)"""
+import os
+
+import pandas as pd
+
+from wisata_scraper import parsing_reference as reference
+from wisata_scraper.parsing import check_parity, clean_review_text, parse_review_text
+from wisata_scraper.parsing_reference import OWNER_REPLY, sample_raw_texts
+
+FIXTURE = os.path.join(os.path.dirname(__file__), 'fixtures', 'reviews_sample.csv')
+
+
+def parse(raw_text, aria_rating='5 bintang'):
+    """Parse with both parsers; they must agree"""
+    review = parse_review_text(raw_text, aria_rating)
+    assert review == reference.parse_review_from_text(raw_text, aria_rating)
+    return review
+
+
+def test_parity_on_sample_texts():
+    samples = sample_raw_texts(pd.read_csv(FIXTURE))
+    assert len(samples) == 4 * 8
+    assert check_parity(samples) == []
+
+
+def test_owner_reply_cut_off():
+    review_text = 'Tempatnya bagus dan bersih, koleksi mobil antiknya lengkap dan tertata rapi sekali'
+    text = '\n'.join(['Budi Santoso', '3 ulasan', '2 bulan lalu', review_text] + OWNER_REPLY.split('\n'))
+    review = parse(text)
+    assert review['review_text'] == review_text
+    assert 'Terima kasih' not in review['review_text']
+    # An element that is itself the owner response is not a review
+    assert parse(OWNER_REPLY) is None
+
+
+def test_local_guide_name_line():
+    review = parse('Dewi Lestari\nLocal Guide · 24 ulasan\n3 minggu lalu\nMuseum mobil yang sangat lengkap', '4 bintang')
+    assert review['reviewer_name'] == 'Dewi Lestari'
+    assert review['date'] == '3 minggu lalu'
+    assert review['review_text'] == 'Museum mobil yang sangat lengkap'
+    # A name line that runs into the Local Guide badge is skipped like the badge line
+    review = parse('Budi Local Guide · 24 ulasan\nSari\n2 bulan lalu\nMuseum mobil yang sangat lengkap')
+    assert review['reviewer_name'] == 'Sari'
+
+
+def test_missing_aria_rating():
+    review = parse('Rizky\n3 ulasan\n5 hari lalu\nParkir penuh dan petugas kurang ramah', '')
+    assert review['rating'] == 0
+    assert review['date'] == '5 hari lalu'
+    # Without a rating the text is not trusted
+    assert review['review_text'] == ''
+    assert parse('Rizky\n3 ulasan\n5 hari lalu\nParkir penuh', '4 stars')['rating'] == 4
+
+
+def test_visit_time():
+    review = parse('Andi\n3 ulasan\nkemarin\nBaru\nBiasa saja, harga makanan mahal\nWaktu kunjungan\nHari biasa\nSuka',
+                   '3 bintang')
+    assert review['visit_time'] == 'Hari biasa'
+    assert review['review_text'] == 'Biasa saja, harga makanan mahal'
+    # Without the label a short month line stands in
+    assert parse('Andi\nkemarin\nBiasa saja, harga mahal\nJuli 2024')['visit_time'] == 'Juli 2024'
+
+
+def test_translation_markers_stripped():
+    review = parse('Sarah\n1 ulasan\nsetahun lalu\n'
+                   'Diterjemahkan oleh Google · Lihat versi asli (Inggris) Great museum for families', '5 stars')
+    assert review['review_text'] == 'Great museum for families'
+    assert clean_review_text('Translated by Google · View original (English) Nice place') == 'Nice place'
+    assert clean_review_text('Terjemahan Google Antre jam 10:30 +3 · lama') == 'Antre jam lama'
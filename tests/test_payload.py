@@ -0,0 +1,102 @@
+"""Decoding saved review-list payloads (tests/fixtures/payloads), no browser or network"""
+import os
+
+from wisata_scraper.payload import (
+    _detect_layout,
+    decode_payload_files,
+    decode_review_payload,
+    decode_review_payload_entries,
+    is_review_payload_url,
+    load_payload,
+)
+from wisata_scraper.rawstore import parse_raw_record, payload_raw_fields
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures', 'payloads')
+
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def test_listugcposts():
+    body = read_fixture('listugcposts.json')
+    assert _detect_layout(load_payload(body)) == 'listugcposts'
+
+    records = decode_review_payload(body)
+    # The fourth entry has no review id and is skipped
+    assert [record['review_id'] for record in records] == [
+        'ChZDSUhNMG9nS0VJQ0FnSUNGaXh0ZGRBEAE',
+        'ChdDSUhNMG9nS0VJQ0FnSURoNVlEYXBRRRAB',
+        'ChZDSUhNMG9nS0VJQ0FnSUNSbDc2TF9RRRAB',
+    ]
+    assert records[0] == {
+        'review_id': 'ChZDSUhNMG9nS0VJQ0FnSUNGaXh0ZGRBEAE',
+        'reviewer_name': 'Budi Santoso',
+        'rating': 4,
+        'date': '2 bulan lalu',
+        'visit_time': 'Akhir pekan',
+        'review_text': 'Tempatnya bagus, antre lumayan lama. Anak-anak senang.',
+    }
+    assert records[1]['rating'] == 1
+    assert records[1]['visit_time'] == ''
+    assert records[1]['review_text'] == 'Parkir penuh, petugas kurang ramah.'
+    # Rating-only review
+    assert records[2]['rating'] == 5
+    assert records[2]['date'] == '3 tahun lalu'
+    assert records[2]['review_text'] == ''
+
+
+def test_listentitiesreviews():
+    body = read_fixture('listentitiesreviews.json')
+    assert _detect_layout(load_payload(body)) == 'listentitiesreviews'
+
+    records = decode_review_payload(body)
+    assert records == [
+        {
+            'review_id': 'ChdDSUhNMG9nS0VJQ0FnSUR3eDhpRmtBRRAB',
+            'reviewer_name': 'Dewi Lestari',
+            'rating': 5,
+            'date': 'sebulan lalu',
+            'visit_time': '',
+            'review_text': 'Museum mobilnya lengkap, cocok buat foto.',
+        },
+        {
+            'review_id': 'ChZDSUhNMG9nS0VJQ0FnSUN3cE9HWmZREAE',
+            'reviewer_name': 'Rizky',
+            'rating': 2,
+            'date': '5 hari lalu',
+            'visit_time': '',
+            'review_text': 'Mahal dan ramai sekali',
+        },
+    ]
+
+
+def test_decode_payload_files():
+    paths = [os.path.join(FIXTURES, name) for name in ('listugcposts.json', 'listentitiesreviews.json')]
+    assert len(decode_payload_files(paths)) == 5
+
+
+def test_payload_entries_reparse():
+    # The entry kept in the raw store decodes to the same review again
+    for name in ('listugcposts.json', 'listentitiesreviews.json'):
+        for record, layout_name, entry in decode_review_payload_entries(read_fixture(name)):
+            expected = dict(record)
+            del expected['review_id']
+            assert parse_raw_record(payload_raw_fields(layout_name, entry)) == expected
+
+
+def test_foreign_payload():
+    # Place details and other RPCs the hook may see are not review lists
+    place_details = ")]}'\n" + '[null, [["0x2e7880a4f1b3c3a1:0x0", "Museum Angkut", [-7.8787, 112.5197]], 4.6]]'
+    assert _detect_layout(load_payload(place_details)) is None
+    assert decode_review_payload(place_details) == []
+    assert _detect_layout([None, None, [['not a review']]]) is None
+    assert decode_review_payload('not json') == []
+
+
+def test_review_payload_url():
+    assert is_review_payload_url('https://www.google.com/maps/rpc/listugcposts?authuser=0&hl=id')
+    assert is_review_payload_url('https://www.google.com/maps/preview/review/listentitiesreviews?pb=!1m2')
+    assert not is_review_payload_url('https://www.google.com/maps/preview/place?authuser=0')
+    assert not is_review_payload_url(None)
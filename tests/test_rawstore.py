@@ -0,0 +1,78 @@
+"""Rebuilding parsed files from raw records (--reparse), no browser"""
+import os
+
+import pandas as pd
+
+from wisata_scraper.payload import decode_review_payload_entries
+from wisata_scraper.places import get_place
+from wisata_scraper.rawstore import (
+    RawTextSink,
+    parsed_path,
+    payload_raw_fields,
+    raw_fields,
+    reparse,
+)
+
+TIMESTAMP = '20250725_160008'
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures', 'payloads')
+
+DOM_TEXT = ("Budi Santoso\nLocal Guide · 24 ulasan · 57 foto\n2 bulan lalu\n"
+            "Koleksi mobilnya lengkap dan tertata rapi.\nWaktu kunjungan\nAkhir pekan\nSuka\nBagikan")
+
+
+def write_run(tmp_path, with_payload_raw=True):
+    """A main run of museum_angkut: one review read from the page, one reused from
+    an earlier crawl and one decoded from a captured payload"""
+    place = get_place('museum_angkut')
+    raw_folder = tmp_path / 'raw'
+    output_folder = tmp_path / 'out'
+
+    with open(os.path.join(FIXTURES, 'listentitiesreviews.json'), encoding='utf-8') as f:
+        payload_record, layout_name, entry = decode_review_payload_entries(f.read())[0]
+
+    sink = RawTextSink(str(raw_folder / f'museum_angkut_ALL_raw_{TIMESTAMP}.jsonl.gz'), place['key'], 'main')
+    sink.write('dom-1', raw_fields(DOM_TEXT, '5 bintang'), scraped_at='2025-07-25T16:00:10')
+    sink.write('reused-1', raw_fields(DOM_TEXT.replace('Budi Santoso', 'Sari W.'), '4 bintang'),
+               scraped_at='2025-07-25T15:00:00')
+    if with_payload_raw:
+        sink.write(payload_record['review_id'], payload_raw_fields(layout_name, entry),
+                   scraped_at='2025-07-25T16:00:12')
+    sink.write('known-1', raw_fields(DOM_TEXT, '5 bintang'), known=True)
+    sink.close()
+
+    saved = pd.DataFrame({
+        'reviewer_name': ['Budi Santoso', 'Sari W.', 'Dewi Lestari'],
+        'rating': [5, 4, 5],
+        'review_id': ['dom-1', 'reused-1', payload_record['review_id']],
+    })
+    target = parsed_path(place, 'main', 'ALL', TIMESTAMP, str(output_folder))
+    jsonl_path = os.path.splitext(target)[0] + '.jsonl'
+    os.makedirs(output_folder, exist_ok=True)
+    saved.to_json(jsonl_path, orient='records', lines=True, force_ascii=False)
+    return str(raw_folder), str(output_folder), target, jsonl_path
+
+
+def test_reparse_keeps_every_review(tmp_path):
+    raw_folder, output_folder, target, jsonl_path = write_run(tmp_path)
+
+    assert reparse(['museum_angkut'], raw_folder=raw_folder, output_folder=output_folder) == [target]
+    df = pd.read_csv(target)
+    assert sorted(df['reviewer_name']) == ['Budi Santoso', 'Dewi Lestari', 'Sari W.']
+    assert set(df['review_id']) == {'dom-1', 'reused-1', 'ChdDSUhNMG9nS0VJQ0FnSUR3eDhpRmtBRRAB'}
+    assert df.loc[df['review_id'] == 'reused-1', 'scraped_at'].item() == '2025-07-25T15:00:00'
+    # The saved JSONL is kept, not deleted
+    assert not os.path.exists(jsonl_path)
+    assert len(pd.read_json(jsonl_path + '.orig', lines=True)) == 3
+
+    # A second reparse replaces its own CSV and keeps the first original
+    assert reparse(['museum_angkut'], raw_folder=raw_folder, output_folder=output_folder) == [target]
+    assert os.path.exists(target + '.orig') and os.path.exists(jsonl_path + '.orig')
+
+
+def test_reparse_skips_incomplete_raw_file(tmp_path):
+    # The payload review has no raw record: reparsing would drop it
+    raw_folder, output_folder, target, jsonl_path = write_run(tmp_path, with_payload_raw=False)
+
+    assert reparse(['museum_angkut'], raw_folder=raw_folder, output_folder=output_folder) == []
+    assert not os.path.exists(target)
+    assert len(pd.read_json(jsonl_path, lines=True)) == 3
@@ -0,0 +1,103 @@
+"""The replay harness: snapshots and the paging server, and run_replay when Firefox is installed"""
+import json
+import os
+import shutil
+import urllib.request
+
+import pandas as pd
+import pytest
+
+from wisata_scraper.replay import (
+    DEFAULT_TRUNCATE_CHARS,
+    ReplayServer,
+    build_snapshot,
+    card_rating,
+    card_review_id,
+    load_snapshot,
+    run_replay,
+)
+
+LONG_TEXT = 'Koleksi mobil antiknya lengkap dan tertata rapi. ' * 6
+
+
+def make_snapshot(tmp_path, count=25):
+    return load_snapshot(build_snapshot_file(tmp_path, count))
+
+
+def build_snapshot_file(tmp_path, count=25):
+    source = tmp_path / 'museum_angkut_ALL_reviews_20250725_160008.csv'
+    pd.DataFrame({
+        'reviewer_name': [f'Pengunjung {i}' for i in range(count)],
+        'rating': [i % 5 + 1 for i in range(count)],
+        'date': ['2 bulan lalu'] * count,
+        'visit_time': ['Akhir pekan' if i % 2 else None for i in range(count)],
+        'review_text': [LONG_TEXT if i % 4 == 0 else f'Ulasan singkat {i}' for i in range(count)],
+        'review_id': [f'id-{i:03d}' for i in range(count)],
+    }).to_csv(source, index=False)
+    snapshot = tmp_path / 'snapshot.html'
+    assert build_snapshot(str(source), str(snapshot), owner_every=7) == count
+    return str(snapshot)
+
+
+def fetch_json(url):
+    with urllib.request.urlopen(url) as response:
+        return json.loads(response.read())
+
+
+def test_snapshot_cards(tmp_path):
+    cards = make_snapshot(tmp_path)
+    assert len(cards) == 25
+    assert [card_review_id(card) for card in cards[:3]] == ['id-000', 'id-001', 'id-002']
+    assert [card_rating(card) for card in cards[:6]] == [1, 2, 3, 4, 5, 1]
+    # Long texts are cut behind 'Lainnya', with the full text kept for the click handler
+    assert 'Lainnya</button>' in cards[0] and len(LONG_TEXT) > DEFAULT_TRUNCATE_CHARS
+    assert 'Lainnya</button>' not in cards[1]
+    # Every 7th card carries an owner response inside it
+    assert 'Tanggapan dari pemilik' in cards[6]
+    assert 'Tanggapan dari pemilik' not in cards[5]
+    assert 'Waktu kunjungan' in cards[1] and 'Waktu kunjungan' not in cards[0]
+
+
+def test_server_pages_every_card_once(tmp_path):
+    cards = make_snapshot(tmp_path)
+    with ReplayServer(cards, page_size=10, latency_ms=0) as server:
+        with urllib.request.urlopen(server.url) as response:
+            page = response.read().decode('utf-8')
+        for hook in ('id="reviews-tab"', 'aria-label="Urutkan ulasan"', 'class="m6QErb DxyBCb" role="feed"',
+                     'data-sort="relevant" aria-checked="true"', 'data-sort="lowest" aria-checked="false"'):
+            assert hook in page
+
+        base = server.url.rsplit('/', 1)[0]
+        for sort in ('relevant', 'newest', 'highest', 'lowest'):
+            served, page_number, done = [], 0, False
+            while not done:
+                data = fetch_json(f'{base}/reviews?sort={sort}&page={page_number}')
+                served.extend(data['cards'])
+                done = data['done']
+                page_number += 1
+            assert page_number == 3
+            assert sorted(card_review_id(card) for card in served) == [f'id-{i:03d}' for i in range(25)]
+            ratings = [card_rating(card) for card in served]
+            if sort == 'lowest':
+                assert ratings == sorted(ratings)
+            elif sort == 'highest':
+                assert ratings == sorted(ratings, reverse=True)
+
+        assert server.pages_served == 12
+        assert len(server.served_ids) == 25
+
+
+def has_firefox():
+    return bool(shutil.which('firefox') and (os.environ.get('GECKODRIVER_PATH') or shutil.which('geckodriver')))
+
+
+@pytest.mark.skipif(not has_firefox(), reason="needs Firefox and geckodriver")
+def test_run_replay_collects_every_card(tmp_path, monkeypatch):
+    snapshot = build_snapshot_file(tmp_path)
+    monkeypatch.chdir(tmp_path)
+
+    result = run_replay(snapshot, latency_ms=0)
+    assert result['cards'] == result['served'] == 25
+    assert result['reviews'] == 25
+    assert result['missing'] == 0
+    assert result['webdriver_calls'] > 0
@@ -0,0 +1,123 @@
+"""SeenSet, its Bloom filter and save/load, and the seen-set kept with checkpoints"""
+import os
+
+from wisata_scraper.checkpoint import Checkpoint
+from wisata_scraper.seenset import MAX_LOAD, MIN_CAPACITY, SeenSet, _fake_review_ids
+
+
+def test_add_contains():
+    seen = SeenSet()
+    assert 'ChZabc' not in seen and len(seen) == 0
+    seen.add('ChZabc')
+    seen.add('ChZabc')
+    seen.add(17)
+    assert 'ChZabc' in seen and 17 in seen
+    assert 'ChZabd' not in seen and 18 not in seen
+    assert len(seen) == 2
+
+
+def test_growth_past_load_factor():
+    review_ids = _fake_review_ids(int(MIN_CAPACITY * MAX_LOAD) * 3)
+    seen = SeenSet(review_ids)
+    assert len(seen) == len(review_ids)
+    assert len(seen._table) > MIN_CAPACITY
+    assert seen._count <= len(seen._table) * MAX_LOAD
+    assert all(review_id in seen for review_id in review_ids)
+    assert not any(review_id in seen for review_id in _fake_review_ids(1000, seed=1))
+
+
+def test_zero_key():
+    # 0 marks an empty slot in the table, so it is tracked on its own
+    seen = SeenSet()
+    assert 0 not in seen
+    seen.add(0)
+    seen.add(0)
+    assert 0 in seen and len(seen) == 1
+    assert list(seen) == [0]
+    seen.add(1 << 64)  # same key as 0
+    assert len(seen) == 1
+
+
+def test_bloom_no_false_negatives():
+    review_ids = _fake_review_ids(5000)
+    seen = SeenSet(review_ids, bloom_bits=5000 * 4, bloom_hashes=3)
+    seen.add(0)
+    assert all(review_id in seen for review_id in review_ids)
+    assert 0 in seen
+    for key in seen:
+        assert key in seen.bloom
+
+
+def test_save_load_round_trip(tmp_path):
+    review_ids = _fake_review_ids(2000)
+    seen = SeenSet(review_ids + [0])
+    path = str(tmp_path / 'seen' / 'ids.seen')
+    seen.save(path, tag=12345)
+
+    loaded = SeenSet.load(path, bloom_bits=32000)
+    assert loaded.tag == 12345
+    assert len(loaded) == len(seen)
+    assert sorted(loaded) == sorted(seen)
+    assert all(review_id in loaded for review_id in review_ids)
+    assert 0 in loaded and 'ChZmissing' not in loaded
+    loaded.add('ChZnew')
+    assert 'ChZnew' in loaded and len(loaded) == len(seen) + 1
+
+
+def test_load_rejects_truncated_file(tmp_path):
+    path = str(tmp_path / 'ids.seen')
+    SeenSet(['a', 'b']).save(path)
+    with open(path, 'r+b') as f:
+        f.truncate(os.path.getsize(path) - 8)
+    try:
+        SeenSet.load(path)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("truncated seen-set file was loaded")
+
+
+def fill_checkpoint(checkpoint, review_ids, processed):
+    for i, review_id in enumerate(review_ids):
+        processed.add(review_id)
+        kept = i % 3 == 0
+        checkpoint.record(review_id, {'review_id': review_id, 'rating': 5} if kept else None,
+                          {'raw_text': review_id} if kept else None)
+        checkpoint.flush(processed)
+
+
+def test_checkpoint_resumes_from_seen_file(tmp_path):
+    review_ids = _fake_review_ids(30)
+    checkpoint = Checkpoint(str(tmp_path / 'place.jsonl'), seen_every=4)
+    checkpoint.reset()
+    processed = SeenSet()
+    fill_checkpoint(checkpoint, review_ids, processed)
+
+    # Saved after the 28th flush; the last two entries are only in the checkpoint
+    assert os.path.exists(checkpoint.seen_path)
+    assert SeenSet.load(checkpoint.seen_path).tag < os.path.getsize(checkpoint.path)
+    assert len(SeenSet.load(checkpoint.seen_path)) == 28
+
+    resumed, reviews, raws = Checkpoint(checkpoint.path).load()
+    assert len(resumed) == 30 and all(review_id in resumed for review_id in review_ids)
+    assert [review['review_id'] for review in reviews] == review_ids[::3]
+    assert raws == [(review_id, {'raw_text': review_id}) for review_id in review_ids[::3]]
+
+    checkpoint.remove()
+    assert not os.path.exists(checkpoint.seen_path) and not checkpoint.exists()
+
+
+def test_checkpoint_ignores_stale_seen_file(tmp_path):
+    review_ids = _fake_review_ids(10)
+    checkpoint = Checkpoint(str(tmp_path / 'place.jsonl'), seen_every=1)
+    checkpoint.reset()
+    fill_checkpoint(checkpoint, review_ids, SeenSet())
+
+    # A seen-set written for a longer checkpoint is not trusted
+    SeenSet(review_ids + ['ChZother']).save(checkpoint.seen_path, tag=os.path.getsize(checkpoint.path) + 1)
+    resumed, reviews, _ = Checkpoint(checkpoint.path).load()
+    assert len(resumed) == 10 and 'ChZother' not in resumed
+    assert len(reviews) == 4
+
+    checkpoint.reset()
+    assert not os.path.exists(checkpoint.seen_path)
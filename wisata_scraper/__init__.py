@@ -0,0 +1,39 @@
+"""Shared Google Maps review scraper for Batu tourist attractions.
+
+Run ``python -m wisata_scraper --help`` from the repository root. The
+Selenium-backed parts (``ReviewScraper``, ``run_place``, ``run_batch``) are
+imported lazily so the pure parsing helpers work without a browser stack.
+"""
+from .parsing import (
+    categorize_visit_time,
+    clean_review_text,
+    clean_reviewer_name,
+    parse_review_from_text,
+    parse_review_text,
+)
+from .payload import decode_review_payload
+from .places import PLACES, get_place, list_places
+from .records import Review, ReviewBuffer
+
+_ENGINE_EXPORTS = ('ReviewScraper', 'run_place', 'run_batch', 'MODE_MAIN', 'MODE_LOW_RATING')
+
+__all__ = [
+    'PLACES',
+    'get_place',
+    'list_places',
+    'parse_review_text',
+    'parse_review_from_text',
+    'clean_review_text',
+    'clean_reviewer_name',
+    'categorize_visit_time',
+    'decode_review_payload',
+    'Review',
+    'ReviewBuffer',
+] + list(_ENGINE_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _ENGINE_EXPORTS:
+        from . import engine
+        return getattr(engine, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,120 @@
+"""Command line entry point: python -m wisata_scraper [places ...]"""
+import argparse
+
+from .places import PLACES, list_places
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Scrape Google Maps reviews for Batu tourist attractions")
+    parser.add_argument('places', nargs='*', help="place keys to scrape (see --list)")
+    parser.add_argument('--all', action='store_true', help="scrape every registered place")
+    parser.add_argument('--low-rating', action='store_true',
+                        help="sort by 'Rating terendah' and keep only 1-3 star reviews")
+    parser.add_argument('--with-low-rating', action='store_true',
+                        help="after each main crawl, switch the same page to 'Rating terendah' and run "
+                             "the low-rating crawl, reusing the reviews already read")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="number of parallel headless browsers (default: 1, one visible browser)")
+    parser.add_argument('--memory-limit-mb', type=int, default=None,
+                        help="stop a crawl whose Firefox grows past this RSS and resume it on a fresh "
+                             "browser (default with --workers > 1: 1500, otherwise no cap)")
+    parser.add_argument('--capture', action='store_true',
+                        help="decode the review-list network responses instead of the rendered DOM")
+    parser.add_argument('--dump-payloads', metavar='DIR',
+                        help="with --capture, also save the raw responses to DIR for offline decoding")
+    parser.add_argument('--resume', action='store_true',
+                        help="continue from the checkpoint an interrupted run left behind")
+    parser.add_argument('--no-checkpoint', action='store_true',
+                        help="do not write checkpoints while scraping")
+    parser.add_argument('--incremental', action='store_true',
+                        help="sort by 'Terbaru' and save only reviews not yet in hasil scraping")
+    parser.add_argument('--known-stop-after', type=int, default=None, metavar='K',
+                        help="with --incremental, stop after K already-saved reviews in a row (default: 20)")
+    parser.add_argument('--format', choices=['jsonl', 'parquet', 'csv'], default='jsonl',
+                        help="jsonl/parquet stream reviews to one file as they are parsed; "
+                             "csv writes the old ALL + with_visit_time files at the end")
+    parser.add_argument('--prune-dom', action='store_true',
+                        help="empty review nodes once parsed to keep the review panel small")
+    parser.add_argument('--lean', action='store_true',
+                        help="headless Firefox with a reusable profile and fonts/media/tracking requests "
+                             "blocked; reports startup time and bytes transferred per scroll")
+    parser.add_argument('--metrics', metavar='PATH',
+                        help="append per-place timing/counter snapshots (JSON lines) to PATH")
+    parser.add_argument('--metrics-interval', type=float, default=None, metavar='SECONDS',
+                        help="seconds between periodic metrics snapshots (default: 60, 0 = only at the end)")
+    parser.add_argument('--no-raw', action='store_true',
+                        help="do not keep the raw review text in hasil scraping/raw")
+    parser.add_argument('--reparse', action='store_true',
+                        help="rebuild the parsed CSVs of the given places from their stored raw text, no browser")
+    parser.add_argument('--raw-folder', default=None, metavar='DIR',
+                        help="where raw review text is stored (default: hasil scraping/raw)")
+    parser.add_argument('--reparse-output', default=None, metavar='DIR',
+                        help="with --reparse, write the CSVs to DIR (by default they replace the saved files, "
+                             "which are kept as *.orig)")
+    parser.add_argument('--no-store', action='store_true',
+                        help="do not upsert reviews into the SQLite review store")
+    parser.add_argument('--store', default=None, metavar='PATH',
+                        help="review store database (default: hasil scraping/reviews.sqlite)")
+    parser.add_argument('--list', action='store_true', help="list registered places and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for key in list_places(low_rating=args.low_rating):
+            print(f"{key:35s} {PLACES[key]['name']}")
+        return 0
+
+    if not args.places and not args.all:
+        parser.error("give at least one place key or --all")
+    if args.low_rating and args.with_low_rating:
+        parser.error("--low-rating and --with-low-rating cannot be combined")
+
+    if args.reparse:
+        from .rawstore import RAW_FOLDER, reparse
+
+        written = reparse(None if args.all else args.places, raw_folder=args.raw_folder or RAW_FOLDER,
+                          output_folder=args.reparse_output)
+        print(f"Reparsed {len(written)} files")
+        return 0
+
+    from .engine import MODE_LOW_RATING, MODE_MAIN, run_batch
+
+    mode = MODE_LOW_RATING if args.low_rating else MODE_MAIN
+    place_keys = None if args.all else args.places
+    scraper_options = {
+        'capture_payloads': args.capture or bool(args.dump_payloads),
+        'payload_dump_folder': args.dump_payloads,
+        'resume': args.resume,
+        'incremental': args.incremental,
+        'output_format': args.format,
+        'prune_dom': args.prune_dom,
+        'lean': args.lean,
+        'metrics_path': args.metrics,
+        'low_rating_pass': args.with_low_rating,
+    }
+    if args.metrics_interval is not None:
+        scraper_options['metrics_interval'] = args.metrics_interval
+    if args.known_stop_after:
+        scraper_options['known_stop_after'] = args.known_stop_after
+    if args.no_checkpoint:
+        scraper_options['checkpoint_folder'] = None
+    if args.no_raw:
+        scraper_options['raw_folder'] = None
+    elif args.raw_folder:
+        scraper_options['raw_folder'] = args.raw_folder
+    if args.no_store:
+        scraper_options['store_path'] = None
+    elif args.store:
+        scraper_options['store_path'] = args.store
+
+    if args.workers > 1:
+        from .pool import DEFAULT_MEMORY_LIMIT_MB, run_pool
+
+        run_pool(place_keys, mode=mode, workers=args.workers,
+                 memory_limit_mb=args.memory_limit_mb or DEFAULT_MEMORY_LIMIT_MB, **scraper_options)
+    else:
+        run_batch(place_keys, mode=mode, memory_limit_mb=args.memory_limit_mb, **scraper_options)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
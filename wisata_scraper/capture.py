@@ -0,0 +1,91 @@
+"""Browser-side fetch/XHR hook that records the review-list responses"""
+import os
+
+from .driver import safe_execute_script
+from .payload import REVIEW_PAYLOAD_URL_MARKERS
+
+# Wraps XMLHttpRequest and fetch once per page; matching response bodies are
+# queued on window.__wisataCaptured until drain_captured_payloads takes them
+CAPTURE_HOOK_SCRIPT = """
+var markers = arguments[0];
+if (window.__wisataCaptureInstalled) {
+    return true;
+}
+window.__wisataCaptureInstalled = true;
+window.__wisataCaptured = [];
+
+function isReviewUrl(url) {
+    url = String(url || '').toLowerCase();
+    for (var i = 0; i < markers.length; i++) {
+        if (url.indexOf(markers[i]) !== -1) {
+            return true;
+        }
+    }
+    return false;
+}
+
+var originalOpen = XMLHttpRequest.prototype.open;
+XMLHttpRequest.prototype.open = function(method, url) {
+    this.__wisataUrl = url;
+    return originalOpen.apply(this, arguments);
+};
+var originalSend = XMLHttpRequest.prototype.send;
+XMLHttpRequest.prototype.send = function() {
+    var xhr = this;
+    if (isReviewUrl(xhr.__wisataUrl)) {
+        xhr.addEventListener('load', function() {
+            try {
+                window.__wisataCaptured.push({url: String(xhr.__wisataUrl), body: xhr.responseText});
+            } catch (e) {}
+        });
+    }
+    return originalSend.apply(this, arguments);
+};
+
+if (window.fetch) {
+    var originalFetch = window.fetch;
+    window.fetch = function(input) {
+        var url = (input && input.url) ? input.url : input;
+        var promise = originalFetch.apply(this, arguments);
+        if (isReviewUrl(url)) {
+            promise.then(function(response) {
+                response.clone().text().then(function(body) {
+                    window.__wisataCaptured.push({url: String(url), body: body});
+                });
+            }).catch(function() {});
+        }
+        return promise;
+    };
+}
+return true;
+"""
+
+DRAIN_SCRIPT = """
+var captured = window.__wisataCaptured || [];
+window.__wisataCaptured = [];
+return captured;
+"""
+
+
+def install_capture_hook(driver):
+    """Install the hook on the current page (navigation clears it)"""
+    return bool(safe_execute_script(driver, CAPTURE_HOOK_SCRIPT, REVIEW_PAYLOAD_URL_MARKERS))
+
+
+def drain_captured_payloads(driver):
+    """Take every response captured since the last call: [{'url', 'body'}, ...]"""
+    return safe_execute_script(driver, DRAIN_SCRIPT) or []
+
+
+def dump_payloads(payloads, folder, prefix, start_index=0):
+    """Save raw payload bodies so they can be decoded again offline"""
+    if not payloads:
+        return start_index
+    os.makedirs(folder, exist_ok=True)
+    index = start_index
+    for payload in payloads:
+        path = os.path.join(folder, f"{prefix}_{index:04d}.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(payload.get('body') or '')
+        index += 1
+    return index
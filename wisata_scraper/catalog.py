@@ -0,0 +1,329 @@
+"""Catalog of scrape outputs for the cleaning notebook.
+
+Source files are discovered from each place's ``output_prefix`` /
+``low_rating_prefix`` in ``places.PLACES`` and grouped by its ``dataset`` key,
+so a new scrape is picked up without editing a file list. A manifest records
+size, mtime and sha256 of every file; a dataset is only read and cleaned again
+when one of its files was added, changed or removed (or cleaning.py changed).
+The cleaned per-dataset frames are cached next to the manifest.
+"""
+import contextlib
+import glob
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import re
+from datetime import datetime
+
+import pandas as pd
+
+from .cleaning import SCRAPED_AT_COLUMN, clean_dataset
+from .fingerprint import FINGERPRINT_COLUMN, fingerprint_reviews
+from .output import LOW_RATING_OUTPUT_FOLDER, OUTPUT_FOLDER, read_reviews
+from .places import PLACES
+
+SOURCE_FOLDERS = [OUTPUT_FOLDER, LOW_RATING_OUTPUT_FOLDER]
+CATALOG_FOLDER = os.path.join("cleaning_data", "catalog")
+MANIFEST_NAME = "manifest.json"
+
+# Full crawls only: <prefix>_[ALL_|all_|NEW_]reviews[_all|_newest]_<ts>.<ext>.
+# The *_with_visit_time_*, *_without_visit_time_* and *_comprehensive_* files
+# are subsets of the same run and are left out.
+SOURCE_EXTENSIONS = ('csv', 'jsonl', 'parquet')
+MAIN_RUN_RE = re.compile(r'^(?:ALL_|all_|NEW_)?reviews(?:_all|_newest)?_(\d{8}_\d{6})\.(csv|jsonl|parquet)$')
+LOW_RATING_RUN_RE = re.compile(r'^reviews_1to3stars_with_text_(\d{8}_\d{6})\.(csv|jsonl|parquet)$')
+
+# Datasets scraped before the place registry existed: dataset key -> output prefix
+UNREGISTERED_PREFIXES = {
+    'gunung_arjuno': 'gunung_arjuno',
+}
+
+RUN_TIMESTAMP_RE = re.compile(r'_(\d{8}_\d{6})\.[a-z]+$')
+
+HASH_CHUNK_SIZE = 1 << 20
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cleaning_version():
+    """Hash of the loading and cleaning code, so cached results are dropped when it changes"""
+    from . import cleaning, fingerprint
+    digest = hashlib.sha256()
+    for module_file in (__file__, cleaning.__file__, fingerprint.__file__):
+        digest.update(file_sha256(module_file).encode('ascii'))
+    return digest.hexdigest()[:16]
+
+
+def _run_files(folder, prefix, run_re):
+    """Files of a prefix in a folder, oldest run first; a Parquet roll-up wins over its JSONL"""
+    if not prefix or not os.path.isdir(folder):
+        return []
+    runs = {}
+    for path in glob.glob(os.path.join(glob.escape(folder), glob.escape(prefix) + '_*')):
+        match = run_re.match(os.path.basename(path)[len(prefix) + 1:])
+        if not match:
+            continue
+        stem = os.path.splitext(path)[0]
+        extension = match.group(2)
+        if stem in runs and SOURCE_EXTENSIONS.index(runs[stem][1]) > SOURCE_EXTENSIONS.index(extension):
+            continue
+        runs[stem] = (match.group(1), extension, path)
+    return [path for _, _, path in sorted(runs.values(), key=lambda run: (run[0], run[2]))]
+
+
+def run_timestamp(path):
+    """Start of the run that wrote ``path`` (ISO string, from its name), or None"""
+    match = RUN_TIMESTAMP_RE.search(os.path.basename(path))
+    if not match:
+        return None
+    return datetime.strptime(match.group(1), '%Y%m%d_%H%M%S').isoformat()
+
+
+def fill_scraped_at(df, path):
+    """``scraped_at`` of each row; rows saved without one get the run's start time"""
+    started = run_timestamp(path)
+    if SCRAPED_AT_COLUMN not in df.columns:
+        return pd.Series(started, index=df.index, dtype=object)
+    scraped_at = df[SCRAPED_AT_COLUMN].astype(object)
+    return scraped_at.where(scraped_at.notna() & (scraped_at.astype(str) != ''), started)
+
+
+def discover_sources(folders=SOURCE_FOLDERS):
+    """``{dataset_key: [path, ...]}`` for every registered place with saved runs.
+
+    ``folders`` is ``[main folder, low-rating folder]``; the low-rating runs
+    come after the main ones, as in the old hand-written file list.
+    """
+    main_folder, low_rating_folder = folders
+    sources = {}
+    for place in PLACES.values():
+        paths = sources.setdefault(place['dataset'], [])
+        paths.extend(_run_files(main_folder, place['output_prefix'], MAIN_RUN_RE))
+    for dataset_key, prefix in UNREGISTERED_PREFIXES.items():
+        sources.setdefault(dataset_key, []).extend(_run_files(main_folder, prefix, MAIN_RUN_RE))
+    for place in PLACES.values():
+        sources[place['dataset']].extend(_run_files(low_rating_folder, place['low_rating_prefix'], LOW_RATING_RUN_RE))
+    return {key: paths for key, paths in sources.items() if paths}
+
+
+def load_dataset(dataset_key, paths):
+    """Read and merge the files of one dataset.
+
+    Every file gets a ``fingerprint`` column (kept if it was saved with one)
+    and a ``scraped_at`` column (the run's start time where the scraper did
+    not record one); reviews repeated across files are dropped by fingerprint.
+    Returns ``(df, summary)``; ``df`` is None when nothing could be read.
+    """
+    frames = []
+    files_info = []
+    for path in paths:
+        filename = os.path.basename(path)
+        folder = os.path.dirname(path)
+        try:
+            df = read_reviews(glob.escape(path))
+            df[FINGERPRINT_COLUMN] = fingerprint_reviews(df, dataset_key)
+            df[SCRAPED_AT_COLUMN] = fill_scraped_at(df, path)
+            frames.append(df)
+            files_info.append(f"{filename} ({len(df)} rows) - from '{folder}'")
+            print(f"✓ {filename} berhasil dimuat ({len(df)} rows) dari '{folder}'")
+        except Exception as e:
+            files_info.append(f"{filename} (ERROR: {str(e)}) - from '{folder}'")
+            print(f"❌ Error loading {filename}: {e}")
+
+    summary = {'files': files_info, 'files_loaded': len(frames)}
+    if not frames:
+        summary.update({'original_rows': 0, 'status': 'FAILED'})
+        return None, summary
+
+    if len(frames) == 1:
+        summary.update({'original_rows': len(frames[0]), 'status': 'SUCCESS'})
+        return frames[0], summary
+
+    combined_df = pd.concat(frames, ignore_index=True)
+    original_combined = len(combined_df)
+    combined_df = combined_df.drop_duplicates(subset=[FINGERPRINT_COLUMN], keep='first')
+
+    summary.update({
+        'original_rows': original_combined,
+        'after_dedup_rows': len(combined_df),
+        'duplicates_removed': original_combined - len(combined_df),
+        'status': 'SUCCESS (MERGED)',
+    })
+    print(f"  → Digabung menjadi {len(combined_df)} rows (duplikat dihapus: {original_combined - len(combined_df)})")
+    return combined_df, summary
+
+
+def clean_source(dataset_key, dataset_name, paths):
+    """Load and clean one dataset: ``(df_clean or None, summary)``"""
+    df, summary = load_dataset(dataset_key, paths)
+    if df is None:
+        return None, summary
+    return clean_dataset(df, dataset_name, summary), summary
+
+
+def _clean_source_captured(dataset_key, dataset_name, paths):
+    """clean_source in a worker; its prints are returned so the parent can replay them in order"""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        df_clean, summary = clean_source(dataset_key, dataset_name, paths)
+    return df_clean, summary, output.getvalue()
+
+
+def default_cleaning_workers():
+    """One worker per core; cleaning is CPU-bound regex work"""
+    return os.cpu_count() or 1
+
+
+def clean_sources(jobs, workers=None):
+    """Run clean_source for ``{key: (dataset_name, paths)}`` and return ``{key: (df_clean, summary)}``.
+
+    With more than one worker the datasets are cleaned in a process pool,
+    biggest first. Results (and the printed log) come back in the order of
+    ``jobs``, so the output is the same as a serial run.
+    """
+    if workers is None:
+        workers = default_cleaning_workers()
+    workers = min(workers, len(jobs))
+
+    if workers <= 1:
+        return {key: clean_source(key, dataset_name, paths) for key, (dataset_name, paths) in jobs.items()}
+
+    def job_size(key):
+        return sum(os.path.getsize(path) for path in jobs[key][1] if os.path.exists(path))
+
+    ctx = multiprocessing.get_context('spawn')
+    with ctx.Pool(workers) as pool:
+        pending = {key: pool.apply_async(_clean_source_captured, (key,) + jobs[key])
+                   for key in sorted(jobs, key=job_size, reverse=True)}
+        results = {}
+        for key in jobs:
+            df_clean, summary, log = pending[key].get()
+            print(log, end='')
+            results[key] = (df_clean, summary)
+    return results
+
+
+class SourceCatalog:
+    """Manifest of source files plus a cache of cleaned datasets"""
+
+    def __init__(self, folders=SOURCE_FOLDERS, catalog_folder=CATALOG_FOLDER):
+        self.folders = folders
+        self.catalog_folder = catalog_folder
+        self.manifest_path = os.path.join(catalog_folder, MANIFEST_NAME)
+        self.manifest = self._load_manifest()
+
+    def _load_manifest(self):
+        try:
+            with open(self.manifest_path, encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            manifest = {}
+        manifest.setdefault('files', {})
+        manifest.setdefault('datasets', {})
+        return manifest
+
+    def save(self):
+        os.makedirs(self.catalog_folder, exist_ok=True)
+        tmp_path = self.manifest_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.manifest_path)
+
+    def file_entry(self, path):
+        """Size, mtime and hash of a file; the hash is reused while size and mtime match"""
+        stat = os.stat(path)
+        entry = self.manifest['files'].get(path)
+        if entry and entry['size'] == stat.st_size and entry['mtime'] == stat.st_mtime:
+            return entry
+        entry = {'size': stat.st_size, 'mtime': stat.st_mtime, 'sha256': file_sha256(path)}
+        self.manifest['files'][path] = entry
+        return entry
+
+    def refresh(self):
+        """Discover sources and return ``{dataset_key: (paths, fingerprint)}``"""
+        sources = discover_sources(self.folders)
+        seen = set()
+        catalog = {}
+        for key, paths in sources.items():
+            fingerprint = [[path, self.file_entry(path)['sha256']] for path in paths]
+            seen.update(paths)
+            catalog[key] = (paths, fingerprint)
+        for path in list(self.manifest['files']):
+            if path not in seen:
+                del self.manifest['files'][path]
+        return catalog
+
+    def cache_path(self, dataset_key):
+        return os.path.join(self.catalog_folder, f"{dataset_key}.pkl")
+
+    def cached(self, dataset_key, dataset_name, fingerprint, version):
+        """Cached ``(df_clean, summary)`` if still valid, else None"""
+        entry = self.manifest['datasets'].get(dataset_key)
+        if not entry or entry != {'name': dataset_name, 'files': fingerprint, 'version': version}:
+            return None
+        try:
+            return pd.read_pickle(self.cache_path(dataset_key))
+        except Exception:
+            return None
+
+    def store(self, dataset_key, dataset_name, fingerprint, version, df_clean, summary):
+        os.makedirs(self.catalog_folder, exist_ok=True)
+        pd.to_pickle((df_clean, summary), self.cache_path(dataset_key))
+        self.manifest['datasets'][dataset_key] = {'name': dataset_name, 'files': fingerprint, 'version': version}
+
+    def clean_all(self, dataset_names, cleaning_summary=None, workers=None):
+        """Cleaned frames for every dataset in ``dataset_names`` ({key: wisata name}).
+
+        Unchanged datasets come from the cache, the rest are cleaned by
+        ``workers`` processes (see ``clean_sources``). ``cleaning_summary``
+        gets one entry per dataset, as the notebook's report expects.
+        """
+        if cleaning_summary is None:
+            cleaning_summary = {}
+        catalog = self.refresh()
+        version = cleaning_version()
+
+        results = {}
+        jobs = {}
+        for key, dataset_name in dataset_names.items():
+            if key not in catalog:
+                print(f"❌ Tidak ada file untuk dataset: {key}")
+                results[key] = (None, {'files': [], 'files_loaded': 0, 'original_rows': 0, 'status': 'FAILED'})
+                continue
+
+            paths, fingerprint = catalog[key]
+            result = self.cached(key, dataset_name, fingerprint, version)
+            if result is not None:
+                results[key] = result
+            else:
+                jobs[key] = (dataset_name, paths)
+
+        for key, result in clean_sources(jobs, workers).items():
+            if result[0] is not None:
+                self.store(key, dataset_names[key], catalog[key][1], version, *result)
+            results[key] = result
+
+        cleaned = {}
+        for key in dataset_names:
+            df_clean, summary = results[key]
+            cleaning_summary[key] = summary
+            if df_clean is not None:
+                cleaned[key] = df_clean
+
+        for key in list(self.manifest['datasets']):
+            if key not in dataset_names:
+                del self.manifest['datasets'][key]
+                if os.path.exists(self.cache_path(key)):
+                    os.remove(self.cache_path(key))
+        self.save()
+
+        print(f"\n✓ Dataset dari cache: {len(results) - len(jobs)}, dibersihkan ulang: {len(jobs)}")
+        return cleaned
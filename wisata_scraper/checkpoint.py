@@ -0,0 +1,137 @@
+"""Append-only checkpoints so a crashed scrape can resume where it stopped.
+
+Every processed review id is appended to a JSON-lines file, together with the
+parsed review and its raw fields when it was kept. ``--resume`` reloads the
+file, so known ids are skipped without parsing or expanding, and the collected
+reviews are restored into the new run's outputs and raw file.
+
+Every few flushes the processed ids are also saved as a ``SeenSet`` file
+(``<checkpoint>.seen``) tagged with the checkpoint size it covers. A resume
+loads it and only decodes the id-only lines written after that point.
+"""
+import json
+import os
+
+from .output import OUTPUT_FOLDER
+from .seenset import SeenSet
+
+CHECKPOINT_FOLDER = os.path.join(OUTPUT_FOLDER, "checkpoints")
+# Flushes (scrolls) between saves of the processed-id table
+DEFAULT_SEEN_EVERY = 10
+
+
+def checkpoint_path(place, mode, folder=CHECKPOINT_FOLDER):
+    """One checkpoint file per place and crawl mode"""
+    return os.path.join(folder, f"{place['output_prefix']}_{mode}.jsonl")
+
+
+class Checkpoint:
+    """Buffered append-only log of ``(review_id, review_data)`` entries"""
+
+    def __init__(self, path, seen_every=DEFAULT_SEEN_EVERY):
+        self.path = path
+        self.seen_path = path + '.seen'
+        self.seen_every = seen_every
+        self._pending = []
+        self._flushes = 0
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def load(self):
+        """Return ``(processed_ids, reviews, raws)`` stored so far.
+
+        ``processed_ids`` is a ``SeenSet``; ``raws`` holds a
+        ``(review_id, raw)`` pair per restored review (raw is None for
+        entries written without one). A line cut short by a crash mid-write
+        is ignored.
+        """
+        reviews = []
+        raws = []
+        if not self.exists():
+            return SeenSet(), reviews, raws
+
+        processed_ids, covered = self._load_seen()
+        position = 0
+        line = b'\n'
+        with open(self.path, 'rb') as f:
+            for line in f:
+                position += len(line)
+                # Ids up to the saved table's offset are in it; only kept reviews need decoding
+                if position <= covered and b'"review"' not in line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                processed_ids.add(entry['id'])
+                if entry.get('review'):
+                    reviews.append(entry['review'])
+                    raws.append((entry['id'], entry.get('raw')))
+
+        # Terminate a torn last line so new entries start on their own line
+        if not line.endswith(b'\n'):
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write('\n')
+        return processed_ids, reviews, raws
+
+    def _load_seen(self):
+        """The saved processed-id table and the checkpoint size it covers (empty and 0 if unusable)"""
+        try:
+            seen = SeenSet.load(self.seen_path)
+        except (OSError, ValueError):
+            return SeenSet(), 0
+        if seen.tag > os.path.getsize(self.path):
+            # Written for a longer checkpoint than this one
+            return SeenSet(), 0
+        return seen, seen.tag
+
+    def save_seen(self, processed_ids):
+        """Save ``processed_ids`` tagged with the current checkpoint size (call after ``flush``)"""
+        if self.exists():
+            processed_ids.save(self.seen_path, tag=os.path.getsize(self.path))
+
+    def reset(self):
+        """Start a fresh checkpoint, dropping any previous one"""
+        self._pending = []
+        self._flushes = 0
+        self._remove_seen()
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        open(self.path, 'w', encoding='utf-8').close()
+
+    def record(self, review_id, review_data=None, raw=None):
+        """Queue a processed id (and the review with its raw fields, if it was kept)"""
+        entry = {'id': review_id}
+        if review_data:
+            entry['review'] = review_data
+            if raw is not None:
+                entry['raw'] = raw
+        self._pending.append(json.dumps(entry, ensure_ascii=False))
+
+    def flush(self, processed_ids=None):
+        """Append queued entries to disk; every ``seen_every`` calls also save ``processed_ids``"""
+        if processed_ids is not None and self.seen_every:
+            self._flushes += 1
+        if not self._pending:
+            if self._flushes and self._flushes % self.seen_every == 0:
+                self.save_seen(processed_ids)
+            return
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write('\n'.join(self._pending) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        self._pending = []
+        if processed_ids is not None and self.seen_every and self._flushes % self.seen_every == 0:
+            self.save_seen(processed_ids)
+
+    def remove(self):
+        """Delete the checkpoint once the place finished cleanly"""
+        self._pending = []
+        self._remove_seen()
+        if self.exists():
+            os.remove(self.path)
+
+    def _remove_seen(self):
+        if os.path.exists(self.seen_path):
+            os.remove(self.seen_path)
@@ -0,0 +1,511 @@
+"""Vectorized cleaning of the scraped review datasets (used by cleaning_data.ipynb).
+
+The notebook used to clean row by row with ``.apply``: each review went through
+~175 literal ``str.replace`` calls, 15 emoji ``re.sub`` calls and ~35 more
+patterns. Here the same rules are merged into a handful of precompiled
+alternations and run column-wise with ``Series.str.replace``. Passes whose
+order can change the result (see ``remove_emojis``) are kept in the original
+order, so the output matches the old functions; ``check_parity`` compares the
+two on real data::
+
+    python -m wisata_scraper.cleaning "hasil scraping/*.csv" "hasil scraping rating rendah/*.csv"
+"""
+import glob
+import re
+import sys
+import time
+
+import pandas as pd
+
+# Emoji literals in the notebook's order. Compound ones (with U+FE0F) must
+# stay ahead of their bare form, as in the original list.
+SPECIFIC_EMOJIS = [
+    '🅰️', '🅰', '🅱️', '🅱', '🅾️', '🅾', '🆎', '🆑', '🆒', '🆓',
+    '🆔', '🆕', '🆖', '🆗', '🆘', '🆙', '🆚', '🔤', '🔡', '🔢',
+    '🔣', '📳', '📴', '📵', '📶', '📷', '📸', '📹', '📺', '📻',
+    '📼', '⭐', '⭐️', '✨', '✅', '❌', '❎', '⚠️', '⚠', '⛔',
+    '🚫', '💯', '💢', '💥', '💫', '💬', '💭', '💮', '💰', '💱',
+    '💲', '🎯', '🎰', '🎱', '🎲', '🎳', '🎴', '🎵', '🎶', '🎷',
+    '🎸', '🎹', '🏆', '🏅', '🏈', '🏉', '🏊', '🏋', '🏌', '🏍',
+    '🏎', '🏏', '👍', '👎', '👌', '👏', '👀', '👁', '👂', '👃',
+    '👄', '👅', '😀', '😁', '😂', '😃', '😄', '😅', '😆', '😇',
+    '😈', '😉', '😊', '😋', '😌', '😍', '😎', '😏', '😐', '😑',
+    '😒', '😓', '😔', '😕', '😖', '😗', '😘', '😙', '😚', '😛',
+    '😜', '😝', '😞', '😟', '😠', '😡', '😢', '😣', '😤', '😥',
+    '😦', '😧', '😨', '😩', '😪', '😫', '😬', '😭', '😮', '😯',
+    '😰', '😱', '😲', '😳', '😴', '😵', '😶', '😷', '😸', '😹',
+    '😺', '😻', '😼', '😽', '😾', '😿', '🙀', '🙁', '🙂', '🙃',
+    '🙄', '🙅', '🙆', '🙇', '🙈', '🙉', '🙊', '🙋', '🙌', '🙍',
+    '🙎', '🙏',
+]
+
+# Maps' icon-font photo counters that leak into innerText: <icon> N <icon>
+ICON_OPEN = '\ue8dc'
+ICON_CLOSE = '\ue80d'
+EMPTY_ICON_TOKEN = f'{ICON_OPEN} {ICON_CLOSE}'
+ICON_NUMBER_TOKENS = [f'{ICON_OPEN} {n} {ICON_CLOSE}' for n in ['1', '2', '3', '4', '5', '6', '7', '8', '9', '10', '13', '24', '32']]
+
+EMOJI_RANGES = [
+    ('\U0001F600', '\U0001F64F'),  # Emoticons
+    ('\U0001F300', '\U0001F5FF'),  # Symbols & Pictographs
+    ('\U0001F680', '\U0001F6FF'),  # Transport & Map Symbols
+    ('\U0001F1E0', '\U0001F1FF'),  # Flags
+    ('\U00002600', '\U000026FF'),  # Miscellaneous Symbols
+    ('\U00002700', '\U000027BF'),  # Dingbats
+    ('\U0001F100', '\U0001F1FF'),  # Enclosed Alphanumeric Supplement
+    ('\U0001F200', '\U0001F2FF'),  # Enclosed Ideographic Supplement
+    ('\U0001F900', '\U0001F9FF'),  # Supplemental Symbols and Pictographs
+    ('\U0001FA70', '\U0001FAFF'),  # Symbols and Pictographs Extended-A
+    ('\U00002190', '\U000021FF'),  # Arrows
+    ('\U00002B00', '\U00002BFF'),  # Miscellaneous Symbols and Arrows
+    ('\U0000FE00', '\U0000FE0F'),  # Variation Selectors
+    ('\U0001F1E6', '\U0001F1FF'),  # Regional Indicator Symbols
+    ('\U0001F3FB', '\U0001F3FF'),  # Skin tone modifiers
+]
+
+INVISIBLE_CHARS = ['\u200b', '\u200c', '\u200d', '\u2060', '\ufeff', '\u00ad']
+
+
+def _literal_pattern(literals):
+    """One regex matching any of the literals the way sequential str.replace would.
+
+    A literal that contains an earlier one can never match after the earlier
+    one was removed, so it is dropped; the rest go longest first, with single
+    characters folded into one character class.
+    """
+    live = []
+    for literal in literals:
+        if not any(earlier in literal for earlier in live):
+            live.append(literal)
+    multi = sorted((literal for literal in live if len(literal) > 1), key=len, reverse=True)
+    single = [literal for literal in live if len(literal) == 1]
+    alternatives = [re.escape(literal) for literal in multi]
+    if single:
+        alternatives.append(_char_class(single))
+    return re.compile('|'.join(alternatives))
+
+
+def _char_class(chars):
+    """Character class with consecutive code points merged into ranges (re scans astral members one by one)"""
+    points = sorted(set(ord(char) for char in chars))
+    ranges = []
+    for point in points:
+        if ranges and point == ranges[-1][1] + 1:
+            ranges[-1][1] = point
+        else:
+            ranges.append([point, point])
+    return '[' + ''.join(
+        re.escape(chr(start)) if start == end else f'{re.escape(chr(start))}-{re.escape(chr(end))}'
+        for start, end in ranges
+    ) + ']'
+
+
+# Literal passes in the notebook's order: removing an emoji can complete an
+# icon token (and not the other way round), so these cannot be one regex
+EMOJI_LITERAL_PASSES = [
+    _literal_pattern(SPECIFIC_EMOJIS[:1]),
+    _literal_pattern([EMPTY_ICON_TOKEN]),
+    _literal_pattern(SPECIFIC_EMOJIS[1:]),
+    _literal_pattern(ICON_NUMBER_TOKENS),
+]
+EMOJI_RANGE_RE = re.compile('[' + ''.join(f'{start}-{end}' for start, end in EMOJI_RANGES) + ''.join(INVISIBLE_CHARS) + ']')
+WHITESPACE_RE = re.compile(r'\s+')
+
+# "Waktu antrean" noise: the specific/general phrases first, then leftovers,
+# in two passes because the leftover patterns would otherwise cut a phrase
+# before the general pattern sees it
+WAKTU_ANTREAN_PHRASE_RE = re.compile('|'.join([
+    r'Waktu antrean\s+Maks\s+10\s+mnt\s+Sebaiknya buat reservasi\s+Tidak yakin',
+    r'Waktu antrean\s+30-60\s+mnt\s+Sebaiknya buat reservasi\s+Tidak yakin',
+    r'Waktu antrean\s+Tanpa mengantre\s+Sebaiknya buat reservasi',
+    r'Waktu antrean\s+Maks\s+10\s+mnt\s+Sebaiknya buat reservasi',
+    r'Waktu antrean\s+Maks\s+10\s+mnt',
+    r'Waktu antrean\s+Tanpa mengantre',
+    r'Waktu antrean\s+1\s+jam\+',
+    r'Waktu antrean\s+10-30\s+mnt',
+    r'Waktu antrean\s+30-60\s+mnt',
+    r'Waktu antrean\s+[^\.]*?(?=\.|$)',
+    r'Queue time\s+[^\.]*?(?=\.|$)',
+]), re.IGNORECASE)
+
+WAKTU_ANTREAN_LEFTOVER_RE = re.compile('|'.join([
+    r'\bWaktu antrean\b\s*',
+    r'\bTanpa mengantre\b\s*',
+    r'\bSebaiknya buat reservasi\b\s*',
+    r'\bTidak yakin\b\s*',
+    r'\bQueue time\b\s*',
+    r'\bNo queue\b\s*',
+    r'\bShould make reservation\b\s*',
+    r'\bNot sure\b\s*',
+    r'\bWait time\b\s*',
+    r'\bWaiting time\b\s*',
+    r'\b\d+\s+jam\+?\b\s*',
+    r'\b\d+-\d+\s+mnt\b\s*',
+    r'\bMaks\s+\d+\s+mnt\b\s*',
+    r'\bMax\s+\d+\s+min\b\s*',
+]), re.IGNORECASE)
+
+TRANSLATE_RE = re.compile('|'.join([
+    r'Diterjemahkan oleh Google\s*・?\s*',
+    r'Lihat versi asli\s*\([^)]*\)\s*',
+    r'Translated by Google\s*・?\s*',
+    r'See original\s*\([^)]*\)\s*',
+    r'Terjemahan Google\s*',
+    r'Auto-translated\s*',
+    r'・\s*',
+]), re.IGNORECASE)
+
+NAME_TRANSLATE_RE = re.compile(r'Diterjemahkan oleh Google\s*|Translated by Google\s*|・\s*', re.IGNORECASE)
+
+VISIT_TIME_PHRASE_RE = re.compile(r'\b(?:akhir pekan|hari biasa|hari libur nasional)\b', re.IGNORECASE)
+VISIT_TIME_CONTEXT_INDICATORS = [
+    'pada', 'saat', 'ketika', 'waktu', 'di', 'selama', 'berkunjung',
+    'datang', 'pergi', 'kunjungan', 'ramai', 'sepi', 'penuh', 'padat'
+]
+
+NEWLINES_RE = re.compile(r'\n+')
+TRAILING_PUNCT_RE = re.compile(r'[,\.\s]+$')
+LEADING_PUNCT_RE = re.compile(r'^[,\.\s]+')
+NO_WORD_RE = re.compile(r'^[^\w]*$')
+
+# Noise counters reported in the cleaning summary
+GOOGLE_TRANSLATE_COUNT_RE = re.compile('Diterjemahkan oleh Google|Translated by Google', re.IGNORECASE)
+WAKTU_ANTREAN_COUNT_RES = [re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'Waktu antrean',
+    r'Queue time',
+    r'Tanpa mengantre',
+    r'Sebaiknya buat reservasi',
+    r'Maks \d+ mnt',
+    r'\d+-\d+ mnt',
+    r'\d+ jam\+?',
+]]
+EMOJI_COUNT_RE = re.compile(r'[\U0001F600-\U0001F64F]|[\U0001F300-\U0001F5FF]|🅰️|🅱️|⭐|✨|✅|❌|👍|👎', re.IGNORECASE)
+
+VISIT_TIME_TRANSLATE_RE = re.compile(r'diterjemahkan oleh google\s*・?\s*')
+VISIT_TIME_MAP = {
+    'hari biasa': 'Hari biasa',
+    'weekday': 'Hari biasa',
+    'weekdays': 'Hari biasa',
+    'akhir pekan': 'Akhir pekan',
+    'weekend': 'Akhir pekan',
+    'akhir p': 'Akhir pekan',
+    'weekends': 'Akhir pekan',
+    'hari libur nasional': 'Hari libur nasional',
+    'libur nasional': 'Hari libur nasional',
+    'public holiday': 'Hari libur nasional',
+    'national holiday': 'Hari libur nasional',
+}
+UNKNOWN_VISIT_TIME = 'Tidak diketahui'
+
+# Relative review dates ("3 bulan lalu", "seminggu lalu", "kemarin") against
+# the scrape time. Months and years use their mean length, so a resolved
+# bound can be off by a day or two from calendar arithmetic.
+SCRAPED_AT_COLUMN = 'scraped_at'
+DATE_EARLIEST_COLUMN = 'date_earliest'
+DATE_LATEST_COLUMN = 'date_latest'
+RELATIVE_DATE_WORDS_RE = re.compile(r'\bse(jam|hari|minggu|bulan|tahun)\b')
+RELATIVE_DATE_RE = re.compile(r'(\d+)\s*(jam|hari|minggu|bulan|tahun)')
+RELATIVE_DATE_UNITS = {
+    'jam': pd.Timedelta(hours=1),
+    'hari': pd.Timedelta(days=1),
+    'minggu': pd.Timedelta(weeks=1),
+    'bulan': pd.Timedelta(days=365.2425 / 12),
+    'tahun': pd.Timedelta(days=365.2425),
+}
+
+
+def _as_text(series):
+    """Object-dtype strings with NaN and '' as '' (pyarrow-backed str would use RE2)"""
+    series = series.astype(object)
+    missing = series.isna()
+    series = series.where(~missing, '')
+    return series.map(lambda value: value if isinstance(value, str) else str(value)).astype(object)
+
+
+def _sub(series, pattern, repl=''):
+    return series.str.replace(pattern, repl, regex=True)
+
+
+def remove_emojis(series):
+    """Remove emojis, icon-font counters and invisible characters from a text column"""
+    series = _as_text(series)
+    for pattern in EMOJI_LITERAL_PASSES:
+        series = _sub(series, pattern)
+    series = _sub(series, EMOJI_RANGE_RE)
+    return _sub(series, WHITESPACE_RE, ' ').str.strip()
+
+
+def _remove_visit_time_without_context(text):
+    """Drop 'akhir pekan'/'hari biasa'/... left dangling at the end or after punctuation"""
+    matches = list(VISIT_TIME_PHRASE_RE.finditer(text))
+
+    for match in reversed(matches):
+        start_pos = match.start()
+        end_pos = match.end()
+        before_text = text[max(0, start_pos-30):start_pos].lower()
+
+        has_time_context = any(indicator in before_text for indicator in VISIT_TIME_CONTEXT_INDICATORS)
+
+        if not has_time_context:
+            is_at_end = end_pos >= len(text) - 2
+            after_punctuation = start_pos > 0 and text[start_pos-1] in '.,;:!?'
+
+            if is_at_end or after_punctuation:
+                text = text[:start_pos] + text[end_pos:]
+
+    return text
+
+
+def clean_review_text(series):
+    """Clean a review_text column: emojis, 'Waktu antrean', translate markers, formatting"""
+    series = remove_emojis(series)
+    series = _sub(series, WAKTU_ANTREAN_PHRASE_RE)
+    series = _sub(series, WAKTU_ANTREAN_LEFTOVER_RE)
+    series = _sub(series, TRANSLATE_RE)
+
+    # Position-dependent rule; only the few rows that mention a visit time need it
+    has_visit_time = series.str.contains(VISIT_TIME_PHRASE_RE, regex=True)
+    if has_visit_time.any():
+        series = series.copy()
+        series[has_visit_time] = series[has_visit_time].map(_remove_visit_time_without_context)
+
+    series = _sub(series, WHITESPACE_RE, ' ')
+    series = _sub(series, NEWLINES_RE, ' ')
+    series = _sub(series, TRAILING_PUNCT_RE, '.')
+    series = _sub(series, LEADING_PUNCT_RE)
+    series = series.str.strip()
+    return series.where(~series.str.match(NO_WORD_RE), '')
+
+
+def clean_reviewer_name(series):
+    """Clean a reviewer_name column"""
+    series = remove_emojis(_as_text(series).str.strip())
+    series = _sub(series, NAME_TRANSLATE_RE).str.strip()
+    invalid = (series.str.len() < 2) | series.str.match(NO_WORD_RE)
+    return series.where(~invalid, '')
+
+
+def standardize_visit_time(series):
+    """Map free-form visit times to the four categories"""
+    missing = series.isna() | (series.astype(object) == '')
+    normalized = remove_emojis(_as_text(series).str.strip().str.lower())
+    normalized = _sub(normalized, VISIT_TIME_TRANSLATE_RE).str.strip()
+    standardized = normalized.map(VISIT_TIME_MAP).fillna(UNKNOWN_VISIT_TIME).astype(object)
+    return standardized.where(~missing, UNKNOWN_VISIT_TIME)
+
+
+def resolve_relative_dates(dates, scraped_at):
+    """Earliest and latest plausible day of each relative date.
+
+    "N <unit> lalu" is read as at least N and less than N+1 units before
+    ``scraped_at``; "setahun"/"sebulan"/"seminggu" count as 1, "kemarin" as
+    1 hari and "hari ini" as 0 hari. Returns a DataFrame with
+    ``date_earliest`` and ``date_latest`` (NaT where either side is unknown).
+    """
+    text = dates.astype(str).astype(object).str.lower()
+    text = text.str.replace(RELATIVE_DATE_WORDS_RE, r'1 \1', regex=True)
+    text = text.str.replace('kemarin', '1 hari', regex=False).str.replace('hari ini', '0 hari', regex=False)
+    parts = text.str.extract(RELATIVE_DATE_RE)
+
+    count = pd.to_numeric(parts[0], errors='coerce')
+    unit = pd.to_timedelta(parts[1].map(RELATIVE_DATE_UNITS))
+    scraped_at = pd.to_datetime(scraped_at, errors='coerce')
+    return pd.DataFrame({
+        DATE_EARLIEST_COLUMN: (scraped_at - unit * (count + 1)).dt.floor('D'),
+        DATE_LATEST_COLUMN: (scraped_at - unit * count).dt.floor('D'),
+    }, index=dates.index)
+
+
+def date_window(df, start=None, end=None, strict=False):
+    """Mask of reviews dated within ``[start, end]``.
+
+    By default a review matches when its resolved range overlaps the window;
+    with ``strict`` the whole range has to lie inside it.
+    """
+    earliest, latest = df[DATE_EARLIEST_COLUMN], df[DATE_LATEST_COLUMN]
+    mask = earliest.notna() & latest.notna()
+    if start is not None:
+        mask &= (earliest if strict else latest) >= pd.Timestamp(start)
+    if end is not None:
+        mask &= (latest if strict else earliest) <= pd.Timestamp(end)
+    return mask
+
+
+def count_noise(series):
+    """Counts of translate markers, 'Waktu antrean' patterns and emojis before cleaning"""
+    text = series.astype(str).astype(object)
+    return {
+        'google_translate_cleaned': int(text.str.contains(GOOGLE_TRANSLATE_COUNT_RE, na=False).sum()),
+        'waktu_antrean_cleaned': int(sum(text.str.contains(pattern, na=False).sum() for pattern in WAKTU_ANTREAN_COUNT_RES)),
+        'emojis_cleaned': int(text.str.contains(EMOJI_COUNT_RE, na=False).sum()),
+    }
+
+
+def clean_dataset(df, dataset_name, summary=None):
+    """Clean one wisata's reviews; ``summary`` (the notebook's cleaning_summary[key]) is updated in place"""
+    if summary is None:
+        summary = {}
+
+    print(f"\n{'='*50}")
+    print(f"Cleaning dataset: {dataset_name}")
+    print(f"{'='*50}")
+
+    print(f"Jumlah data awal: {len(df)}")
+    print(f"Kolom: {list(df.columns)}")
+
+    summary['columns'] = list(df.columns)
+    summary['cleaning_start_rows'] = len(df)
+
+    # 1. Hapus duplikat
+    print("✓ Menghapus duplikat...")
+    duplicate_columns = [column for column in ['reviewer_name', 'review_text', 'rating'] if column in df.columns]
+
+    initial_rows = len(df)
+    if duplicate_columns:
+        df_clean = df.drop_duplicates(subset=duplicate_columns, keep='first')
+        df_clean = df_clean.drop_duplicates()
+    else:
+        df_clean = df.drop_duplicates()
+
+    duplicates_removed = initial_rows - len(df_clean)
+    if duplicates_removed > 0:
+        print(f"   Duplikat dihapus: {duplicates_removed}")
+    summary['duplicates_in_cleaning'] = duplicates_removed
+
+    # 2. Deteksi dan hapus outlier
+    print("✓ Mendeteksi outlier...")
+    outliers_removed = 0
+
+    if 'review_text' in df_clean.columns:
+        very_long_reviews = df_clean['review_text'].astype(str).str.len() > 5000
+        very_long_count = very_long_reviews.sum()
+        if very_long_count > 0:
+            df_clean = df_clean[~very_long_reviews]
+            outliers_removed += very_long_count
+            print(f"   Review sangat panjang (>5000 char) dihapus: {very_long_count}")
+
+    if 'rating' in df_clean.columns:
+        invalid_ratings = ~df_clean['rating'].between(1, 5)
+        invalid_count = invalid_ratings.sum()
+        if invalid_count > 0:
+            df_clean = df_clean[~invalid_ratings]
+            outliers_removed += invalid_count
+            print(f"   Rating invalid (bukan 1-5) dihapus: {invalid_count}")
+
+    summary['outliers_removed'] = outliers_removed
+    df_clean = df_clean.copy()
+
+    # 3. Clean review text (cleaners work on object columns; cast back to the
+    # string dtype .apply would have inferred)
+    print("✓ Membersihkan teks review dari semua noise...")
+    if 'review_text' in df_clean.columns:
+        noise = count_noise(df_clean['review_text'])
+        df_clean['review_text'] = clean_review_text(df_clean['review_text']).astype(str)
+
+        print(f"   Google Translate markers dibersihkan: {noise['google_translate_cleaned']}")
+        print(f"   Waktu antrean patterns dibersihkan: {noise['waktu_antrean_cleaned']}")
+        print(f"   Emoji dibersihkan: {noise['emojis_cleaned']}")
+        summary.update(noise)
+
+    # 4. Clean reviewer names
+    if 'reviewer_name' in df_clean.columns:
+        print("✓ Membersihkan nama reviewer...")
+        df_clean['reviewer_name'] = clean_reviewer_name(df_clean['reviewer_name']).astype(str)
+
+    # 5. Standarisasi visit_time ke 4 kategori saja
+    if 'visit_time' in df_clean.columns:
+        print("✓ Standardisasi visit_time...")
+        df_clean['visit_time'] = standardize_visit_time(df_clean['visit_time']).astype(str)
+
+        print(f"   Distribusi visit_time:")
+        for visit_type, count in df_clean['visit_time'].value_counts().items():
+            percentage = (count / len(df_clean)) * 100
+            print(f"     '{visit_type}': {count} ({percentage:.1f}%)")
+
+    # 6. Standarisasi rating
+    if 'rating' in df_clean.columns:
+        df_clean['rating'] = pd.to_numeric(df_clean['rating'], errors='coerce')
+        df_clean['rating'] = df_clean['rating'].fillna(3).astype(int)  # Default ke 3 jika missing
+        df_clean['rating'] = df_clean['rating'].clip(1, 5)
+        print(f"✓ Rating distandardisasi (1-5)")
+
+    # 7. Handle missing values
+    for column in ['reviewer_name', 'review_text']:
+        if column in df_clean.columns:
+            df_clean[column] = df_clean[column].fillna('')
+    if 'visit_time' in df_clean.columns:
+        df_clean['visit_time'] = df_clean['visit_time'].fillna(UNKNOWN_VISIT_TIME)
+
+    # 8. Tanggal relatif ("3 bulan lalu") -> rentang tanggal absolut
+    if 'date' in df_clean.columns and SCRAPED_AT_COLUMN in df_clean.columns:
+        print("✓ Resolusi tanggal relatif...")
+        df_clean[SCRAPED_AT_COLUMN] = pd.to_datetime(df_clean[SCRAPED_AT_COLUMN], errors='coerce', format='ISO8601')
+        resolved = resolve_relative_dates(df_clean['date'], df_clean[SCRAPED_AT_COLUMN])
+        df_clean[DATE_EARLIEST_COLUMN] = resolved[DATE_EARLIEST_COLUMN]
+        df_clean[DATE_LATEST_COLUMN] = resolved[DATE_LATEST_COLUMN]
+
+        dates_resolved = int(resolved.notna().all(axis=1).sum())
+        print(f"   Tanggal terselesaikan: {dates_resolved} dari {len(df_clean)}")
+        summary['dates_resolved'] = dates_resolved
+
+    # 9. Tambahkan kolom wisata
+    df_clean['wisata'] = dataset_name
+
+    summary['final_rows'] = len(df_clean)
+    summary['retention_rate'] = (len(df_clean) / summary['cleaning_start_rows']) * 100 if summary['cleaning_start_rows'] else 0.0
+
+    print(f"\nJumlah data setelah cleaning: {len(df_clean)}")
+    print(f"Retention rate: {summary['retention_rate']:.1f}%")
+
+    return df_clean
+
+
+def check_parity(df):
+    """Compare the vectorized cleaners with the notebook's row-wise ones.
+
+    Returns a dict of column -> list of ``(index, expected, got)`` mismatches.
+    """
+    from . import cleaning_reference as reference
+
+    checks = [
+        ('review_text', reference.clean_review_text, clean_review_text),
+        ('reviewer_name', reference.clean_reviewer_name, clean_reviewer_name),
+        ('visit_time', reference.clean_visit_time, standardize_visit_time),
+    ]
+    mismatches = {}
+    for column, row_wise, vectorized in checks:
+        if column not in df.columns:
+            continue
+        start = time.perf_counter()
+        expected = df[column].apply(row_wise)
+        row_wise_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        got = vectorized(df[column])
+        vectorized_seconds = time.perf_counter() - start
+
+        differs = expected.astype(object) != got.astype(object)
+        mismatches[column] = [(index, expected[index], got[index]) for index in df.index[differs.to_numpy()]]
+        print(f"{column}: {len(df)} rows, row-wise {row_wise_seconds:.2f}s, "
+              f"vectorized {vectorized_seconds:.2f}s, mismatches {len(mismatches[column])}")
+    return mismatches
+
+
+def main(argv=None):
+    """Run check_parity over the given CSV files"""
+    patterns = sys.argv[1:] if argv is None else argv
+    paths = sorted(path for pattern in patterns for path in glob.glob(pattern))
+    if not paths:
+        print("usage: python -m wisata_scraper.cleaning CSV_FILE [...]", file=sys.stderr)
+        return 1
+
+    df = pd.concat([pd.read_csv(path) for path in paths], ignore_index=True)
+    mismatches = check_parity(df)
+    for column, rows in mismatches.items():
+        for index, expected, got in rows[:5]:
+            print(f"  {column}[{index}]: expected {expected!r}, got {got!r}")
+    return 1 if any(mismatches.values()) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
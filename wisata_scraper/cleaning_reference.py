@@ -0,0 +1,229 @@
+"""Row-wise cleaning functions exactly as cleaning_data.ipynb had them.
+
+Kept only as the reference for ``cleaning.check_parity``; the notebook now
+uses the vectorized versions in ``wisata_scraper.cleaning``.
+"""
+import re
+
+import pandas as pd
+
+
+def remove_emojis(text):
+    """
+    Menghapus emoji dari teks dengan lebih komprehensif
+    """
+    if pd.isna(text) or text == '':
+        return ''
+    
+    text = str(text)
+    
+    # Daftar emoji dan karakter khusus yang akan dihapus
+    specific_emojis= [
+        '🅰️', ' ', '🅰', '🅱️', '🅱', '🅾️', '🅾', 
+        '🆎', '🆑', '🆒', '🆓', '🆔', '🆕', '🆖', '🆗', '🆘', '🆙', '🆚',
+        '🔤', '🔡', '🔢', '🔣',
+        '📳', '📴', '📵', '📶', '📷', '📸', '📹', '📺', '📻', '📼',
+        '⭐', '⭐️', '✨', '✅', '❌', '❎', '⚠️', '⚠', '⛔', '🚫',
+        '💯', '💢', '💥', '💫', '💬', '💭', '💮', '💰', '💱', '💲',
+        '🎯', '🎰', '🎱', '🎲', '🎳', '🎴', '🎵', '🎶', '🎷', '🎸', '🎹',
+        '🏆', '🏅', '🏈', '🏉', '🏊', '🏋', '🏌', '🏍', '🏎', '🏏',
+        '👍', '👎', '👌', '👏', '👀', '👁', '👂', '👃', '👄', '👅',
+        '😀', '😁', '😂', '😃', '😄', '😅', '😆', '😇', '😈', '😉',
+        '😊', '😋', '😌', '😍', '😎', '😏', '😐', '😑', '😒', '😓',
+        '😔', '😕', '😖', '😗', '😘', '😙', '😚', '😛', '😜', '😝',
+        '😞', '😟', '😠', '😡', '😢', '😣', '😤', '😥', '😦', '😧',
+        '😨', '😩', '😪', '😫', '😬', '😭', '😮', '😯', '😰', '😱',
+        '😲', '😳', '😴', '😵', '😶', '😷', '😸', '😹', '😺', '😻',
+        '😼', '😽', '😾', '😿', '🙀', '🙁', '🙂', '🙃', '🙄', '🙅',
+        '🙆', '🙇', '🙈', '🙉', '🙊', '🙋', '🙌', '🙍', '🙎', '🙏',
+        ' 1 ',' 2 ', ' 3 ', ' 4 ', ' 5 ', ' 6 ', ' 7 ', 
+        ' 8 ', ' 9 ', ' 10 ', ' 13 ',' 24 ', ' 32 '
+    ]
+    
+    # Hapus emoji spesifik
+    for emoji in specific_emojis:
+        text = text.replace(emoji, '')
+    
+    # Pattern Unicode untuk menghapus berbagai jenis emoji
+    emoji_patterns = [
+        r'[\U0001F600-\U0001F64F]',  # Emoticons
+        r'[\U0001F300-\U0001F5FF]',  # Symbols & Pictographs
+        r'[\U0001F680-\U0001F6FF]',  # Transport & Map Symbols
+        r'[\U0001F1E0-\U0001F1FF]',  # Flags
+        r'[\U00002600-\U000026FF]',  # Miscellaneous Symbols
+        r'[\U00002700-\U000027BF]',  # Dingbats
+        r'[\U0001F100-\U0001F1FF]',  # Enclosed Alphanumeric Supplement
+        r'[\U0001F200-\U0001F2FF]',  # Enclosed Ideographic Supplement
+        r'[\U0001F900-\U0001F9FF]',  # Supplemental Symbols and Pictographs
+        r'[\U0001FA70-\U0001FAFF]',  # Symbols and Pictographs Extended-A
+        r'[\U00002190-\U000021FF]',  # Arrows
+        r'[\U00002B00-\U00002BFF]',  # Miscellaneous Symbols and Arrows
+        r'[\U0000FE00-\U0000FE0F]',  # Variation Selectors
+        r'[\U0001F1E6-\U0001F1FF]',  # Regional Indicator Symbols
+        r'[\U0001F3FB-\U0001F3FF]',  # Skin tone modifiers
+    ]
+    
+    for pattern in emoji_patterns:
+        text = re.sub(pattern, '', text)
+    
+    # Hapus invisible characters
+    invisible_chars = ['\u200b', '\u200c', '\u200d', '\u2060', '\ufeff', '\u00ad']
+    for char in invisible_chars:
+        text = text.replace(char, '')
+    
+    # Clean up spaces
+    text = re.sub(r'\s+', ' ', text).strip()
+    return text
+
+
+def clean_review_text(text):
+    """
+    Membersihkan teks review dari semua noise termasuk semua variasi "Waktu antrean"
+    """
+    if pd.isna(text) or text == '':
+        return ''
+    
+    text = str(text)
+    
+    # LANGKAH 1: Hapus emoji terlebih dahulu
+    text = remove_emojis(text)
+    
+    # LANGKAH 2: Hapus SEMUA variasi "Waktu antrean" yang disebutkan
+    waktu_antrean_patterns = [
+        # Pola spesifik yang disebutkan - urutan dari yang paling spesifik
+        r'Waktu antrean\s+Maks\s+10\s+mnt\s+Sebaiknya buat reservasi\s+Tidak yakin',
+        r'Waktu antrean\s+30-60\s+mnt\s+Sebaiknya buat reservasi\s+Tidak yakin',
+        r'Waktu antrean\s+Tanpa mengantre\s+Sebaiknya buat reservasi',
+        r'Waktu antrean\s+Maks\s+10\s+mnt\s+Sebaiknya buat reservasi',
+        r'Waktu antrean\s+Maks\s+10\s+mnt',
+        r'Waktu antrean\s+Tanpa mengantre',
+        r'Waktu antrean\s+1\s+jam\+',
+        r'Waktu antrean\s+10-30\s+mnt',
+        r'Waktu antrean\s+30-60\s+mnt',
+        
+        # Pola umum "Waktu antrean" dengan berbagai kombinasi
+        r'Waktu antrean\s+[^\.]*?(?=\.|$)',
+        r'Queue time\s+[^\.]*?(?=\.|$)',
+        
+        # Pola individual yang mungkin tersisa
+        r'\bWaktu antrean\b\s*',
+        r'\bTanpa mengantre\b\s*',
+        r'\bSebaiknya buat reservasi\b\s*',
+        r'\bTidak yakin\b\s*',
+        r'\bQueue time\b\s*',
+        r'\bNo queue\b\s*',
+        r'\bShould make reservation\b\s*',
+        r'\bNot sure\b\s*',
+        r'\bWait time\b\s*',
+        r'\bWaiting time\b\s*',
+        
+        # Pola waktu antrean dengan angka
+        r'\b\d+\s+jam\+?\b\s*',
+        r'\b\d+-\d+\s+mnt\b\s*',
+        r'\bMaks\s+\d+\s+mnt\b\s*',
+        r'\bMax\s+\d+\s+min\b\s*',
+    ]
+    
+    # Apply semua pattern waktu antrean
+    for pattern in waktu_antrean_patterns:
+        text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+    
+    # LANGKAH 3: Hapus Google Translate markers
+    translate_patterns = [
+        r'Diterjemahkan oleh Google\s*・?\s*',
+        r'Lihat versi asli\s*\([^)]*\)\s*',
+        r'Translated by Google\s*・?\s*',
+        r'See original\s*\([^)]*\)\s*',
+        r'Terjemahan Google\s*',
+        r'Auto-translated\s*',
+        r'・\s*',
+    ]
+    
+    for pattern in translate_patterns:
+        text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+    
+    # LANGKAH 4: Hapus visit time tanpa konteks yang tepat
+    def clean_visit_time_without_context(text):
+        time_indicators = [
+            'pada', 'saat', 'ketika', 'waktu', 'di', 'selama', 'berkunjung',
+            'datang', 'pergi', 'kunjungan', 'ramai', 'sepi', 'penuh', 'padat'
+        ]
+        
+        visit_time_pattern = r'\b(akhir pekan|hari biasa|hari libur nasional)\b'
+        matches = list(re.finditer(visit_time_pattern, text, flags=re.IGNORECASE))
+        
+        for match in reversed(matches):
+            start_pos = match.start()
+            end_pos = match.end()
+            before_text = text[max(0, start_pos-30):start_pos].lower()
+            
+            has_time_context = any(indicator in before_text for indicator in time_indicators)
+            
+            if not has_time_context:
+                is_at_end = end_pos >= len(text) - 2
+                after_punctuation = start_pos > 0 and text[start_pos-1] in '.,;:!?'
+                
+                if is_at_end or after_punctuation:
+                    text = text[:start_pos] + text[end_pos:]
+        
+        return text
+    
+    text = clean_visit_time_without_context(text)
+    
+    # LANGKAH 5: Clean up formatting
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'\n+', ' ', text)
+    text = re.sub(r'[,\.\s]+$', '.', text)
+    text = re.sub(r'^[,\.\s]+', '', text)
+    text = text.strip()
+    
+    if re.match(r'^[^\w]*$', text):
+        return ''
+    
+    return text
+
+
+def clean_reviewer_name(name):
+    """
+    Membersihkan nama reviewer
+    """
+    if pd.isna(name) or name == '':
+        return ''
+    
+    name = str(name).strip()
+    name = remove_emojis(name)
+    
+    patterns = [
+        r'Diterjemahkan oleh Google\s*',
+        r'Translated by Google\s*',
+        r'・\s*',
+    ]
+    
+    for pattern in patterns:
+        name = re.sub(pattern, '', name, flags=re.IGNORECASE)
+    
+    name = name.strip()
+    
+    if len(name) < 2 or re.match(r'^[^\w]*$', name):
+        return ''
+    
+    return name
+
+
+def clean_visit_time(visit_time):
+    if pd.isna(visit_time) or visit_time == '':
+        return 'Tidak diketahui'
+
+    visit_time_str = str(visit_time).strip().lower()
+    visit_time_str = remove_emojis(visit_time_str)
+    visit_time_str = re.sub(r'diterjemahkan oleh google\s*・?\s*', '', visit_time_str)
+    visit_time_str = visit_time_str.strip()
+
+    if visit_time_str in ['hari biasa', 'weekday', 'weekdays']:
+        return 'Hari biasa'
+    elif visit_time_str in ['akhir pekan', 'weekend', 'akhir p', 'weekends']:
+        return 'Akhir pekan'
+    elif visit_time_str in ['hari libur nasional', 'libur nasional', 'public holiday', 'national holiday']:
+        return 'Hari libur nasional'
+    else:
+        return 'Tidak diketahui'
@@ -0,0 +1,349 @@
+"""Firefox driver setup and defensive WebDriver helpers shared by all scrapers"""
+import json
+import os
+from urllib.parse import quote
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from selenium.webdriver.firefox.service import Service as FirefoxService
+from urllib3.exceptions import HTTPError
+from webdriver_manager.firefox import GeckoDriverManager
+
+CACHE_FOLDER = os.path.join(os.path.expanduser("~"), ".cache", "wisata_scraper")
+GECKODRIVER_CACHE_FILE = os.path.join(CACHE_FOLDER, "geckodriver_path")
+LEAN_PROFILE_FOLDER = os.path.join(CACHE_FOLDER, "firefox-profiles")
+
+# GeckoDriverManager().install() hits the network and disk, so resolve it once
+# per process and reuse the path for every driver in a batch
+_geckodriver_path = None
+
+# Lean mode: requests to these hosts go to a dead proxy (PAC shExpMatch patterns).
+# Fonts, analytics/telemetry beacons and photo/Street View tiles are never
+# needed to read the review panel.
+LEAN_BLOCKED_HOSTS = [
+    "fonts.gstatic.com",
+    "fonts.googleapis.com",
+    "*.google-analytics.com",
+    "www.googletagmanager.com",
+    "*.doubleclick.net",
+    "play.google.com",
+    "*.googlevideo.com",
+    "*.ggpht.com",
+    "streetviewpixels-pa.googleapis.com",
+]
+
+LEAN_PAC_SCRIPT = """function FindProxyForURL(url, host) {
+    var blocked = %s;
+    for (var i = 0; i < blocked.length; i++) {
+        if (shExpMatch(host, blocked[i])) {
+            return "PROXY 127.0.0.1:9";
+        }
+    }
+    return "DIRECT";
+}"""
+
+LEAN_PREFERENCES = {
+    # No web fonts or media
+    "gfx.downloadable_fonts.enabled": False,
+    "browser.display.use_document_fonts": 0,
+    "media.mediasource.enabled": False,
+    "media.autoplay.blocking_policy": 2,
+    # No speculative or background traffic
+    "network.prefetch-next": False,
+    "network.dns.disablePrefetch": True,
+    "network.http.speculative-parallel-limit": 0,
+    "browser.safebrowsing.malware.enabled": False,
+    "browser.safebrowsing.phishing.enabled": False,
+    "datareporting.healthreport.uploadEnabled": False,
+    "datareporting.policy.dataSubmissionEnabled": False,
+    "toolkit.telemetry.enabled": False,
+    "app.update.auto": False,
+    "browser.shell.checkDefaultBrowser": False,
+    "browser.startup.homepage_override.mstone": "ignore",
+    # URL blocking
+    "network.proxy.type": 2,
+    "network.proxy.autoconfig_url": "data:text/javascript," + quote(LEAN_PAC_SCRIPT % json.dumps(LEAN_BLOCKED_HOSTS)),
+}
+
+
+def _read_cached_geckodriver_path():
+    try:
+        with open(GECKODRIVER_CACHE_FILE, encoding="utf-8") as f:
+            path = f.read().strip()
+    except OSError:
+        return None
+    return path if path and os.path.exists(path) else None
+
+
+def get_geckodriver_path():
+    """Resolve the geckodriver binary once per process.
+
+    ``GECKODRIVER_PATH`` wins; otherwise the path an earlier run resolved is
+    reused, so only the first run on a machine goes through webdriver-manager.
+    """
+    global _geckodriver_path
+    if _geckodriver_path is None:
+        path = os.environ.get("GECKODRIVER_PATH") or _read_cached_geckodriver_path()
+        if not path:
+            path = GeckoDriverManager().install()
+            try:
+                os.makedirs(CACHE_FOLDER, exist_ok=True)
+                with open(GECKODRIVER_CACHE_FILE, "w", encoding="utf-8") as f:
+                    f.write(path)
+            except OSError:
+                pass
+        _geckodriver_path = path
+    return _geckodriver_path
+
+
+def build_firefox_options():
+    """Firefox preferences tuned to keep the Maps review panel light"""
+    options = FirefoxOptions()
+
+    # Performance settings
+    options.set_preference("dom.ipc.processCount", 1)
+    options.set_preference("browser.tabs.remote.autostart", False)
+    options.set_preference("browser.tabs.remote.autostart.2", False)
+
+    # Disable images
+    options.set_preference("permissions.default.image", 2)
+
+    # Memory optimization
+    options.set_preference("browser.sessionhistory.max_entries", 3)
+    options.set_preference("browser.sessionstore.interval", 1800000)
+    options.set_preference("browser.cache.memory.enable", False)
+    options.set_preference("browser.cache.offline.enable", False)
+    options.set_preference("browser.cache.disk.enable", False)
+
+    # Disable animations
+    options.set_preference("toolkit.cosmeticAnimations.enabled", False)
+    options.set_preference("ui.prefersReducedMotion", 1)
+
+    # JavaScript memory optimization
+    options.set_preference("javascript.options.mem.max", 512000)  # 512MB max
+    options.set_preference("javascript.options.mem.gc_incremental_slice_ms", 10)
+
+    # Network optimization
+    options.set_preference("network.http.pipelining", True)
+    options.set_preference("network.http.max-connections", 48)
+
+    # Language
+    options.set_preference("intl.accept_languages", "id-ID, id")
+
+    # Disable unnecessary features
+    options.set_preference("dom.webnotifications.enabled", False)
+    options.set_preference("media.autoplay.default", 5)
+    options.set_preference("geo.enabled", False)
+
+    # Additional memory saving
+    options.set_preference("browser.tabs.unloadOnLowMemory", True)
+    options.set_preference("browser.tabs.min_inactive_duration_before_unload", 300000)
+
+    return options
+
+
+def _user_pref_line(name, value):
+    return f"user_pref({json.dumps(name)}, {json.dumps(value)});"
+
+
+def prepare_lean_profile(options, slot=0):
+    """Persistent profile directory for lean mode, one per ``slot``.
+
+    The preferences are written to its user.js, which is only rewritten when
+    they change, so geckodriver does not build and copy a fresh temporary
+    profile on every launch. Parallel browsers need different slots (Firefox
+    locks a profile while it runs).
+    """
+    path = os.path.join(LEAN_PROFILE_FOLDER, f"slot-{slot}")
+    os.makedirs(path, exist_ok=True)
+
+    user_js = "\n".join(_user_pref_line(name, value) for name, value in sorted(options.preferences.items())) + "\n"
+    user_js_path = os.path.join(path, "user.js")
+    try:
+        with open(user_js_path, encoding="utf-8") as f:
+            current = f.read()
+    except OSError:
+        current = None
+    if current != user_js:
+        with open(user_js_path, "w", encoding="utf-8") as f:
+            f.write(user_js)
+    return path
+
+
+def setup_driver(headless=False, lean=False, profile_slot=0):
+    """Setup Firefox driver dengan optimasi maksimal untuk mengurangi lag.
+
+    ``lean`` runs headless with fonts, media and tracking requests blocked
+    and a reusable profile directory (see ``prepare_lean_profile``).
+    """
+    options = build_firefox_options()
+    if lean:
+        headless = True
+        for name, value in LEAN_PREFERENCES.items():
+            options.set_preference(name, value)
+        options.add_argument("-profile")
+        options.add_argument(prepare_lean_profile(options, profile_slot))
+    if headless:
+        options.add_argument("-headless")
+
+    service = FirefoxService(get_geckodriver_path())
+    driver = webdriver.Firefox(service=service, options=options)
+    driver.set_page_load_timeout(30)
+    driver.implicitly_wait(5)
+    if headless:
+        # No window manager to maximize against; use a desktop-sized viewport
+        driver.set_window_size(1920, 1080)
+    else:
+        driver.maximize_window()
+
+    return driver
+
+
+def is_driver_alive(driver):
+    """Check if driver is still responsive"""
+    try:
+        driver.current_url
+        return True
+    except:
+        return False
+
+
+def _child_pids(pid):
+    """Direct children of a process (Linux /proc only)"""
+    children = []
+    task_dir = f"/proc/{pid}/task"
+    try:
+        for task in os.listdir(task_dir):
+            with open(os.path.join(task_dir, task, "children")) as f:
+                children.extend(int(child) for child in f.read().split())
+    except OSError:
+        pass
+    return children
+
+
+def _process_rss_kb(pid):
+    """Resident memory of one process in kB, 0 if unavailable"""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except (OSError, ValueError):
+        pass
+    return 0
+
+
+def get_driver_memory_mb(driver):
+    """Total RSS of geckodriver and its Firefox processes in MB.
+
+    Returns None when the process tree cannot be inspected (non-Linux, or a
+    remote driver).
+    """
+    try:
+        root_pid = driver.service.process.pid
+    except AttributeError:
+        return None
+    if not os.path.exists(f"/proc/{root_pid}"):
+        return None
+
+    total_kb = 0
+    pending = [root_pid]
+    while pending:
+        pid = pending.pop()
+        total_kb += _process_rss_kb(pid)
+        pending.extend(_child_pids(pid))
+    return total_kb / 1024
+
+
+# Bytes moved since the previous call, from the Resource Timing API. The
+# navigation entry is counted once per page; resource entries are cleared
+# after reading so the browser buffer never fills up. Cross-origin responses
+# without Timing-Allow-Origin report 0, so this is a lower bound.
+TRANSFER_SIZE_SCRIPT = """
+var total = 0;
+var count = 0;
+if (!window.__wisataNavigationCounted) {
+    window.__wisataNavigationCounted = true;
+    performance.getEntriesByType('navigation').forEach(function(entry) {
+        total += entry.transferSize || 0;
+    });
+    if (performance.setResourceTimingBufferSize) {
+        performance.setResourceTimingBufferSize(10000);
+    }
+}
+performance.getEntriesByType('resource').forEach(function(entry) {
+    total += entry.transferSize || 0;
+    count += 1;
+});
+performance.clearResourceTimings();
+return [total, count];
+"""
+
+
+class PageWeightMeter:
+    """Transferred bytes of a page, split into the initial load and each scroll"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.page_load_bytes = None
+        self.scroll_bytes = []
+        self.requests = 0
+
+    def _take(self):
+        result = safe_execute_script(self.driver, TRANSFER_SIZE_SCRIPT) or [0, 0]
+        self.requests += int(result[1])
+        return int(result[0])
+
+    def sample_page_load(self):
+        self.page_load_bytes = self._take()
+
+    def sample_scroll(self):
+        self.scroll_bytes.append(self._take())
+
+    def report(self):
+        total_scroll = sum(self.scroll_bytes)
+        lines = [f"Page load: {(self.page_load_bytes or 0) / 1024:.0f} KB"]
+        if self.scroll_bytes:
+            lines.append(f"Scrolls: {len(self.scroll_bytes)}, {total_scroll / 1024:.0f} KB total, "
+                         f"{total_scroll / len(self.scroll_bytes) / 1024:.1f} KB per scroll")
+        lines.append(f"Requests: {self.requests}")
+        return "\n".join(lines)
+
+
+def safe_execute_script(driver, script, *args):
+    """Safely execute JavaScript; None if the script fails or the driver is gone.
+
+    No liveness probe first: it would double the round trips of every call.
+    A dead geckodriver fails the call itself with a urllib3 connection error.
+    """
+    try:
+        return driver.execute_script(script, *args)
+    except (WebDriverException, HTTPError, OSError):
+        return None
+
+
+def safe_get_attribute(element, attribute, default=None):
+    """Safely get element attribute"""
+    try:
+        return element.get_attribute(attribute)
+    except:
+        return default
+
+
+def safe_get_text(element, default=""):
+    """Safely get element text"""
+    try:
+        return element.text
+    except:
+        return default
+
+
+def safe_click(driver, element):
+    """Safely click an element"""
+    try:
+        # scrollIntoView is synchronous, so no settle sleep is needed before the click
+        safe_execute_script(driver, "arguments[0].scrollIntoView({block: 'center'}); arguments[0].click();", element)
+        return True
+    except:
+        return False
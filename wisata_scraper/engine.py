@@ -0,0 +1,681 @@
+"""ReviewScraper: one browser session that scrapes any place in the registry"""
+import gc
+import time
+from datetime import datetime
+import traceback
+
+from . import metrics
+from .checkpoint import CHECKPOINT_FOLDER, Checkpoint, checkpoint_path
+from .capture import drain_captured_payloads, dump_payloads, install_capture_hook
+from .driver import (
+    PageWeightMeter,
+    get_driver_memory_mb,
+    is_driver_alive,
+    safe_get_attribute,
+    safe_get_text,
+    setup_driver,
+)
+from .extract import (
+    expand_new_reviews,
+    extract_new_reviews_bulk,
+    find_review_elements,
+    mark_review_ids_seen,
+    prune_review_nodes,
+    read_bulk_review_record,
+    read_review_element,
+    set_known_review_ids,
+)
+from .fingerprint import review_fingerprint, stable_hash64
+from .known import DEFAULT_KNOWN_STOP_AFTER, load_known_reviews
+from .metrics import DEFAULT_METRICS_INTERVAL, Metrics, instrument_driver
+from .navigation import (
+    SORT_LOWEST_RATING,
+    SORT_NEWEST,
+    aggressive_scroll_and_wait,
+    click_sort_button,
+    find_scrollable_container,
+    open_reviews_tab,
+    scroll_to_load_more,
+)
+from .output import (
+    FORMAT_CSV,
+    FORMAT_JSONL,
+    LOW_RATING_OUTPUT_FOLDER,
+    OUTPUT_FOLDER,
+    open_low_rating_sink,
+    open_review_sink,
+    save_low_rating_reviews,
+    save_reviews,
+)
+from .parsing import STOP_SCRAPING, filter_low_rating, parse_review_text
+from .payload import decode_review_payload_entries
+from .places import get_place, list_places
+from .records import ReviewBuffer
+from .rawstore import (
+    LOW_RATING_LABEL,
+    RAW_FOLDER,
+    load_raw_fields,
+    open_raw_sink,
+    payload_raw_fields,
+    raw_fields,
+)
+from .seenset import SeenSet
+from .store import STORE_PATH, open_store_sink
+from .waits import DEFAULT_WAIT_PROFILE, EXPAND_WAIT_PROFILE, get_panel_state, wait_for_reviews_tab
+
+MODE_MAIN = 'main'
+MODE_LOW_RATING = 'low_rating'
+
+# Scrolls between checks of the Firefox memory cap (a /proc walk, no WebDriver call)
+DEFAULT_MEMORY_CHECK_SCROLLS = 20
+
+
+class ReviewScraper:
+    """Scrape Google Maps reviews for registered places with one shared driver.
+
+    The driver is started lazily and reused across ``scrape_place`` calls, so a
+    batch pays Firefox startup and geckodriver resolution only once.
+    Every place gets a ``Metrics`` snapshot (JSON) every ``metrics_interval``
+    seconds and at the end, appended to ``metrics_path`` if given.
+    With ``low_rating_pass``, every main crawl is followed by the place's
+    low-rating crawl on the same page (see ``scrape_place``).
+    With ``memory_limit_mb``, a crawl whose Firefox grows past the cap stops
+    cleanly with its checkpoint kept and sets ``memory_exceeded``, so the
+    caller can restart the driver and resume it.
+    """
+
+    def __init__(self, driver=None, output_folder=OUTPUT_FOLDER,
+                 low_rating_output_folder=LOW_RATING_OUTPUT_FOLDER,
+                 bulk_extract=True, batch_expand=True, max_consecutive_no_new=10, headless=False,
+                 wait_profile=DEFAULT_WAIT_PROFILE, expand_wait_profile=EXPAND_WAIT_PROFILE,
+                 capture_payloads=False, payload_dump_folder=None,
+                 checkpoint_folder=CHECKPOINT_FOLDER, resume=False,
+                 incremental=False, known_stop_after=DEFAULT_KNOWN_STOP_AFTER,
+                 output_format=FORMAT_JSONL, prune_dom=False, lean=False, profile_slot=0,
+                 metrics_path=None, metrics_interval=DEFAULT_METRICS_INTERVAL, raw_folder=RAW_FOLDER,
+                 low_rating_pass=False, store_path=STORE_PATH,
+                 memory_limit_mb=None, memory_check_scrolls=DEFAULT_MEMORY_CHECK_SCROLLS):
+        self.driver = driver
+        self._owns_driver = driver is None
+        self.output_folder = output_folder
+        self.low_rating_output_folder = low_rating_output_folder
+        self.bulk_extract = bulk_extract
+        self.batch_expand = batch_expand
+        self.max_consecutive_no_new = max_consecutive_no_new
+        self.headless = headless
+        self.wait_profile = wait_profile
+        self.expand_wait_profile = expand_wait_profile
+        self.capture_payloads = capture_payloads
+        self.payload_dump_folder = payload_dump_folder
+        self._payload_dump_prefix = None
+        self._payload_dump_index = 0
+        self.checkpoint_folder = checkpoint_folder
+        self.resume = resume
+        self.last_crawl_complete = False
+        self.incremental = incremental
+        self.known_stop_after = known_stop_after
+        self.output_format = output_format
+        self.prune_dom = prune_dom
+        self.lean = lean
+        self.profile_slot = profile_slot
+        self.startup_seconds = None
+        self.page_weight = None
+        self.metrics_path = metrics_path
+        self.metrics_interval = metrics_interval
+        self.metrics = None
+        self.raw_folder = raw_folder
+        self.low_rating_pass = low_rating_pass
+        self.store_path = store_path
+        self.last_low_rating_reviews = None
+        self.memory_limit_mb = memory_limit_mb
+        self.memory_check_scrolls = memory_check_scrolls
+        self.memory_exceeded = False
+        # Place whose reviews panel the driver is showing
+        self._open_place_key = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+        return False
+
+    def start(self):
+        """Start the Firefox driver if none is running"""
+        if self.driver is None or not is_driver_alive(self.driver):
+            print("Setting up Firefox driver...")
+            started = time.perf_counter()
+            self.driver = setup_driver(headless=self.headless, lean=self.lean, profile_slot=self.profile_slot)
+            self.startup_seconds = time.perf_counter() - started
+            print(f"Driver ready in {self.startup_seconds:.1f}s")
+            self._owns_driver = True
+            self._open_place_key = None
+        return self.driver
+
+    def restart(self):
+        """Replace the current driver with a fresh one"""
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except:
+                pass
+        self.driver = None
+        return self.start()
+
+    def close(self):
+        """Quit the driver if this scraper started it"""
+        if self.driver is not None and self._owns_driver:
+            print("\nClosing browser...")
+            try:
+                self.driver.quit()
+            except:
+                pass
+        self.driver = None
+
+    @metrics.timed('open_place')
+    def open_place(self, place, sort_label):
+        """Open the place page, the reviews tab and apply the sort order"""
+        print(f"Opening {place['name']} page...")
+        self._open_place_key = None
+        self.driver.get(place['url'])
+        if not wait_for_reviews_tab(self.driver):
+            print("Reviews tab did not appear in time, trying anyway...")
+
+        if self.capture_payloads:
+            # Before the reviews tab opens, so the first review page is captured too
+            if install_capture_hook(self.driver):
+                print("Review payload capture enabled")
+            else:
+                print("Could not install payload capture hook, using DOM extraction")
+            self._payload_dump_prefix = f"{place['output_prefix']}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            self._payload_dump_index = 0
+
+        if not open_reviews_tab(self.driver, self.wait_profile):
+            return None
+
+        click_sort_button(self.driver, sort_label)
+
+        print("Finding scrollable panel...")
+        scrollable_div = find_scrollable_container(self.driver, self.wait_profile)
+        if not scrollable_div:
+            print("ERROR: Could not find scrollable container!")
+        else:
+            self._open_place_key = place['key']
+        return scrollable_div
+
+    @metrics.timed('switch_sort')
+    def switch_sort(self, sort_label):
+        """Change the sort order of the reviews panel that is already open.
+
+        Returns the scrollable panel, or None if the sort could not be changed
+        (the caller then opens the page again).
+        """
+        print(f"Switching sort to '{sort_label}' on the open page...")
+        if self.capture_payloads:
+            # Responses still queued from the previous sort order
+            drain_captured_payloads(self.driver)
+        if not click_sort_button(self.driver, sort_label):
+            return None
+        scrollable_div = find_scrollable_container(self.driver, self.wait_profile)
+        if not scrollable_div:
+            print("ERROR: Could not find scrollable container after switching sort!")
+        return scrollable_div
+
+    def _decode_captured_reviews(self):
+        """``(record, raw)`` of every review decoded from the responses captured since the last call"""
+        payloads = drain_captured_payloads(self.driver)
+        if self.payload_dump_folder:
+            self._payload_dump_index = dump_payloads(
+                payloads, self.payload_dump_folder, self._payload_dump_prefix, self._payload_dump_index
+            )
+
+        records = []
+        for payload in payloads:
+            for record, layout_name, entry in decode_review_payload_entries(payload.get('body')):
+                records.append((record, payload_raw_fields(layout_name, entry)))
+        if payloads:
+            print(f"Decoded {len(records)} reviews from {len(payloads)} captured responses")
+        return records
+
+    def over_memory_limit(self):
+        """Memory of the driver's process tree in MB if it is past ``memory_limit_mb``, else None"""
+        if not self.memory_limit_mb:
+            return None
+        memory_mb = get_driver_memory_mb(self.driver)
+        if memory_mb is None:
+            return None
+        if self.metrics is not None:
+            self.metrics.gauge('driver_memory_mb', round(memory_mb))
+        return memory_mb if memory_mb > self.memory_limit_mb else None
+
+    def iter_new_reviews(self, processed_reviews, reused=None):
+        """Yield ``(review_id, review_data, raw)`` for reviews that appeared since the last call.
+
+        ``raw`` holds the raw fields the review was parsed from (element text
+        or captured payload entry, see rawstore), or None for owner responses.
+        Reviews found in ``reused`` (id -> ``(parsed review, raw)``) are
+        yielded as a copy of that record, with its raw fields from the earlier
+        crawl, without being read or parsed again.
+        With ``prune_dom``, the nodes of every review looked at are emptied
+        once the batch is consumed, so each scroll only touches new reviews.
+        """
+        if not self.prune_dom:
+            yield from self._iter_new_reviews(processed_reviews, reused)
+            return
+
+        # Every id looked at this round, including already-known ones after --resume
+        batch_ids = []
+        yield from self._iter_new_reviews(processed_reviews, reused, batch_ids)
+        pruned = prune_review_nodes(self.driver, batch_ids)
+        if pruned:
+            print(f"Pruned {pruned} processed review nodes")
+
+    def _iter_new_reviews(self, processed_reviews, reused=None, seen_ids=None):
+        if seen_ids is None:
+            seen_ids = []
+        if reused is None:
+            reused = {}
+        if self.capture_payloads:
+            records = self._decode_captured_reviews()
+            # Nothing captured yet (e.g. the first page came with the HTML): use the DOM
+            if records:
+                # Their nodes are on the page too: a later DOM fallback must not expand and read them
+                mark_review_ids_seen(self.driver, [record['review_id'] for record, _ in records])
+                for record, raw in records:
+                    review_id = record.pop('review_id')
+                    seen_ids.append(review_id)
+                    if review_id in processed_reviews:
+                        continue
+                    processed_reviews.add(review_id)
+                    if review_id in reused:
+                        metrics.count('reviews_reused')
+                        record = dict(reused[review_id][0])
+                    yield review_id, record, raw
+                return
+
+        if self.bulk_extract:
+            if self.batch_expand:
+                expand_new_reviews(self.driver, self.expand_wait_profile)
+            records = extract_new_reviews_bulk(self.driver)
+            print(f"Found {len(records)} new elements")
+            for record in records:
+                review_id = record.get('review_id')
+                seen_ids.append(review_id)
+                if review_id in processed_reviews:
+                    continue
+                processed_reviews.add(review_id)
+                if review_id in reused:
+                    metrics.count('reviews_reused')
+                    review, raw = reused[review_id]
+                    yield review_id, dict(review), raw
+                    continue
+                raw = read_bulk_review_record(self.driver, record, self.expand_wait_profile)
+                yield review_id, parse_review_text(*raw) if raw else None, raw_fields(*raw) if raw else None
+            return
+
+        review_elements = find_review_elements(self.driver)
+        print(f"Found {len(review_elements)} elements")
+        for element in review_elements:
+            review_id = safe_get_attribute(element, 'data-review-id')
+            if not review_id:
+                review_id = stable_hash64(safe_get_text(element))
+            seen_ids.append(review_id)
+            if review_id in processed_reviews:
+                continue
+            processed_reviews.add(review_id)
+            if review_id in reused:
+                metrics.count('reviews_reused')
+                review, raw = reused[review_id]
+                yield review_id, dict(review), raw
+                continue
+            raw = read_review_element(self.driver, element, self.expand_wait_profile)
+            yield review_id, parse_review_text(*raw) if raw else None, raw_fields(*raw) if raw else None
+
+    def collect_reviews(self, place, scrollable_div, mode=MODE_MAIN, checkpoint=None, resume=False,
+                        known=None, sink=None, raw_sink=None, store_sink=None, reused=None):
+        """Scroll the review panel and collect reviews until the target or the end.
+
+        With a ``checkpoint``, every processed id is appended to it after each
+        scroll; ``resume`` reloads it first so known reviews are skipped.
+        With ``known`` (a ``KnownReviews``), already-saved reviews are dropped
+        and the crawl stops after ``known_stop_after`` of them in a row.
+        Kept reviews are streamed to ``sink`` as they are parsed, and the raw
+        text of every review read to ``raw_sink``; ``store_sink`` upserts
+        them into the review database once per scroll. Reviews in ``reused``
+        (id -> ``(parsed review, raw)``) are taken from there instead of the
+        page; their raw fields still go to ``raw_sink``.
+        Sets ``last_crawl_complete`` to False if the driver died mid-crawl,
+        and also ``memory_exceeded`` if it stopped at the memory cap.
+        """
+        # Kept reviews column by column rather than as a list of dicts
+        reviews = ReviewBuffer()
+        # 64-bit keys instead of id strings: ~20 bytes per review on long crawls
+        processed_reviews = SeenSet()
+        if checkpoint is not None:
+            if resume and checkpoint.exists():
+                processed_reviews, restored, restored_raw = checkpoint.load()
+                reviews.extend(restored)
+                print(f"Resuming from checkpoint: {len(reviews)} reviews, "
+                      f"{len(processed_reviews)} processed ids")
+                for review, (review_id, raw) in zip(restored, restored_raw):
+                    if sink is not None:
+                        sink.write(review)
+                    if store_sink is not None:
+                        store_sink.write(review)
+                    # The new raw file covers the whole crawl, not just the part after the restart
+                    if raw_sink is not None and raw is not None:
+                        raw_sink.write(review_id, raw, scraped_at=review.get('scraped_at'))
+                if raw_sink is not None:
+                    raw_sink.flush()
+            else:
+                checkpoint.reset()
+
+        target_reviews = place['target_reviews']
+        count_visit_time_only = mode == MODE_MAIN and place['require_visit_time']
+        counted = sum(1 for review in reviews if not count_visit_time_only or review.get('visit_time'))
+        self.last_crawl_complete = False
+        scroll_count = 0
+        consecutive_no_new = 0
+        consecutive_known = 0
+        stopped_by_rating = False
+        stopped_by_known = False
+
+        while counted < target_reviews and not stopped_by_rating and not stopped_by_known:
+            try:
+                if not is_driver_alive(self.driver):
+                    print("Driver disconnected unexpectedly. Stopping...")
+                    return reviews
+
+                print(f"\nScroll #{scroll_count}: Reviews collected: {counted}")
+                new_reviews_count = 0
+                # Anchor for the relative dates ("3 bulan lalu") read in this scroll
+                scraped_at = datetime.now().isoformat(timespec='seconds')
+
+                for review_id, review_data, raw in self.iter_new_reviews(processed_reviews, reused):
+                    is_known = False
+                    if mode == MODE_LOW_RATING:
+                        review_data, stop_signal = filter_low_rating(review_data, place['name'])
+                        if stop_signal == STOP_SCRAPING:
+                            print("Found 4-5 star review. Stopping low-rating crawl.")
+                            stopped_by_rating = True
+                            break
+
+                    if review_data:
+                        if isinstance(review_id, str):
+                            review_data['review_id'] = review_id
+                        review_data['fingerprint'] = review_fingerprint(
+                            place['dataset'], review_data.get('reviewer_name'),
+                            review_data.get('rating'), review_data.get('review_text'))
+                        # Reused reviews keep the time their date was read
+                        review_data.setdefault('scraped_at', scraped_at)
+
+                    if known is not None and review_data:
+                        if known.contains(review_id, review_data):
+                            consecutive_known += 1
+                            if consecutive_known >= self.known_stop_after:
+                                print(f"Reached {consecutive_known} already-saved reviews in a row. Stopping refresh.")
+                                stopped_by_known = True
+                                break
+                            review_data = None
+                            is_known = True
+                        else:
+                            consecutive_known = 0
+
+                    if raw_sink is not None and raw is not None:
+                        # A reused review keeps the time it was first read
+                        raw_scraped_at = (review_data or {}).get('scraped_at') or scraped_at
+                        raw_sink.write(review_id, raw, known=is_known, scraped_at=raw_scraped_at)
+                    if checkpoint is not None:
+                        checkpoint.record(review_id, review_data, raw)
+
+                    if not review_data:
+                        continue
+
+                    reviews.append(review_data)
+                    metrics.count('reviews')
+                    if sink is not None:
+                        sink.write(review_data)
+                    if store_sink is not None:
+                        store_sink.write(review_data)
+                    if count_visit_time_only and not review_data.get('visit_time'):
+                        continue
+
+                    counted += 1
+                    new_reviews_count += 1
+                    if counted % 10 == 0:
+                        print(f"Collected {counted} reviews")
+
+                if sink is not None:
+                    sink.flush()
+                if raw_sink is not None:
+                    raw_sink.flush()
+                if store_sink is not None:
+                    store_sink.flush()
+                if checkpoint is not None:
+                    checkpoint.flush(processed_reviews)
+
+                if stopped_by_rating or stopped_by_known:
+                    break
+
+                if new_reviews_count == 0 and consecutive_known == 0:
+                    consecutive_no_new += 1
+                    print(f"No new reviews found (attempt {consecutive_no_new}/{self.max_consecutive_no_new})")
+
+                    aggressive_scroll_and_wait(self.driver, scrollable_div, wait_time=2,
+                                               wait_profile=self.wait_profile)
+
+                    if scroll_to_load_more(self.driver, scrollable_div, scroll_attempts=5,
+                                           wait_profile=self.wait_profile):
+                        print("Additional content loaded after aggressive scrolling")
+                        consecutive_no_new = max(0, consecutive_no_new - 2)
+
+                    if consecutive_no_new >= self.max_consecutive_no_new:
+                        print("\nReached Google Maps review limit after multiple scroll attempts.")
+                        break
+                else:
+                    consecutive_no_new = 0
+                    scroll_to_load_more(self.driver, scrollable_div, scroll_attempts=2,
+                                        wait_profile=self.wait_profile)
+
+                scroll_count += 1
+                metrics.count('scrolls')
+                if self.page_weight is not None:
+                    self.page_weight.sample_scroll()
+                if self.metrics is not None and self.metrics.due(self.metrics_interval):
+                    self.emit_metrics()
+
+                if scroll_count % 10 == 0:
+                    gc.collect()
+
+                # Firefox keeps growing on long panels; stop here and let the caller resume on a fresh one
+                if self.memory_check_scrolls and scroll_count % self.memory_check_scrolls == 0:
+                    memory_mb = self.over_memory_limit()
+                    if memory_mb is not None:
+                        print(f"Firefox uses {memory_mb:.0f} MB (cap {self.memory_limit_mb} MB). "
+                              f"Stopping crawl at {counted} reviews; resume with a fresh driver.")
+                        self.memory_exceeded = True
+                        return reviews
+
+            except Exception as e:
+                print(f"Error in main loop: {e}")
+                traceback.print_exc()
+                if sink is not None:
+                    sink.flush()
+                if raw_sink is not None:
+                    raw_sink.flush()
+                if store_sink is not None:
+                    store_sink.flush()
+                if checkpoint is not None:
+                    checkpoint.flush(processed_reviews)
+                aggressive_scroll_and_wait(self.driver, scrollable_div, wait_profile=self.wait_profile)
+                continue
+
+        self.last_crawl_complete = True
+        return reviews
+
+    def emit_metrics(self, final=False):
+        """Print (and append to ``metrics_path``) a snapshot of the current place's metrics"""
+        if self.metrics is None:
+            return None
+        # Rendered review nodes: a slow round-trip with a large count means DOM growth
+        state = get_panel_state(self.driver) if self.driver is not None else None
+        if state:
+            self.metrics.gauge('dom_reviews', state.get('count'))
+        snapshot = self.metrics.snapshot(final=final)
+        metrics.emit(snapshot, self.metrics_path)
+        return snapshot
+
+    def scrape_place(self, place_key, mode=MODE_MAIN, save=True, resume=None, reuse=None, reuse_raw_path=None):
+        """Scrape one place and optionally save the results; returns the reviews (a ReviewBuffer).
+
+        ``resume`` overrides the scraper-wide setting for this place.
+        ``reuse`` is the result of an earlier crawl of this place in this
+        session: if its page is still open only the sort order is switched,
+        and reviews it already holds are not read or parsed again.
+        ``reuse_raw_path`` is that crawl's raw file; the raw fields of reused
+        reviews are copied from it into this run's raw file.
+        After a main crawl with ``low_rating_pass`` set, the low-rating crawl
+        runs this way and its reviews are kept in ``last_low_rating_reviews``.
+        """
+        place = get_place(place_key)
+        resume = self.resume if resume is None else resume
+        if mode == MODE_LOW_RATING and not place['low_rating_prefix']:
+            print(f"{place['name']} has no low-rating crawl configured, skipping")
+            return ReviewBuffer()
+
+        incremental = self.incremental and mode == MODE_MAIN
+        if mode == MODE_LOW_RATING:
+            sort_label = SORT_LOWEST_RATING
+        elif incremental:
+            sort_label = SORT_NEWEST
+        else:
+            sort_label = place['sort']
+        print(f"\n{'=' * 60}")
+        print(f"SCRAPING: {place['name']} ({mode}, sort '{sort_label}')")
+        print(f"{'=' * 60}")
+
+        checkpoint = None
+        if self.checkpoint_folder:
+            checkpoint = Checkpoint(checkpoint_path(place, mode, self.checkpoint_folder))
+
+        known = None
+        if incremental:
+            known = load_known_reviews(place, self.output_folder)
+            print(f"Incremental refresh: {len(known)} reviews already saved")
+
+        # Stream reviews to disk as they come; the CSV format is written at the end
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        label = 'NEW' if incremental else 'ALL'
+        sink = None
+        if save and self.output_format != FORMAT_CSV:
+            if mode == MODE_LOW_RATING:
+                sink = open_low_rating_sink(place, self.low_rating_output_folder, self.output_format, timestamp)
+            else:
+                sink = open_review_sink(place, self.output_folder, label, self.output_format, timestamp)
+        raw_sink = None
+        if save and self.raw_folder:
+            raw_sink = open_raw_sink(place, mode, LOW_RATING_LABEL if mode == MODE_LOW_RATING else label,
+                                     self.raw_folder, timestamp)
+        store_sink = None
+        if save and self.store_path:
+            store_sink = open_store_sink(place, mode, self.store_path)
+
+        if mode == MODE_MAIN:
+            self.last_low_rating_reviews = None
+        reused = None
+        if reuse is not None:
+            reused_raw = load_raw_fields(reuse_raw_path) if reuse_raw_path and raw_sink is not None else {}
+            reused = {review['review_id']: (review, reused_raw.get(review['review_id']))
+                      for review in reuse if review.get('review_id')}
+
+        reviews = ReviewBuffer()
+        self.last_crawl_complete = False
+        self.memory_exceeded = False
+        self.page_weight = None
+        self.metrics = Metrics(place_key, mode).activate()
+        try:
+            self.start()
+            instrument_driver(self.driver)
+            scrollable_div = None
+            if reused is not None and self._open_place_key == place['key'] and is_driver_alive(self.driver):
+                scrollable_div = self.switch_sort(sort_label)
+            if not scrollable_div:
+                scrollable_div = self.open_place(place, sort_label)
+                if self.lean:
+                    self.page_weight = PageWeightMeter(self.driver)
+                    self.page_weight.sample_page_load()
+            if scrollable_div and reused:
+                set_known_review_ids(self.driver, list(reused))
+                print(f"Reusing {len(reused)} reviews from the previous crawl of this place")
+            if scrollable_div:
+                reviews = self.collect_reviews(place, scrollable_div, mode=mode,
+                                               checkpoint=checkpoint, resume=resume, known=known, sink=sink,
+                                               raw_sink=raw_sink, store_sink=store_sink, reused=reused)
+        except Exception as e:
+            print(f"Fatal error: {str(e)}")
+            traceback.print_exc()
+
+        print(f"\nCompleted {place['name']}: {len(reviews)} reviews collected")
+        if self.page_weight is not None:
+            print(f"\nLean driver report (startup {self.startup_seconds or 0:.1f}s):")
+            print(self.page_weight.report())
+        self.emit_metrics(final=True)
+        self.metrics.deactivate()
+
+        if sink is not None:
+            if sink.close() is None:
+                print("No reviews to save")
+            sink.print_summary()
+        elif save:
+            if mode == MODE_LOW_RATING:
+                save_low_rating_reviews(place, reviews, self.low_rating_output_folder)
+            else:
+                save_reviews(place, reviews, self.output_folder, label=label)
+        raw_path = raw_sink.close() if raw_sink is not None else None
+        if store_sink is not None:
+            store_sink.close()
+
+        if checkpoint is not None:
+            if self.last_crawl_complete:
+                checkpoint.remove()
+            elif checkpoint.exists():
+                print(f"Crawl interrupted; checkpoint kept at {checkpoint.path} (rerun with --resume)")
+
+        # After a memory stop the low-rating pass waits for the resumed crawl
+        if mode == MODE_MAIN and self.low_rating_pass and place['low_rating_prefix'] and not self.memory_exceeded:
+            self.last_low_rating_reviews = self.scrape_place(place_key, MODE_LOW_RATING, save=save,
+                                                             resume=resume, reuse=reviews,
+                                                             reuse_raw_path=raw_path)
+        return reviews
+
+
+def run_place(place_key, mode=MODE_MAIN, **scraper_options):
+    """Scrape a single place in its own browser session"""
+    with ReviewScraper(**scraper_options) as scraper:
+        return scraper.scrape_place(place_key, mode=mode)
+
+
+def run_batch(place_keys=None, mode=MODE_MAIN, **scraper_options):
+    """Scrape several places (default: all registered) in one browser session.
+
+    Extra keyword arguments are passed to ``ReviewScraper``. A crawl stopped
+    at ``memory_limit_mb`` is resumed from its checkpoint on a fresh driver.
+    """
+    from .pool import MAX_MEMORY_RESTARTS
+
+    if place_keys is None:
+        place_keys = list_places(low_rating=mode == MODE_LOW_RATING)
+
+    results = {}
+    with ReviewScraper(**scraper_options) as scraper:
+        for place_key in place_keys:
+            results[place_key] = scraper.scrape_place(place_key, mode=mode)
+            memory_restarts = 0
+            while scraper.memory_exceeded and memory_restarts < MAX_MEMORY_RESTARTS:
+                memory_restarts += 1
+                print(f"Resuming {place_key} on a fresh driver "
+                      f"(memory restart {memory_restarts}/{MAX_MEMORY_RESTARTS})...")
+                scraper.restart()
+                results[place_key] = scraper.scrape_place(place_key, mode=mode, resume=True)
+    return results
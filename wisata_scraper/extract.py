@@ -0,0 +1,382 @@
+"""Pulling review data out of the rendered review panel"""
+from selenium.webdriver.common.by import By
+
+from . import metrics
+from .driver import safe_click, safe_execute_script, safe_get_attribute, safe_get_text
+from .parsing import OWNER_INDICATORS, is_owner_text, parse_review_text
+from .waits import EXPAND_WAIT_PROFILE, wait_for_batch_expanded, wait_for_expanded
+
+# One execute_script call per scroll returns every review that has not been
+# handed out yet, instead of several WebDriver round-trips per element.
+# Returned nodes are tagged with data-scrape-seen so the next call only picks
+# up newly loaded reviews.
+BULK_EXTRACT_SCRIPT = """
+var ownerIndicators = arguments[0];
+
+function isOwnerText(text) {
+    var preview = text.toLowerCase();
+    for (var m = 0; m < ownerIndicators.length; m++) {
+        if (preview.indexOf(ownerIndicators[m]) !== -1) {
+            return true;
+        }
+    }
+    return false;
+}
+
+var nodes = document.querySelectorAll('div[data-review-id]');
+var seenIds = {};
+var results = [];
+for (var i = 0; i < nodes.length; i++) {
+    var node = nodes[i];
+    var reviewId = node.getAttribute('data-review-id');
+    if (!reviewId || seenIds[reviewId]) {
+        continue;
+    }
+    seenIds[reviewId] = true;
+    if (node.getAttribute('data-scrape-seen')) {
+        continue;
+    }
+    node.setAttribute('data-scrape-seen', '1');
+    if (window.__wisataKnownIds && window.__wisataKnownIds[reviewId]) {
+        results.push({review_id: reviewId, known: true});
+        continue;
+    }
+
+    var rawText = node.innerText || '';
+
+    var ariaRating = '';
+    var ratingNodes = node.querySelectorAll("span[role='img']");
+    for (var j = 0; j < ratingNodes.length; j++) {
+        var label = ratingNodes[j].getAttribute('aria-label') || '';
+        var lowerLabel = label.toLowerCase();
+        if (lowerLabel.indexOf('bintang') !== -1 || lowerLabel.indexOf('star') !== -1) {
+            ariaRating = label;
+            break;
+        }
+    }
+
+    var isOwner = isOwnerText(rawText.substring(0, 100));
+
+    // Same rule as EXPAND_BATCH_SCRIPT: a hidden button or the one of a
+    // truncated owner response does not need the per-review expansion
+    var hasMoreButton = false;
+    var buttons = node.querySelectorAll('button');
+    for (var k = 0; k < buttons.length; k++) {
+        var button = buttons[k];
+        var buttonText = button.textContent || '';
+        if (buttonText.indexOf('Lainnya') === -1 && buttonText.indexOf('More') === -1) {
+            continue;
+        }
+        if (!button.getClientRects().length) {
+            continue;
+        }
+        var parentText = button.parentElement ? (button.parentElement.innerText || '') : '';
+        if (isOwnerText(parentText.substring(0, 50))) {
+            continue;
+        }
+        hasMoreButton = true;
+        break;
+    }
+
+    results.push({
+        review_id: reviewId,
+        raw_text: rawText,
+        aria_rating: ariaRating,
+        has_more_button: hasMoreButton,
+        is_owner: isOwner,
+        element: node
+    });
+}
+return results;
+"""
+
+# Clicks the 'Lainnya' button of every review the bulk script has not handed
+# out yet (owner responses and known ids excluded) in one call, so a single
+# wait covers the whole batch instead of a scroll, click and wait per review.
+# Clicked reviews are tagged data-scrape-expanding for the wait; tags left
+# from the previous batch are cleared first.
+EXPAND_BATCH_SCRIPT = """
+var ownerIndicators = arguments[0];
+var stale = document.querySelectorAll('div[data-scrape-expanding]');
+for (var s = 0; s < stale.length; s++) {
+    stale[s].removeAttribute('data-scrape-expanding');
+}
+
+function isOwnerText(text) {
+    var preview = text.toLowerCase();
+    for (var m = 0; m < ownerIndicators.length; m++) {
+        if (preview.indexOf(ownerIndicators[m]) !== -1) {
+            return true;
+        }
+    }
+    return false;
+}
+
+var nodes = document.querySelectorAll('div[data-review-id]');
+var clicked = 0;
+for (var i = 0; i < nodes.length; i++) {
+    var node = nodes[i];
+    var reviewId = node.getAttribute('data-review-id');
+    if (!reviewId || node.getAttribute('data-scrape-seen')) {
+        continue;
+    }
+    if (window.__wisataKnownIds && window.__wisataKnownIds[reviewId]) {
+        continue;
+    }
+    if (isOwnerText((node.innerText || '').substring(0, 100))) {
+        continue;
+    }
+
+    var buttons = node.querySelectorAll('button');
+    for (var k = 0; k < buttons.length; k++) {
+        var button = buttons[k];
+        var buttonText = button.textContent || '';
+        if (buttonText.indexOf('Lainnya') === -1 && buttonText.indexOf('More') === -1) {
+            continue;
+        }
+        if (button.getAttribute('data-scrape-clicked') || !button.getClientRects().length) {
+            continue;
+        }
+        var parentText = button.parentElement ? (button.parentElement.innerText || '') : '';
+        if (isOwnerText(parentText.substring(0, 50))) {
+            continue;
+        }
+        button.setAttribute('data-scrape-clicked', '1');
+        button.click();
+        node.setAttribute('data-scrape-expanding', '1');
+        clicked++;
+        break;
+    }
+}
+return clicked;
+"""
+
+# Ids the scraper already holds parsed (the main crawl of the same place, before
+# a low-rating pass on the same page): the bulk script hands them out as bare
+# ids without reading their text. Also forgets which nodes were handed out,
+# in case Maps keeps some nodes when the sort order changes.
+KNOWN_IDS_SCRIPT = """
+var known = {};
+var ids = arguments[0];
+for (var i = 0; i < ids.length; i++) {
+    known[ids[i]] = true;
+}
+window.__wisataKnownIds = known;
+var seen = document.querySelectorAll('[data-scrape-seen]');
+for (var j = 0; j < seen.length; j++) {
+    seen[j].removeAttribute('data-scrape-seen');
+}
+return ids.length;
+"""
+
+# Ids decoded from captured payloads: added to the known ids (the bulk and
+# expand scripts skip them) and their rendered nodes tagged as handed out, so
+# a scroll that falls back to the DOM does not expand or read them again.
+MARK_SEEN_SCRIPT = """
+var ids = arguments[0];
+var known = window.__wisataKnownIds || {};
+for (var i = 0; i < ids.length; i++) {
+    known[ids[i]] = true;
+}
+window.__wisataKnownIds = known;
+var nodes = document.querySelectorAll('div[data-review-id]');
+var marked = 0;
+for (var j = 0; j < nodes.length; j++) {
+    if (known[nodes[j].getAttribute('data-review-id')] && !nodes[j].getAttribute('data-scrape-seen')) {
+        nodes[j].setAttribute('data-scrape-seen', '1');
+        marked++;
+    }
+}
+return marked;
+"""
+
+# Empties review nodes that were already parsed, keeping each node's height so
+# the panel's scroll position and Maps' paging trigger stay where they were.
+# Pruned nodes lose data-review-id, so later queries only see fresh reviews.
+PRUNE_SCRIPT = """
+var wanted = {};
+var ids = arguments[0];
+for (var i = 0; i < ids.length; i++) {
+    wanted[ids[i]] = true;
+}
+var nodes = document.querySelectorAll('div[data-review-id]');
+var pruned = 0;
+for (var j = 0; j < nodes.length; j++) {
+    var node = nodes[j];
+    var reviewId = node.getAttribute('data-review-id');
+    if (!node.isConnected || !wanted[reviewId]) {
+        continue;
+    }
+    var parent = node.parentElement ? node.parentElement.closest('div[data-review-id]') : null;
+    if (parent) {
+        continue;
+    }
+    var height = node.getBoundingClientRect().height;
+    node.innerHTML = '';
+    node.style.height = height + 'px';
+    node.removeAttribute('data-review-id');
+    node.setAttribute('data-pruned-review-id', reviewId);
+    pruned++;
+}
+return pruned;
+"""
+
+
+@metrics.timed('extract_new_reviews_bulk')
+def extract_new_reviews_bulk(driver):
+    """Extract all not-yet-seen review elements with a single JavaScript call"""
+    records = safe_execute_script(driver, BULK_EXTRACT_SCRIPT, OWNER_INDICATORS)
+    return records or []
+
+
+@metrics.timed('expand_new_reviews')
+def expand_new_reviews(driver, wait_profile=EXPAND_WAIT_PROFILE):
+    """Expand every truncated review not extracted yet, with one click script and one wait.
+
+    Returns how many reviews were clicked. Reviews that still show their
+    button afterwards are expanded one by one by read_bulk_review_record.
+    """
+    clicked = safe_execute_script(driver, EXPAND_BATCH_SCRIPT, OWNER_INDICATORS) or 0
+    if clicked:
+        metrics.count('expand_clicks', clicked)
+        wait_for_batch_expanded(driver, wait_profile)
+    return clicked
+
+
+def set_known_review_ids(driver, review_ids):
+    """Make the bulk script skip reading these reviews; returns how many were set"""
+    review_ids = [review_id for review_id in review_ids if isinstance(review_id, str)]
+    return safe_execute_script(driver, KNOWN_IDS_SCRIPT, review_ids) or 0
+
+
+def mark_review_ids_seen(driver, review_ids):
+    """Keep the DOM extraction from reading these reviews; returns how many rendered nodes were tagged"""
+    review_ids = [review_id for review_id in review_ids if isinstance(review_id, str)]
+    if not review_ids:
+        return 0
+    return safe_execute_script(driver, MARK_SEEN_SCRIPT, review_ids) or 0
+
+
+def prune_review_nodes(driver, review_ids):
+    """Empty the DOM nodes of already-parsed reviews; returns how many were pruned"""
+    review_ids = [review_id for review_id in review_ids if isinstance(review_id, str)]
+    if not review_ids:
+        return 0
+    return safe_execute_script(driver, PRUNE_SCRIPT, review_ids) or 0
+
+
+def find_review_elements(driver):
+    """Find all review elements currently rendered in the panel"""
+    try:
+        review_elements = driver.find_elements(By.XPATH, "//div[@data-review-id]")
+        if not review_elements:
+            review_elements = driver.find_elements(By.XPATH, "//div[contains(@class, 'jftiEf')]")
+        return review_elements
+    except:
+        return []
+
+
+def is_owner_response(element):
+    """Check if element is owner response"""
+    try:
+        return is_owner_text(safe_get_text(element, ""))
+    except:
+        return False
+
+
+@metrics.timed('expand_review_safely')
+def expand_review_safely(driver, element, wait_profile=EXPAND_WAIT_PROFILE):
+    """Safely expand review text (but not owner responses)"""
+    try:
+        if is_owner_response(element):
+            return False
+
+        expand_buttons = element.find_elements(By.XPATH, ".//button[contains(text(), 'Lainnya') or contains(text(), 'More')]")
+
+        for button in expand_buttons:
+            try:
+                button_text = safe_get_text(button.find_element(By.XPATH, "./.."), "")[:50].lower()
+                if any(indicator in button_text for indicator in OWNER_INDICATORS):
+                    continue
+
+                if button.is_displayed():
+                    if safe_click(driver, button):
+                        wait_for_expanded(driver, element, wait_profile)
+                        return True
+            except:
+                continue
+
+        return False
+    except:
+        return False
+
+
+@metrics.timed('read_review_element')
+def read_review_element(driver, element, wait_profile=EXPAND_WAIT_PROFILE):
+    """``(raw_text, aria_rating)`` of a review element after expanding it.
+
+    None for owner responses and elements without text.
+    """
+    try:
+        if is_owner_response(element):
+            return None
+
+        # Try to expand the review first; this waits for the expansion itself
+        expand_review_safely(driver, element, wait_profile)
+
+        # Get text after expansion
+        full_text = safe_get_text(element, "")
+        if not full_text:
+            return None
+
+        # Extract rating label
+        aria_rating = ""
+        try:
+            rating_elements = element.find_elements(By.XPATH, ".//span[@role='img']")
+            for rating_elem in rating_elements:
+                aria_label = safe_get_attribute(rating_elem, 'aria-label', '')
+                if aria_label and ('bintang' in aria_label.lower() or 'star' in aria_label.lower()):
+                    aria_rating = aria_label
+                    break
+        except:
+            pass
+
+        return full_text, aria_rating
+
+    except Exception as e:
+        return None
+
+
+def parse_review_element_with_expand(driver, element, wait_profile=EXPAND_WAIT_PROFILE):
+    """Parse a single review element with expanding"""
+    raw = read_review_element(driver, element, wait_profile)
+    return parse_review_text(*raw) if raw else None
+
+
+@metrics.timed('read_bulk_review_record')
+def read_bulk_review_record(driver, record, wait_profile=EXPAND_WAIT_PROFILE):
+    """``(raw_text, aria_rating)`` of a record from extract_new_reviews_bulk.
+
+    None for owner responses.
+    """
+    try:
+        if record.get('is_owner'):
+            return None
+
+        full_text = record.get('raw_text', '')
+
+        # Only truncated reviews need the element round-trips for expansion
+        if record.get('has_more_button') and record.get('element') is not None:
+            if expand_review_safely(driver, record['element'], wait_profile):
+                full_text = safe_get_text(record['element'], full_text)
+
+        return full_text, record.get('aria_rating', '')
+
+    except Exception as e:
+        return None
+
+
+def parse_bulk_review_record(driver, record, wait_profile=EXPAND_WAIT_PROFILE):
+    """Parse a record returned by extract_new_reviews_bulk"""
+    raw = read_bulk_review_record(driver, record, wait_profile)
+    return parse_review_text(*raw) if raw else None
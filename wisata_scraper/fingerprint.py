@@ -0,0 +1,62 @@
+"""Deterministic 64-bit review fingerprints.
+
+Python's ``hash()`` of a string is salted per process, so it cannot identify
+a review across runs. The fingerprint is an unkeyed blake2b digest of the
+normalized dataset key, reviewer name, rating and review text, returned as a
+signed 64-bit int so it fits an int64 column (and a SQLite INTEGER).
+"""
+import hashlib
+import unicodedata
+
+FINGERPRINT_COLUMN = 'fingerprint'
+FIELD_SEPARATOR = '\x1f'
+
+
+def normalize_field(value):
+    """NFKC, lowercase, single spaces; NaN/None become ''"""
+    if value is None or value != value:
+        return ''
+    text = unicodedata.normalize('NFKC', str(value)).lower()
+    return ' '.join(text.split())
+
+
+def stable_hash64(text):
+    """Signed 64-bit blake2b of a string, the same in every process"""
+    digest = hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big', signed=True)
+
+
+def _normalize_rating(rating):
+    try:
+        return str(int(float(rating)))
+    except (TypeError, ValueError):
+        return ''
+
+
+def review_fingerprint(dataset_key, reviewer_name, rating, review_text):
+    """Identity of a review within a dataset (``places.PLACES[...]['dataset']``)"""
+    return stable_hash64(FIELD_SEPARATOR.join([
+        normalize_field(dataset_key),
+        normalize_field(reviewer_name),
+        _normalize_rating(rating),
+        normalize_field(review_text),
+    ]))
+
+
+def fingerprint_reviews(df, dataset_key):
+    """Fingerprint column for a frame of reviews read from one file.
+
+    A stored int64 column is reused; anything else (no column, or floats
+    after NaN padding) is recomputed, which gives the same values.
+    """
+    import pandas as pd
+
+    if FINGERPRINT_COLUMN in df.columns and pd.api.types.is_integer_dtype(df[FINGERPRINT_COLUMN]):
+        return df[FINGERPRINT_COLUMN].astype('int64')
+
+    columns = df.reindex(columns=['reviewer_name', 'rating', 'review_text'])
+    return pd.Series(
+        [review_fingerprint(dataset_key, name, rating, text)
+         for name, rating, text in zip(columns['reviewer_name'], columns['rating'], columns['review_text'])],
+        index=df.index, dtype='int64',
+    )
@@ -0,0 +1,52 @@
+"""Reviews already stored in hasil scraping, for incremental refreshes"""
+import glob
+import os
+
+from .fingerprint import FINGERPRINT_COLUMN, fingerprint_reviews
+from .output import OUTPUT_FOLDER, read_reviews
+
+# Stop a 'Terbaru' refresh after this many already-known reviews in a row
+DEFAULT_KNOWN_STOP_AFTER = 20
+
+
+class KnownReviews:
+    """Review ids and fingerprints already saved for a place"""
+
+    def __init__(self, review_ids=None, fingerprints=None):
+        self.review_ids = set(review_ids or ())
+        self.fingerprints = set(fingerprints or ())
+
+    def __len__(self):
+        return len(self.fingerprints)
+
+    def contains(self, review_id, review_data=None):
+        if review_id and review_id in self.review_ids:
+            return True
+        if review_data and FINGERPRINT_COLUMN in review_data:
+            return review_data[FINGERPRINT_COLUMN] in self.fingerprints
+        return False
+
+
+def load_known_reviews(place, output_folder=OUTPUT_FOLDER):
+    """Collect ids and fingerprints from every saved file of a place.
+
+    Files saved before fingerprints were stored get them computed here.
+    """
+    review_ids = set()
+    fingerprints = set()
+
+    base = os.path.join(glob.escape(output_folder), f"{place['output_prefix']}_*")
+    paths = glob.glob(base + '.csv') + glob.glob(base + '.jsonl') + glob.glob(base + '.parquet')
+    for path in paths:
+        try:
+            df = read_reviews(glob.escape(path))
+        except Exception as e:
+            print(f"Could not read {path}: {e}")
+            continue
+
+        fingerprints.update(fingerprint_reviews(df, place['dataset']).tolist())
+        if 'review_id' in df.columns:
+            ids = df['review_id'].fillna('').astype(str)
+            review_ids.update(ids[ids != ''])
+
+    return KnownReviews(review_ids, fingerprints)
@@ -0,0 +1,184 @@
+"""Per-phase timings and counters for a scrape, emitted as JSON lines.
+
+Scraping functions are wrapped with ``@timed('phase')``; while a ``Metrics``
+is active (one per place) every call records its wall time and the WebDriver
+round-trips made inside it. Phase times are inclusive: scroll_to_load_more
+contains its wait_for_review_growth calls. Time spent waiting (explicit
+``sleep`` calls and phases marked ``idle``) is tracked separately, so a run
+can be split into waiting and working:
+
+- waits that hit their timeout more often point at throttling,
+- slower WebDriver round-trips point at a heavier DOM,
+- a large idle share points at our own sleeps.
+"""
+import functools
+import json
+import os
+import time
+
+DEFAULT_METRICS_INTERVAL = 60.0
+
+_active = None
+
+
+def active():
+    """The Metrics collecting right now, or None"""
+    return _active
+
+
+class Metrics:
+    """Counters for one place; ``activate`` makes the module-level hooks record into it"""
+
+    def __init__(self, place_key=None, mode=None):
+        self.place_key = place_key
+        self.mode = mode
+        self.started = time.perf_counter()
+        self.phases = {}
+        self.counters = {}
+        self.gauges = {}
+        self.webdriver_calls = 0
+        self.webdriver_seconds = 0.0
+        self.sleep_seconds = 0.0
+        self.idle_seconds = 0.0
+        self._idle_depth = 0
+        self._last_emit = self.started
+
+    def activate(self):
+        global _active
+        _active = self
+        return self
+
+    def deactivate(self):
+        global _active
+        if _active is self:
+            _active = None
+
+    def count(self, name, amount=1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def gauge(self, name, value):
+        self.gauges[name] = value
+
+    def record_phase(self, name, seconds, webdriver_calls):
+        phase = self.phases.setdefault(name, {'calls': 0, 'seconds': 0.0, 'webdriver_calls': 0})
+        phase['calls'] += 1
+        phase['seconds'] += seconds
+        phase['webdriver_calls'] += webdriver_calls
+
+    def record_webdriver_call(self, seconds):
+        self.webdriver_calls += 1
+        self.webdriver_seconds += seconds
+
+    def record_sleep(self, seconds):
+        self.sleep_seconds += seconds
+        if self._idle_depth == 0:
+            self.idle_seconds += seconds
+
+    def due(self, interval):
+        """True once every ``interval`` seconds (for periodic snapshots)"""
+        now = time.perf_counter()
+        if interval and now - self._last_emit >= interval:
+            self._last_emit = now
+            return True
+        return False
+
+    def snapshot(self, final=False):
+        elapsed = time.perf_counter() - self.started
+        reviews = self.counters.get('reviews', 0)
+        return {
+            'place': self.place_key,
+            'mode': self.mode,
+            'final': final,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'elapsed_seconds': round(elapsed, 3),
+            'reviews': reviews,
+            'reviews_per_minute': round(reviews / elapsed * 60, 2) if elapsed else 0.0,
+            'idle_seconds': round(self.idle_seconds, 3),
+            'busy_seconds': round(max(elapsed - self.idle_seconds, 0.0), 3),
+            'sleep_seconds': round(self.sleep_seconds, 3),
+            'webdriver_calls': self.webdriver_calls,
+            'webdriver_seconds': round(self.webdriver_seconds, 3),
+            'webdriver_mean_ms': round(self.webdriver_seconds / self.webdriver_calls * 1000, 2)
+            if self.webdriver_calls else 0.0,
+            'counters': dict(self.counters),
+            'gauges': dict(self.gauges),
+            'phases': {
+                name: {
+                    'calls': phase['calls'],
+                    'seconds': round(phase['seconds'], 3),
+                    'mean_ms': round(phase['seconds'] / phase['calls'] * 1000, 2),
+                    'webdriver_calls': phase['webdriver_calls'],
+                }
+                for name, phase in sorted(self.phases.items())
+            },
+        }
+
+
+def timed(name, idle=False):
+    """Decorator recording calls of a function as phase ``name``.
+
+    ``idle`` marks phases that only wait for the page (counted as idle time).
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            metrics = _active
+            if metrics is None:
+                return func(*args, **kwargs)
+            calls_before = metrics.webdriver_calls
+            if idle:
+                metrics._idle_depth += 1
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                seconds = time.perf_counter() - started
+                if idle:
+                    metrics._idle_depth -= 1
+                    if metrics._idle_depth == 0:
+                        metrics.idle_seconds += seconds
+                metrics.record_phase(name, seconds, metrics.webdriver_calls - calls_before)
+        return wrapper
+    return decorator
+
+
+def sleep(seconds):
+    """time.sleep that is counted as idle time"""
+    time.sleep(seconds)
+    if _active is not None:
+        _active.record_sleep(seconds)
+
+
+def count(name, amount=1):
+    if _active is not None:
+        _active.count(name, amount)
+
+
+def instrument_driver(driver):
+    """Count every WebDriver command (all of them go through ``driver.execute``)"""
+    if getattr(driver, '_wisata_instrumented', False):
+        return driver
+    execute = driver.execute
+
+    @functools.wraps(execute)
+    def counted_execute(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return execute(*args, **kwargs)
+        finally:
+            if _active is not None:
+                _active.record_webdriver_call(time.perf_counter() - started)
+
+    driver.execute = counted_execute
+    driver._wisata_instrumented = True
+    return driver
+
+
+def emit(snapshot, path=None):
+    """Print a snapshot as one JSON line and append it to ``path`` if given"""
+    line = json.dumps(snapshot, ensure_ascii=False, sort_keys=True)
+    print(f"METRICS {line}")
+    if path:
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(line + '\n')
@@ -0,0 +1,256 @@
+"""Opening a place, picking the review sort order and scrolling the review panel"""
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from . import metrics
+from .driver import safe_click, safe_execute_script, safe_get_attribute, safe_get_text
+from .waits import (
+    DEFAULT_WAIT_PROFILE,
+    SORT_WAIT_PROFILE,
+    get_panel_state,
+    mark_reviews_stale,
+    wait_for_review_growth,
+    wait_for_sort_applied,
+    wait_until,
+)
+
+SORT_RELEVANT = 'Paling relevan'
+SORT_NEWEST = 'Terbaru'
+SORT_LOWEST_RATING = 'Rating terendah'
+SORT_HIGHEST_RATING = 'Rating tertinggi'
+
+# English fallbacks used when the Maps UI ignores the id-ID locale
+SORT_KEYWORDS = {
+    SORT_RELEVANT: ['paling relevan', 'most relevant'],
+    SORT_NEWEST: ['terbaru', 'newest'],
+    SORT_LOWEST_RATING: ['rating terendah', 'lowest rating'],
+    SORT_HIGHEST_RATING: ['rating tertinggi', 'highest rating'],
+}
+
+
+def open_reviews_tab(driver, wait_profile=DEFAULT_WAIT_PROFILE):
+    """Click the 'Ulasan' tab of an opened place page"""
+    reviews_button_selectors = [
+        "//button[contains(@aria-label, 'Ulasan')]",
+        "//button[contains(text(), 'Ulasan')]",
+        "//div[@role='tab'][contains(., 'Ulasan')]",
+        "//span[text()='Ulasan']//ancestor::button[1]"
+    ]
+
+    for selector in reviews_button_selectors:
+        try:
+            reviews_button = WebDriverWait(driver, 5).until(
+                EC.element_to_be_clickable((By.XPATH, selector))
+            )
+            if reviews_button:
+                safe_click(driver, reviews_button)
+                # Return as soon as the first reviews render instead of sleeping 3 s
+                wait_for_review_growth(driver, None, None, wait_profile.with_timeout(max(wait_profile.timeout, 5)))
+                print("Reviews tab clicked!")
+                return True
+        except:
+            continue
+
+    print("Could not find reviews tab")
+    return False
+
+
+def _select_sort_option(driver, option, sort_label, wait_profile):
+    """Click a sort option and wait until the menu closes and the reviews re-render"""
+    # Maps keeps the list when the checked option is clicked again
+    already_selected = safe_get_attribute(option, 'aria-checked', '') == 'true'
+    if not already_selected:
+        mark_reviews_stale(driver)
+    safe_click(driver, option)
+    print(f"Selected '{sort_label}' sorting")
+    if not wait_for_sort_applied(driver, not already_selected, wait_profile):
+        print("Sorted reviews did not render in time, continuing...")
+    return True
+
+
+def click_sort_button(driver, sort_label=SORT_RELEVANT, wait_profile=SORT_WAIT_PROFILE):
+    """Click the sort button and select the given sort option"""
+    try:
+        print("Looking for sort button...")
+
+        sort_button_selectors = [
+            "//button[contains(@aria-label, 'Urutkan')]",
+            "//button[contains(text(), 'Urutkan')]",
+            "//button[contains(@class, 'g88MCb')]//span[contains(text(), 'Urutkan')]/..",
+            "//button[@data-value='Urutkan']"
+        ]
+
+        sort_button = None
+        for selector in sort_button_selectors:
+            try:
+                sort_button = WebDriverWait(driver, 5).until(
+                    EC.element_to_be_clickable((By.XPATH, selector))
+                )
+                if sort_button:
+                    break
+            except:
+                continue
+
+        if not sort_button:
+            print("Sort button not found, continuing with default order...")
+            return False
+
+        safe_click(driver, sort_button)
+        try:
+            WebDriverWait(driver, 2).until(
+                EC.presence_of_element_located((By.XPATH, "//div[@role='menuitemradio']"))
+            )
+        except:
+            pass
+
+        print(f"Looking for '{sort_label}' option...")
+        option_selectors = [
+            f"//div[@role='menuitemradio'][contains(., '{sort_label}')]",
+            f"//div[contains(@class, 'fxNQSd')][contains(text(), '{sort_label}')]",
+            f"//div[@data-index][contains(., '{sort_label}')]"
+        ]
+
+        for selector in option_selectors:
+            try:
+                option = driver.find_element(By.XPATH, selector)
+                if option:
+                    return _select_sort_option(driver, option, sort_label, wait_profile)
+            except:
+                continue
+
+        # Fallback: match any menu option by keyword
+        keywords = SORT_KEYWORDS.get(sort_label, [sort_label.lower()])
+        try:
+            for option in driver.find_elements(By.XPATH, "//div[@role='menuitemradio']"):
+                option_text = safe_get_text(option, "").lower()
+                if any(keyword in option_text for keyword in keywords):
+                    return _select_sort_option(driver, option, sort_label, wait_profile)
+        except:
+            pass
+
+        print(f"Could not find '{sort_label}' option")
+        return False
+
+    except Exception as e:
+        print(f"Error clicking sort button: {e}")
+        return False
+
+
+def _find_scrollable_panel(driver):
+    """The review panel if it is rendered and already taller than its viewport, else None"""
+    selectors = [
+        "//div[contains(@class, 'm6QErb') and contains(@class, 'DxyBCb')]",
+        "//div[@role='feed']",
+        "//div[contains(@class, 'scrollable')]"
+    ]
+
+    for selector in selectors:
+        try:
+            elements = driver.find_elements(By.XPATH, selector)
+            for elem in elements:
+                try:
+                    height = elem.size.get('height', 0)
+                    scroll_height = safe_execute_script(driver, "return arguments[0].scrollHeight", elem)
+
+                    if height > 400 and scroll_height and scroll_height > height:
+                        return elem
+                except:
+                    continue
+        except:
+            continue
+    return None
+
+
+@metrics.timed('find_scrollable_container')
+def find_scrollable_container(driver, wait_profile=DEFAULT_WAIT_PROFILE):
+    """Find the correct scrollable container"""
+    try:
+        # Usually there on the first try; otherwise poll until the panel overflows
+        panel = wait_until(lambda: _find_scrollable_panel(driver), wait_profile)
+        if panel:
+            print("Found scrollable container")
+            return panel
+
+        try:
+            return driver.find_element(By.XPATH, "//div[@role='main']")
+        except:
+            return None
+
+    except Exception as e:
+        print(f"Error finding scrollable container: {e}")
+        return None
+
+
+@metrics.timed('scroll_to_load_more')
+def scroll_to_load_more(driver, scrollable_div, scroll_attempts=3, wait_profile=DEFAULT_WAIT_PROFILE):
+    """Scroll to load more reviews, returning as soon as new content renders"""
+    try:
+        before = get_panel_state(driver, scrollable_div)
+        if not before or not before['height']:
+            return False
+
+        for attempt in range(scroll_attempts):
+            # Method 1: Scroll to bottom
+            safe_execute_script(driver, "arguments[0].scrollTop = arguments[0].scrollHeight", scrollable_div)
+            if wait_for_review_growth(driver, scrollable_div, before, wait_profile):
+                return True
+
+            # Method 2: Additional scroll with offset
+            safe_execute_script(driver, "arguments[0].scrollBy(0, 500)", scrollable_div)
+
+            # Method 3: Scroll using Page Down key
+            try:
+                scrollable_div.send_keys(Keys.PAGE_DOWN)
+            except:
+                pass
+
+            if wait_for_review_growth(driver, scrollable_div, before, wait_profile):
+                return True
+
+            print(f"Scroll attempt {attempt + 1}/{scroll_attempts} - no new content loaded")
+
+        return False
+
+    except Exception as e:
+        print(f"Error scrolling: {e}")
+        return False
+
+
+@metrics.timed('aggressive_scroll_and_wait')
+def aggressive_scroll_and_wait(driver, scrollable_div, wait_time=3, wait_profile=DEFAULT_WAIT_PROFILE):
+    """Aggressive scrolling when no new content is found"""
+    try:
+        print("Performing aggressive scrolling to load more content...")
+        before = get_panel_state(driver, scrollable_div)
+
+        techniques = [
+            lambda: safe_execute_script(driver, "arguments[0].scrollTop = arguments[0].scrollHeight", scrollable_div),
+            lambda: safe_execute_script(driver, "arguments[0].scrollBy(0, 1000)", scrollable_div),
+            lambda: scrollable_div.send_keys(Keys.END),
+            lambda: scrollable_div.send_keys(Keys.PAGE_DOWN),
+            lambda: safe_execute_script(driver, "window.scrollTo(0, document.body.scrollHeight)"),
+        ]
+
+        for i, technique in enumerate(techniques):
+            try:
+                technique()
+                print(f"Applied scroll technique {i+1}")
+            except:
+                continue
+
+        # Try to trigger lazy loading
+        safe_execute_script(driver, """
+            var event = new Event('scroll');
+            arguments[0].dispatchEvent(event);
+        """, scrollable_div)
+
+        # Wait for content to load, up to wait_time
+        if wait_for_review_growth(driver, scrollable_div, before, wait_profile.with_timeout(wait_time)):
+            print("New content loaded")
+        return True
+
+    except Exception as e:
+        print(f"Error in aggressive scrolling: {e}")
+        return False
@@ -0,0 +1,204 @@
+"""Near-duplicate reviews: MinHash signatures with LSH banding.
+
+Overlapping scrapes of one place leave copies of the same review that are not
+exact duplicates: a truncated text with a trailing "Lainnya", a leftover
+translate marker, slightly different whitespace. Each review_text is cut into
+character shingles, MinHash signatures are bucketed per band (so only reviews
+sharing a bucket are compared, instead of all pairs), and candidates are
+confirmed on the actual shingle sets. Truncated copies have a low Jaccard
+score against the full text, so reviews that share a text prefix are also
+paired and confirmed by containment. Everything is scoped per wisata.
+"""
+import re
+
+import numpy as np
+import pandas as pd
+
+SHINGLE_SIZE = 5
+NUM_PERM = 128
+BANDS = 16                      # 16 bands x 8 rows: ~50% chance of pairing at Jaccard 0.7
+JACCARD_THRESHOLD = 0.8
+CONTAINMENT_THRESHOLD = 0.9     # share of the shorter text's shingles found in the longer one
+PREFIX_LENGTH = 60              # normalized characters that must match for the truncation check
+MIN_SHINGLES = 8                # shorter texts ("Bagus", "Mantap") are left alone
+
+_MERSENNE_PRIME = (1 << 31) - 1
+_SHINGLE_BASE = 1_000_003
+_PERMUTATION_SEED = 20250801
+
+TRAILING_MORE_RE = re.compile(r'\s*\b(?:lainnya|more)\s*$', re.IGNORECASE)
+NON_WORD_RE = re.compile(r'[^\w]+')
+
+
+def normalize_for_shingles(text):
+    """Lowercase words only, without the "Lainnya" left by an unexpanded review"""
+    if not isinstance(text, str):
+        return ''
+    text = TRAILING_MORE_RE.sub('', text)
+    return NON_WORD_RE.sub(' ', text.lower()).strip()
+
+
+def shingle_hashes(text, size=SHINGLE_SIZE):
+    """Sorted unique hashes of the character ``size``-grams of a normalized text"""
+    if len(text) < size:
+        return np.empty(0, dtype=np.uint64)
+    codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32).astype(np.uint64)
+    count = len(codes) - size + 1
+    hashes = np.zeros(count, dtype=np.uint64)
+    for offset in range(size):
+        hashes = (hashes * _SHINGLE_BASE + codes[offset:offset + count]) % _MERSENNE_PRIME
+    return np.unique(hashes)
+
+
+class MinHasher:
+    """``num_perm`` multiply-shift hash functions (high 32 bits of a*x + b mod 2**64), fixed seed"""
+
+    def __init__(self, num_perm=NUM_PERM, seed=_PERMUTATION_SEED):
+        rng = np.random.RandomState(seed)
+        self.a = (rng.randint(0, 1 << 62, size=num_perm, dtype=np.uint64) * 2 + 1)[:, None]
+        self.b = rng.randint(0, 1 << 62, size=num_perm, dtype=np.uint64)[:, None]
+
+    def signature(self, hashes):
+        # uint64 arithmetic wraps, which is the mod 2**64 the scheme needs
+        return ((self.a * hashes[None, :] + self.b) >> np.uint64(32)).min(axis=1).astype(np.uint32)
+
+
+class _DisjointSet:
+    def __init__(self):
+        self.parent = {}
+
+    def find(self, item):
+        parent = self.parent.setdefault(item, item)
+        if parent != item:
+            parent = self.parent[item] = self.find(parent)
+        return parent
+
+    def union(self, left, right):
+        left, right = self.find(left), self.find(right)
+        if left != right:
+            self.parent[max(left, right)] = min(left, right)
+
+
+def _similar(left, right):
+    """``(is_duplicate, jaccard, containment)`` of two shingle hash arrays"""
+    common = len(np.intersect1d(left, right, assume_unique=True))
+    jaccard = common / (len(left) + len(right) - common)
+    containment = common / min(len(left), len(right))
+    return jaccard >= JACCARD_THRESHOLD or containment >= CONTAINMENT_THRESHOLD, jaccard, containment
+
+
+def _candidate_pairs(signatures, prefixes, bands):
+    """Pairs of positions sharing an LSH bucket or a text prefix"""
+    buckets = []
+    rows = signatures.shape[1] // bands
+    for band in range(bands):
+        _, inverse, counts = np.unique(signatures[:, band * rows:(band + 1) * rows], axis=0,
+                                       return_inverse=True, return_counts=True)
+        # Group positions by bucket once per band (a scan per bucket is quadratic)
+        order = np.argsort(inverse.ravel(), kind='stable')
+        for members, count in zip(np.split(order, np.cumsum(counts)[:-1]), counts):
+            if count > 1:
+                buckets.append(members.tolist())
+
+    by_prefix = {}
+    for position, prefix in enumerate(prefixes):
+        if prefix:
+            by_prefix.setdefault(prefix, []).append(position)
+    buckets.extend(members for members in by_prefix.values() if len(members) > 1)
+
+    pairs = set()
+    for members in buckets:
+        for i in range(len(members)):
+            for j in range(i + 1, len(members)):
+                pairs.add((members[i], members[j]))
+    return pairs
+
+
+def _canonical(df, members):
+    """Keep the most complete copy: longest text, then one with a visit time, then the first"""
+    def rank(index):
+        text = df.at[index, 'review_text']
+        visit_time = df.at[index, 'visit_time'] if 'visit_time' in df.columns else ''
+        has_visit_time = isinstance(visit_time, str) and visit_time not in ('', 'Tidak diketahui')
+        return (-len(text) if isinstance(text, str) else 0, not has_visit_time, members.index(index))
+    return min(members, key=rank)
+
+
+def find_near_duplicates(df, group_column='wisata', same_reviewer=True, bands=BANDS, num_perm=NUM_PERM):
+    """Cluster near-duplicate reviews within each ``group_column`` value.
+
+    With ``same_reviewer`` two reviews only match if their reviewer names
+    agree (ignoring case), so short stock phrases from different people are
+    not merged. Returns one row per clustered review: ``cluster``, ``index``
+    (label in ``df``), ``canonical`` (the copy to keep), ``canonical_index``,
+    ``jaccard`` and ``containment`` against the canonical copy.
+    """
+    hasher = MinHasher(num_perm)
+    records = []
+    cluster_id = 0
+
+    groups = df.groupby(group_column, sort=False).groups if group_column in df.columns else {None: df.index}
+    for _, labels in groups.items():
+        texts = [normalize_for_shingles(text) for text in df.loc[labels, 'review_text']]
+        positions, shingles = [], []
+        for position, text in enumerate(texts):
+            hashes = shingle_hashes(text)
+            if len(hashes) >= MIN_SHINGLES:
+                positions.append(position)
+                shingles.append(hashes)
+        if len(positions) < 2:
+            continue
+
+        signatures = np.vstack([hasher.signature(hashes) for hashes in shingles])
+        prefixes = [texts[position][:PREFIX_LENGTH] if len(texts[position]) >= PREFIX_LENGTH else ''
+                    for position in positions]
+        if same_reviewer:
+            names = df.loc[labels, 'reviewer_name'].fillna('').astype(str).str.strip().str.lower().tolist()
+
+        clusters = _DisjointSet()
+        for left, right in _candidate_pairs(signatures, prefixes, bands):
+            if same_reviewer and names[positions[left]] != names[positions[right]]:
+                continue
+            if _similar(shingles[left], shingles[right])[0]:
+                clusters.union(left, right)
+
+        members_by_root = {}
+        for member in clusters.parent:
+            members_by_root.setdefault(clusters.find(member), []).append(member)
+
+        for members in members_by_root.values():
+            if len(members) < 2:
+                continue
+            members.sort()
+            member_labels = [labels[positions[member]] for member in members]
+            canonical_label = _canonical(df, member_labels)
+            canonical_shingles = shingles[members[member_labels.index(canonical_label)]]
+            for member, label in zip(members, member_labels):
+                _, jaccard, containment = _similar(shingles[member], canonical_shingles)
+                records.append({
+                    'cluster': cluster_id,
+                    'index': label,
+                    'canonical': label == canonical_label,
+                    'canonical_index': canonical_label,
+                    'jaccard': round(jaccard, 3),
+                    'containment': round(containment, 3),
+                })
+            cluster_id += 1
+
+    return pd.DataFrame(records, columns=['cluster', 'index', 'canonical', 'canonical_index', 'jaccard', 'containment'])
+
+
+def drop_near_duplicates(df, clusters):
+    """``df`` without the non-canonical members of ``clusters``"""
+    if clusters.empty:
+        return df
+    return df.drop(index=clusters.loc[~clusters['canonical'], 'index'])
+
+
+def cluster_report(df, clusters, columns=('wisata', 'reviewer_name', 'rating', 'review_text')):
+    """Clusters joined with the review columns, canonical copy first in each cluster"""
+    if clusters.empty:
+        return clusters
+    columns = [column for column in columns if column in df.columns]
+    report = clusters.join(df[columns], on='index')
+    return report.sort_values(['cluster', 'canonical'], ascending=[True, False], kind='stable').reset_index(drop=True)
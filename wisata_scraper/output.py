@@ -0,0 +1,245 @@
+"""Writing scraped reviews to the hasil scraping folders"""
+import glob
+import json
+import os
+from collections import Counter
+from datetime import datetime
+
+import pandas as pd
+
+from .records import ReviewBuffer
+
+OUTPUT_FOLDER = "hasil scraping"
+LOW_RATING_OUTPUT_FOLDER = "hasil scraping rating rendah"
+
+# review_id and fingerprint go last so readers selecting the original columns by name are unaffected
+REVIEW_COLUMNS = ['reviewer_name', 'rating', 'date', 'visit_time', 'review_text', 'review_id', 'fingerprint', 'scraped_at']
+LOW_RATING_COLUMNS = ['reviewer_name', 'rating', 'date', 'visit_time', 'review_text', 'wisata', 'review_id', 'fingerprint', 'scraped_at']
+
+FORMAT_JSONL = 'jsonl'
+FORMAT_PARQUET = 'parquet'
+FORMAT_CSV = 'csv'
+OUTPUT_FORMATS = [FORMAT_JSONL, FORMAT_PARQUET, FORMAT_CSV]
+
+# Rows per Parquet row group when a finished JSONL file is rolled up
+PARQUET_ROW_GROUP_SIZE = 500
+
+
+def create_output_folder(folder_path=OUTPUT_FOLDER):
+    """Create the output folder if it doesn't exist"""
+    if not os.path.exists(folder_path):
+        os.makedirs(folder_path)
+        print(f"Created folder: {folder_path}")
+    return folder_path
+
+
+def reviews_frame(reviews, columns):
+    """DataFrame of ``columns`` from a ReviewBuffer or a list of reviews (dicts or Review)"""
+    if not isinstance(reviews, ReviewBuffer):
+        reviews = ReviewBuffer(reviews)
+    return reviews.to_frame(columns)
+
+
+def save_reviews(place, reviews, output_folder=OUTPUT_FOLDER, label='ALL'):
+    """Save all reviews plus the with-visit-time subset for a place.
+
+    ``reviews`` is a ReviewBuffer or a list of review dicts.
+    ``label`` names the full file, e.g. 'NEW' for an incremental refresh.
+    """
+    saved_files = []
+    if not reviews:
+        return saved_files
+
+    create_output_folder(output_folder)
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    prefix = place['output_prefix']
+
+    df_all = reviews_frame(reviews, REVIEW_COLUMNS)
+    all_filename = os.path.join(output_folder, f'{prefix}_{label}_reviews_{timestamp}.csv')
+    df_all.to_csv(all_filename, index=False, encoding='utf-8-sig')
+    saved_files.append(all_filename)
+    print(f"Data saved to {all_filename}")
+
+    has_visit_time = df_all['visit_time'].fillna('').astype(str) != ''
+    if has_visit_time.any():
+        df = df_all[has_visit_time]
+        csv_filename = os.path.join(output_folder, f'{prefix}_reviews_with_visit_time_{timestamp}.csv')
+        df.to_csv(csv_filename, index=False, encoding='utf-8-sig')
+        saved_files.append(csv_filename)
+        print(f"Data saved to {csv_filename}")
+
+        json_filename = os.path.join(output_folder, f'{prefix}_reviews_with_visit_time_{timestamp}.json')
+        with open(json_filename, 'w', encoding='utf-8') as f:
+            json.dump(df.to_dict('records'), f, ensure_ascii=False, indent=2)
+        saved_files.append(json_filename)
+        print(f"JSON data saved to {json_filename}")
+
+    valid_ratings = df_all[df_all['rating'] > 0]['rating']
+    if len(valid_ratings) > 0:
+        print(f"\nAverage rating: {valid_ratings.mean():.2f}")
+        print("Rating distribution:")
+        print(df_all['rating'].value_counts().sort_index())
+
+    return saved_files
+
+
+def save_low_rating_reviews(place, reviews, output_folder=LOW_RATING_OUTPUT_FOLDER):
+    """Save 1-3 star reviews with text for a place"""
+    saved_files = []
+    if not reviews:
+        print("No qualifying reviews found matching the criteria")
+        return saved_files
+
+    create_output_folder(output_folder)
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+    df = reviews_frame(reviews, LOW_RATING_COLUMNS)
+    csv_filename = os.path.join(output_folder, f"{place['low_rating_prefix']}_reviews_1to3stars_with_text_{timestamp}.csv")
+    df.to_csv(csv_filename, index=False, encoding='utf-8-sig')
+    saved_files.append(csv_filename)
+    print(f"Data saved to: {csv_filename}")
+
+    print("Rating distribution (1-3 stars only):")
+    for rating, count in df['rating'].value_counts().sort_index().items():
+        print(f"  {rating} stars: {count} reviews")
+
+    return saved_files
+
+
+class ReviewSink:
+    """Append-only JSONL writer: each review is written once, as it is parsed.
+
+    Nothing is kept in memory beyond the rating counts for the summary, and an
+    interrupted run still leaves a readable file. ``close`` can roll the JSONL
+    into a Parquet file (needs pyarrow).
+    """
+
+    def __init__(self, path, columns=REVIEW_COLUMNS, output_format=FORMAT_JSONL):
+        self.path = path
+        self.columns = columns
+        self.output_format = output_format
+        self.count = 0
+        self.rating_counts = Counter()
+        self._pending = []
+        self._file = None
+
+    def write(self, review):
+        record = {column: review.get(column, '') for column in self.columns}
+        self._pending.append(json.dumps(record, ensure_ascii=False))
+        self.count += 1
+        self.rating_counts[record.get('rating') or 0] += 1
+
+    def flush(self):
+        if not self._pending:
+            return
+        if self._file is None:
+            create_output_folder(os.path.dirname(self.path) or '.')
+            self._file = open(self.path, 'a', encoding='utf-8')
+        self._file.write('\n'.join(self._pending) + '\n')
+        self._file.flush()
+        self._pending = []
+
+    def close(self):
+        """Flush and close; returns the final file path (None if nothing was written)"""
+        self.flush()
+        if self._file is None:
+            return None
+        self._file.close()
+        self._file = None
+        print(f"Data saved to {self.path} ({self.count} reviews)")
+
+        if self.output_format == FORMAT_PARQUET:
+            parquet_path = jsonl_to_parquet(self.path, columns=self.columns)
+            if parquet_path:
+                os.remove(self.path)
+                self.path = parquet_path
+        return self.path
+
+    def print_summary(self):
+        valid = {rating: count for rating, count in self.rating_counts.items() if rating}
+        if not valid:
+            return
+        total = sum(valid.values())
+        average = sum(rating * count for rating, count in valid.items()) / total
+        print(f"\nAverage rating: {average:.2f}")
+        print("Rating distribution:")
+        for rating in sorted(self.rating_counts):
+            print(f"  {rating}: {self.rating_counts[rating]}")
+
+
+def open_review_sink(place, output_folder=OUTPUT_FOLDER, label='ALL', output_format=FORMAT_JSONL, timestamp=None):
+    """Sink for a place's main crawl: <prefix>_<label>_reviews_<ts>.jsonl"""
+    timestamp = timestamp or datetime.now().strftime('%Y%m%d_%H%M%S')
+    path = os.path.join(output_folder, f"{place['output_prefix']}_{label}_reviews_{timestamp}.jsonl")
+    return ReviewSink(path, REVIEW_COLUMNS, output_format)
+
+
+def open_low_rating_sink(place, output_folder=LOW_RATING_OUTPUT_FOLDER, output_format=FORMAT_JSONL, timestamp=None):
+    """Sink for a low-rating crawl: <low prefix>_reviews_1to3stars_with_text_<ts>.jsonl"""
+    timestamp = timestamp or datetime.now().strftime('%Y%m%d_%H%M%S')
+    path = os.path.join(output_folder, f"{place['low_rating_prefix']}_reviews_1to3stars_with_text_{timestamp}.jsonl")
+    return ReviewSink(path, LOW_RATING_COLUMNS, output_format)
+
+
+def jsonl_to_parquet(jsonl_path, columns=REVIEW_COLUMNS, row_group_size=PARQUET_ROW_GROUP_SIZE):
+    """Roll a JSONL file into Parquet row groups without loading it whole.
+
+    Returns the Parquet path, or None when pyarrow is not installed.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        print("pyarrow is not installed; keeping JSONL output")
+        return None
+
+    parquet_path = os.path.splitext(jsonl_path)[0] + '.parquet'
+    writer = None
+    try:
+        for chunk in pd.read_json(jsonl_path, lines=True, dtype=False, convert_dates=False,
+                                  keep_default_dates=False, chunksize=row_group_size):
+            chunk = chunk.reindex(columns=columns, fill_value='')
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(parquet_path, table.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if writer is None:
+        return None
+    print(f"Rolled into {parquet_path}")
+    return parquet_path
+
+
+def read_reviews(paths, with_visit_time=False):
+    """Load saved reviews (.jsonl, .parquet or .csv; paths or glob patterns).
+
+    ``with_visit_time`` keeps only reviews that have a visit time; this
+    replaces the separate *_with_visit_time_* files.
+    """
+    if isinstance(paths, str):
+        paths = [paths]
+    files = sorted(path for pattern in paths for path in glob.glob(pattern))
+
+    frames = []
+    for path in files:
+        if path.endswith('.jsonl'):
+            df = pd.read_json(path, lines=True, dtype=False, convert_dates=False, keep_default_dates=False)
+        elif path.endswith('.parquet'):
+            df = pd.read_parquet(path)
+        elif path.endswith('.csv'):
+            df = pd.read_csv(path)
+        else:
+            continue
+        frames.append(df)
+
+    if not frames:
+        return pd.DataFrame(columns=REVIEW_COLUMNS)
+    df = pd.concat(frames, ignore_index=True)
+
+    if with_visit_time and 'visit_time' in df.columns:
+        visit_time = df['visit_time'].fillna('').astype(str).str.strip()
+        df = df[visit_time != ''].reset_index(drop=True)
+    return df
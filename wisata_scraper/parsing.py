@@ -0,0 +1,294 @@
+"""DOM-free parsing of review text into review records"""
+import re
+import time
+
+OWNER_INDICATORS = [
+    'tanggapan dari pemilik',
+    'response from the owner',
+    'balasan dari pemilik',
+    'respons dari pemilik'
+]
+
+STOP_SCRAPING = "STOP_SCRAPING"
+
+VISIT_TIME_CATEGORIES = ['Akhir pekan', 'Hari biasa', 'Hari libur nasional', 'Tidak diketahui']
+
+# Precompiled once; parse_review_text runs for every review of every scroll
+OWNER_RE = re.compile('|'.join(re.escape(indicator) for indicator in OWNER_INDICATORS))
+NAME_SKIP_RE = re.compile(r'ulasan|foto|local guide')
+TEXT_SKIP_RE = re.compile(r'local guide|ulasan|foto|waktu kunjungan|suka|bagikan|lainnya')
+TEXT_START_RE = re.compile(r'lalu|kemarin|hari ini')
+MONTH_RE = re.compile(r'januari|februari|maret|april|mei|juni|juli|agustus|september|oktober|november|desember')
+
+# In priority order: a line matching several keeps the first pattern's phrase
+DATE_PATTERNS = [
+    re.compile(r'(\d+\s*(?:minggu|bulan|hari|tahun|jam)\s*lalu)'),
+    re.compile(r'(seminggu lalu|sebulan lalu|setahun lalu)'),
+    re.compile(r'(kemarin|hari ini)'),
+]
+DATE_ANY_RE = re.compile('|'.join(pattern.pattern for pattern in DATE_PATTERNS))
+DIGITS_RE = re.compile(r'(\d+)')
+
+# The old per-pattern loop removed these one after another. '(Terjemahan
+# Google)' is left out: 'Terjemahan Google' was always removed before it.
+TRANSLATE_MARKER_RE = re.compile('|'.join([
+    r'Diterjemahkan oleh Google\s*[·•・]\s*Lihat versi asli\s*\([^)]+\)',
+    r'Diterjemahkan oleh Google',
+    r'Lihat versi asli\s*\([^)]+\)',
+    r'Terjemahan Google',
+    r'Terjemahan otomatis',
+    r'Awalnya diposting di Google',
+    r'Translated by Google\s*[·•・]\s*View original\s*\([^)]+\)',
+    r'Translated by Google',
+    r'View original\s*\([^)]+\)',
+    r'Originally posted on Google',
+    r'Automatic translation',
+]), re.IGNORECASE)
+# Every marker above contains one of these (lowercase); texts without any skip the regex
+TRANSLATE_MARKER_HINTS = ('google', 'versi asli', 'terjemahan', 'view original', 'automatic translation')
+CLOCK_TIME_RE = re.compile(r'\b\d{1,2}:\d{2}\b')
+PLUS_COUNT_RE = re.compile(r'\+\d+')
+SEPARATOR_RE = re.compile(r'[·•・]+')
+LOCAL_GUIDE_SUFFIX_RE = re.compile(r'Local Guide.*', re.IGNORECASE)
+SEPARATOR_SUFFIX_RE = re.compile(r'[·•・].*')
+REVIEW_COUNT_SUFFIX_RE = re.compile(r'\d+\s*(ulasan|review).*', re.IGNORECASE)
+
+
+def is_owner_text(text):
+    """Check if a review element's text starts as an owner response"""
+    preview = (text or "")[:100].lower()
+    return any(indicator in preview for indicator in OWNER_INDICATORS)
+
+
+def clean_reviewer_name(name_text):
+    """Extract only the reviewer name"""
+    if not name_text:
+        return "Unknown"
+
+    lines = name_text.strip().split('\n')
+    if lines:
+        name = lines[0].strip()
+        name = LOCAL_GUIDE_SUFFIX_RE.sub('', name).strip()
+        name = SEPARATOR_SUFFIX_RE.sub('', name).strip()
+        name = REVIEW_COUNT_SUFFIX_RE.sub('', name).strip()
+        return name if name else "Unknown"
+
+    return "Unknown"
+
+
+def _may_have_translate_marker(text):
+    lower = text.lower()
+    if any(hint in lower for hint in TRANSLATE_MARKER_HINTS):
+        return True
+    # IGNORECASE also matches 'ſ', 'ı' and 'İ' (lowercased to i + U+0307) against ASCII letters
+    return not lower.isascii() and ('ſ' in lower or 'ı' in lower or '\u0307' in lower)
+
+
+def clean_review_text(text):
+    """Clean review text, including Google Translate markers"""
+    if not text:
+        return ""
+
+    try:
+        if _may_have_translate_marker(text):
+            text = TRANSLATE_MARKER_RE.sub('', text)
+        text = CLOCK_TIME_RE.sub('', text)
+        text = PLUS_COUNT_RE.sub('', text)
+        text = SEPARATOR_RE.sub(' ', text)
+
+        # Same as collapsing \s+ to one space and stripping
+        return ' '.join(text.split())
+
+    except Exception as e:
+        return text.strip() if text else ""
+
+
+def categorize_visit_time(visit_time_text):
+    """Categorize visit time with priority system"""
+    if not visit_time_text:
+        return "Tidak diketahui"
+
+    visit_time_lower = visit_time_text.lower().strip()
+
+    # Priority 1: Holiday patterns (highest priority)
+    holiday_patterns = [
+        'libur', 'holiday', 'cuti', 'liburan', 'natal', 'tahun baru', 'idul fitri',
+        'lebaran', 'nyepi', 'waisak', 'kemerdekaan', 'kartini', 'hari raya',
+        'long weekend', 'libur panjang', 'hari libur', 'public holiday',
+        'national holiday', 'festive', 'celebration', 'vacation'
+    ]
+    if any(pattern in visit_time_lower for pattern in holiday_patterns):
+        return "Hari libur nasional"
+
+    # Priority 2: Weekend patterns
+    weekend_patterns = [
+        'sabtu', 'minggu', 'weekend', 'akhir pekan', 'saturday', 'sunday',
+        'sabtu minggu', 'fin de semana', 'week end'
+    ]
+    if any(pattern in visit_time_lower for pattern in weekend_patterns):
+        return "Akhir pekan"
+
+    # Priority 3: Weekday patterns
+    weekday_patterns = [
+        'senin', 'selasa', 'rabu', 'kamis', 'jumat', 'hari kerja', 'weekday',
+        'monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'hari biasa',
+        'working day', 'work day'
+    ]
+    if any(pattern in visit_time_lower for pattern in weekday_patterns):
+        return "Hari biasa"
+
+    return "Tidak diketahui"
+
+
+def parse_rating_label(aria_label):
+    """Extract star rating from an aria-label like '5 bintang' or '5 stars'"""
+    if aria_label and ('bintang' in aria_label.lower() or 'star' in aria_label.lower()):
+        match = DIGITS_RE.search(aria_label)
+        if match:
+            return int(match.group(1))
+    return 0
+
+
+def _first_date(lower):
+    """Date phrase of a line, trying the patterns in their priority order"""
+    for pattern in DATE_PATTERNS:
+        match = pattern.search(lower)
+        if match:
+            return match.group(1)
+    return ""
+
+
+def parse_review_text(raw_text, aria_rating=''):
+    """Parse a review element's text and aria rating into a review record.
+
+    Pure string work (no WebDriver), so stored raw text can be re-parsed
+    offline. One pass over the lines, lowercasing each line once; gives the
+    same result as the old line-by-line searches (``parsing_reference``).
+    Returns None for empty text and owner responses.
+    """
+    try:
+        if not raw_text or is_owner_text(raw_text):
+            return None
+
+        lines = raw_text.split('\n')
+        # str.lower never adds or removes newlines, so the lines stay aligned
+        lower_lines = raw_text.lower().split('\n')
+        rating = parse_rating_label(aria_rating)
+
+        reviewer_name = None
+        date = ""
+        visit_time = None
+        visit_time_pending = False
+        month_line = None
+        collecting = False
+        collecting_done = False
+        review_lines = []
+
+        previous = ""
+        for index, line in enumerate(lines):
+            lower = lower_lines[index]
+            # Everything from the owner response on belongs to the owner
+            if OWNER_RE.search(lower):
+                break
+            stripped = line.strip()
+
+            if reviewer_name is None:
+                if stripped and not NAME_SKIP_RE.search(lower):
+                    reviewer_name = stripped
+                elif 'Local Guide' in line and index > 0:
+                    reviewer_name = previous.strip()
+
+            if not date and DATE_ANY_RE.search(lower):
+                date = _first_date(lower)
+
+            if visit_time_pending:
+                visit_time = stripped
+                visit_time_pending = False
+            has_visit_label = 'waktu kunjungan' in lower
+            if visit_time is None and has_visit_label:
+                visit_time_pending = True
+            if month_line is None and len(line) < 50 and MONTH_RE.search(lower):
+                month_line = stripped
+
+            if collecting:
+                if not collecting_done:
+                    if has_visit_label:
+                        collecting_done = True
+                    elif len(stripped) > 10 and not TEXT_SKIP_RE.search(lower):
+                        review_lines.append(stripped)
+            elif TEXT_START_RE.search(lower):
+                collecting = True
+
+            previous = line
+
+        if not (rating > 0 and date):
+            review_lines = []
+
+        return {
+            'reviewer_name': clean_reviewer_name(reviewer_name or ""),
+            'rating': rating,
+            'date': date,
+            'visit_time': visit_time or month_line or "",
+            'review_text': clean_review_text(' '.join(review_lines)),
+        }
+
+    except Exception as e:
+        return None
+
+
+# Older name, still used by callers outside the package
+parse_review_from_text = parse_review_text
+
+
+def check_parity(samples):
+    """Compare parse_review_text with the old parser on ``(raw_text, aria_rating)`` pairs.
+
+    Prints both timings and returns the list of ``(sample, expected, got)`` mismatches.
+    """
+    from . import parsing_reference as reference
+
+    start = time.perf_counter()
+    expected = [reference.parse_review_from_text(text, rating) for text, rating in samples]
+    reference_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    got = [parse_review_text(text, rating) for text, rating in samples]
+    fast_seconds = time.perf_counter() - start
+
+    mismatches = [(sample, old, new) for sample, old, new in zip(samples, expected, got) if old != new]
+    print(f"{len(samples)} reviews: old parser {reference_seconds * 1e6 / max(len(samples), 1):.1f} us/review, "
+          f"parse_review_text {fast_seconds * 1e6 / max(len(samples), 1):.1f} us/review, "
+          f"mismatches {len(mismatches)}")
+    return mismatches
+
+
+def filter_low_rating(review_data, wisata_name):
+    """Apply the low-rating crawl rules to a parsed review.
+
+    Returns ``(review_data, None)`` for a 1-3 star review with meaningful text,
+    ``(None, STOP_SCRAPING)`` once a 4-5 star review shows up under the
+    'Rating terendah' sort, and ``(None, None)`` otherwise.
+    """
+    if not review_data:
+        return None, None
+
+    rating = review_data.get('rating', 0)
+    if rating in [4, 5]:
+        return None, STOP_SCRAPING
+
+    if rating not in [1, 2, 3]:
+        return None, None
+
+    review_text = review_data.get('review_text', '')
+    if not review_text or len(review_text.strip()) < 4:
+        return None, None
+
+    # Reject text that is mostly symbols or numbers
+    if len(re.sub(r'[^a-zA-Z\u00C0-\u017F\u0400-\u04FF\u4e00-\u9fff]', '', review_text)) < 5:
+        return None, None
+
+    review_data = dict(review_data)
+    review_data['visit_time'] = categorize_visit_time(review_data.get('visit_time', ''))
+    review_data['wisata'] = wisata_name
+    return review_data, None
+
@@ -0,0 +1,239 @@
+"""Review text parsing exactly as the scrapers had it before parse_review_text.
+
+Kept only as the reference for ``parsing.check_parity``; the scrapers use
+the single-pass parser in ``wisata_scraper.parsing``. Parity check and
+per-review timings on text rendered from saved reviews::
+
+    python -m wisata_scraper.parsing_reference "hasil scraping/*.csv"
+"""
+import re
+
+from .parsing import OWNER_INDICATORS, is_owner_text
+
+
+def clean_reviewer_name(name_text):
+    """Extract only the reviewer name"""
+    if not name_text:
+        return "Unknown"
+
+    lines = name_text.strip().split('\n')
+    if lines:
+        name = lines[0].strip()
+        name = re.sub(r'Local Guide.*', '', name, flags=re.IGNORECASE).strip()
+        name = re.sub(r'[·•・].*', '', name).strip()
+        name = re.sub(r'\d+\s*(ulasan|review).*', '', name, flags=re.IGNORECASE).strip()
+        return name if name else "Unknown"
+
+    return "Unknown"
+
+
+def clean_review_text(text):
+    """Clean review text, including Google Translate markers"""
+    if not text:
+        return ""
+
+    try:
+        google_translate_patterns = [
+            r'Diterjemahkan oleh Google\s*[·•・]\s*Lihat versi asli\s*\([^)]+\)',
+            r'Diterjemahkan oleh Google',
+            r'Lihat versi asli\s*\([^)]+\)',
+            r'Terjemahan Google',
+            r'Terjemahan otomatis',
+            r'\(Terjemahan Google\)',
+            r'Awalnya diposting di Google',
+            r'Translated by Google\s*[·•・]\s*View original\s*\([^)]+\)',
+            r'Translated by Google',
+            r'View original\s*\([^)]+\)',
+            r'Originally posted on Google',
+            r'Automatic translation',
+        ]
+
+        for pattern in google_translate_patterns:
+            text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+
+        text = re.sub(r'\b\d{1,2}:\d{2}\b', '', text)
+        text = re.sub(r'\+\d+', '', text)
+        text = re.sub(r'[·•・]+', ' ', text)
+        text = re.sub(r'\s+', ' ', text)
+
+        return text.strip()
+
+    except Exception as e:
+        return text.strip() if text else ""
+
+
+def parse_rating_label(aria_label):
+    """Extract star rating from an aria-label like '5 bintang' or '5 stars'"""
+    if aria_label and ('bintang' in aria_label.lower() or 'star' in aria_label.lower()):
+        match = re.search(r'(\d+)', aria_label)
+        if match:
+            return int(match.group(1))
+    return 0
+
+
+def parse_review_from_text(full_text, aria_rating=''):
+    """Parse review fields from the element text and aria rating (no WebDriver calls)"""
+    try:
+        if not full_text or is_owner_text(full_text):
+            return None
+
+        review_data = {}
+        lines = full_text.split('\n')
+
+        # Drop the owner response section so it never leaks into the user's fields
+        for i, line in enumerate(lines):
+            if any(indicator in line.lower() for indicator in OWNER_INDICATORS):
+                lines = lines[:i]
+                break
+
+        # Extract reviewer name
+        reviewer_name = ""
+        for i, line in enumerate(lines):
+            if line.strip() and not any(x in line.lower() for x in ['ulasan', 'foto', 'local guide']):
+                reviewer_name = line.strip()
+                break
+            elif 'Local Guide' in line:
+                if i > 0:
+                    reviewer_name = lines[i-1].strip()
+                    break
+
+        review_data['reviewer_name'] = clean_reviewer_name(reviewer_name)
+
+        # Extract rating
+        rating = parse_rating_label(aria_rating)
+        review_data['rating'] = rating
+
+        # Extract date
+        date = ""
+        date_patterns = [
+            r'(\d+\s*(minggu|bulan|hari|tahun|jam)\s*lalu)',
+            r'(seminggu lalu|sebulan lalu|setahun lalu)',
+            r'(kemarin|hari ini)'
+        ]
+
+        for line in lines:
+            for pattern in date_patterns:
+                match = re.search(pattern, line.lower())
+                if match:
+                    date = match.group(1)
+                    break
+            if date:
+                break
+
+        review_data['date'] = date
+
+        # Extract visit time
+        visit_time = ""
+        for i, line in enumerate(lines):
+            if 'waktu kunjungan' in line.lower():
+                if i + 1 < len(lines):
+                    visit_time = lines[i + 1].strip()
+                    break
+
+        if not visit_time:
+            month_patterns = ['januari', 'februari', 'maret', 'april', 'mei', 'juni',
+                              'juli', 'agustus', 'september', 'oktober', 'november', 'desember']
+            for line in lines:
+                for month in month_patterns:
+                    if month in line.lower() and len(line) < 50:
+                        visit_time = line.strip()
+                        break
+                if visit_time:
+                    break
+
+        review_data['visit_time'] = visit_time
+
+        # Extract review text
+        review_lines = []
+        skip_keywords = ['local guide', 'ulasan', 'foto', 'waktu kunjungan', 'suka', 'bagikan', 'lainnya']
+        start_collecting = False
+
+        for line in lines:
+            if rating > 0 and date and not start_collecting:
+                if any(keyword in line.lower() for keyword in ['lalu', 'kemarin', 'hari ini']):
+                    start_collecting = True
+                    continue
+
+            if start_collecting:
+                if 'waktu kunjungan' in line.lower():
+                    break
+                if not any(keyword in line.lower() for keyword in skip_keywords):
+                    if line.strip() and len(line.strip()) > 10:
+                        review_lines.append(line.strip())
+
+        review_data['review_text'] = clean_review_text(' '.join(review_lines))
+
+        return review_data
+
+    except Exception as e:
+        return None
+
+
+OWNER_REPLY = "Tanggapan dari pemilik 1 bulan lalu\nTerima kasih atas kunjungannya, ditunggu kedatangan berikutnya"
+
+
+def sample_raw_texts(df, seed=0):
+    """``(raw_text, aria_rating)`` pairs shaped like review element text, from saved reviews.
+
+    Every review is rendered the way the panel shows it, then a shuffled
+    copy and a few variants (owner reply, translation marker, Local Guide
+    line, no rating) are added so edge cases of the old parser are covered.
+    """
+    import random
+
+    rng = random.Random(seed)
+    samples = []
+    for row in df.to_dict('records'):
+        def field(column, default=''):
+            value = row.get(column)
+            return default if value is None or value != value else str(value)
+
+        rating = field('rating', '0').split('.')[0]
+        lines = [field('reviewer_name', 'Unknown'), rng.choice(['3 ulasan', 'Local Guide · 24 ulasan · 57 foto']),
+                 field('date', '2 bulan lalu') or '2 bulan lalu', 'Baru']
+        lines.extend(field('review_text').split('. '))
+        if rng.random() < 0.3:
+            lines.append('Lainnya')
+        visit_time = field('visit_time')
+        if visit_time and visit_time != 'Tidak diketahui':
+            lines.extend(['Waktu kunjungan', visit_time])
+        lines.extend(['Suka', 'Bagikan'])
+        aria = f"{rating} bintang"
+
+        samples.append(('\n'.join(lines), aria))
+        samples.append(('\n'.join(lines + OWNER_REPLY.split('\n')), aria))
+        shuffled = list(lines)
+        rng.shuffle(shuffled)
+        samples.append(('\n'.join(shuffled), rng.choice([aria, '', f"{rating} stars"])))
+        variant = list(lines)
+        variant.insert(rng.randrange(len(variant) + 1),
+                       rng.choice(['Diterjemahkan oleh Google · Lihat versi asli (Inggris)', 'Local Guide',
+                                   '', 'Juli 2024', 'kemarin', 'Waktu kunjungan', 'Translated by Google']))
+        samples.append(('\n'.join(variant), aria))
+    return samples
+
+
+def main(argv=None):
+    """Run check_parity (and time both parsers) on text rendered from saved review files"""
+    import glob
+    import sys
+
+    import pandas as pd
+
+    from .parsing import check_parity
+
+    patterns = sys.argv[1:] if argv is None else argv
+    paths = sorted(path for pattern in patterns for path in glob.glob(pattern))
+    if not paths:
+        print("usage: python -m wisata_scraper.parsing_reference CSV_FILE [...]", file=sys.stderr)
+        return 1
+
+    df = pd.concat([pd.read_csv(path) for path in paths], ignore_index=True)
+    mismatches = check_parity(sample_raw_texts(df))
+    for (text, aria), expected, got in mismatches[:5]:
+        print(f"  {text[:80]!r} ({aria}): expected {expected!r}, got {got!r}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,200 @@
+"""Decoding the review-list responses Google Maps fetches while scrolling.
+
+The review panel loads its reviews as JSON-ish nested arrays (prefixed with
+the ``)]}'`` anti-XSSI guard). Decoding those gives the full review text,
+rating and id directly, without reading rendered DOM text or clicking
+'Lainnya'. No WebDriver imports here, so saved payloads can be decoded and
+checked offline::
+
+    python -m wisata_scraper.payload "hasil scraping/payloads/museum_angkut_*.json"
+"""
+import glob
+import json
+import sys
+
+from .parsing import clean_review_text, clean_reviewer_name
+
+XSSI_PREFIX = ")]}'"
+
+# URL fragments of the review-list RPCs; anything else the page fetches is ignored
+REVIEW_PAYLOAD_URL_MARKERS = ['listugcposts', 'listentitiesreviews']
+
+# Positional layouts of one review entry, per RPC. Google does not document
+# these; when a field moves, fix the path here, update the sanitized bodies in
+# tests/fixtures/payloads and re-run the decoder against the payloads saved
+# with --dump-payloads in hasil scraping/payloads.
+PAYLOAD_LAYOUTS = {
+    # /maps/rpc/listugcposts: data[2] = [[review, ...], ...]
+    'listugcposts': {
+        'reviews': (2,),
+        'entry': (0,),
+        'review_id': (0,),
+        'reviewer_name': (1, 4, 5, 0),
+        'date': (1, 6),
+        'rating': (2, 0, 0),
+        'review_text': (2, 15, 0, 0),
+    },
+    # /maps/preview/review/listentitiesreviews: data[2] = [review, ...]
+    'listentitiesreviews': {
+        'reviews': (2,),
+        'entry': (),
+        'review_id': (10,),
+        'reviewer_name': (0, 1),
+        'date': (1,),
+        'rating': (4,),
+        'review_text': (3,),
+    },
+}
+
+VISIT_TIME_LABELS = ['waktu kunjungan', 'visited on']
+
+
+def is_review_payload_url(url):
+    """Check if a captured request URL is one of the review-list RPCs"""
+    url = (url or '').lower()
+    return any(marker in url for marker in REVIEW_PAYLOAD_URL_MARKERS)
+
+
+def load_payload(body):
+    """Parse a raw response body, stripping the anti-XSSI prefix"""
+    if not isinstance(body, str):
+        return body
+    body = body.lstrip()
+    if body.startswith(XSSI_PREFIX):
+        body = body[len(XSSI_PREFIX):]
+    try:
+        return json.loads(body)
+    except ValueError:
+        return None
+
+
+def _dig(node, path):
+    """Follow a path of list indexes, returning None when it runs off the data"""
+    for index in path:
+        if not isinstance(node, list) or index >= len(node):
+            return None
+        node = node[index]
+    return node
+
+
+def _find_labelled_value(node, labels, depth=0):
+    """Find the string that follows a label such as 'Waktu kunjungan' in a nested list"""
+    if depth > 12 or not isinstance(node, list):
+        return ''
+    for i, item in enumerate(node):
+        if isinstance(item, str) and item.strip().lower() in labels:
+            for following in node[i + 1:]:
+                if isinstance(following, str) and following.strip():
+                    return following.strip()
+                value = _first_string(following)
+                if value:
+                    return value
+        elif isinstance(item, list):
+            value = _find_labelled_value(item, labels, depth + 1)
+            if value:
+                return value
+    return ''
+
+
+def _first_string(node, depth=0):
+    if isinstance(node, str):
+        return node.strip()
+    if depth > 4 or not isinstance(node, list):
+        return ''
+    for item in node:
+        value = _first_string(item, depth + 1)
+        if value:
+            return value
+    return ''
+
+
+def _detect_layout(data):
+    """Pick the layout whose paths yield an id and a rating for the first review"""
+    for name, layout in PAYLOAD_LAYOUTS.items():
+        entries = _dig(data, layout['reviews'])
+        if not isinstance(entries, list) or not entries:
+            continue
+        review = _dig(entries[0], layout['entry'])
+        review_id = _dig(review, layout['review_id'])
+        rating = _dig(review, layout['rating'])
+        if isinstance(review_id, str) and isinstance(rating, int):
+            return name
+    return None
+
+
+def decode_review_entry(review, layout):
+    """Turn one positional review entry into a review record (or None)"""
+    review_id = _dig(review, layout['review_id'])
+    if not isinstance(review_id, str) or not review_id:
+        return None
+
+    rating = _dig(review, layout['rating'])
+    reviewer_name = _dig(review, layout['reviewer_name'])
+    date = _dig(review, layout['date'])
+    review_text = _dig(review, layout['review_text'])
+
+    return {
+        'review_id': review_id,
+        'reviewer_name': clean_reviewer_name(reviewer_name if isinstance(reviewer_name, str) else ''),
+        'rating': rating if isinstance(rating, int) and 1 <= rating <= 5 else 0,
+        'date': date.strip() if isinstance(date, str) else '',
+        'visit_time': _find_labelled_value(review, VISIT_TIME_LABELS),
+        'review_text': clean_review_text(review_text if isinstance(review_text, str) else ''),
+    }
+
+
+def decode_review_payload_entries(body):
+    """Decode a review-list response body into ``(record, layout_name, entry)`` triples.
+
+    ``entry`` is the positional review the record came from, so it can be
+    stored and decoded again later (rawstore keeps it for --reparse).
+    """
+    data = load_payload(body)
+    if data is None:
+        return []
+
+    layout_name = _detect_layout(data)
+    if layout_name is None:
+        return []
+    layout = PAYLOAD_LAYOUTS[layout_name]
+
+    decoded = []
+    for entry in _dig(data, layout['reviews']) or []:
+        review = _dig(entry, layout['entry'])
+        try:
+            record = decode_review_entry(review, layout)
+        except Exception:
+            record = None
+        if record:
+            decoded.append((record, layout_name, review))
+    return decoded
+
+
+def decode_review_payload(body):
+    """Decode one review-list response body into review records, in page order"""
+    return [record for record, _, _ in decode_review_payload_entries(body)]
+
+
+def decode_payload_files(paths):
+    """Decode saved payload files (e.g. from --dump-payloads) into review records"""
+    records = []
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            records.extend(decode_review_payload(f.read()))
+    return records
+
+
+def main(argv=None):
+    """Print the reviews decoded from saved payload files as JSON lines"""
+    patterns = sys.argv[1:] if argv is None else argv
+    paths = sorted(path for pattern in patterns for path in glob.glob(pattern))
+    if not paths:
+        print("usage: python -m wisata_scraper.payload PAYLOAD_FILE [...]", file=sys.stderr)
+        return 1
+    for record in decode_payload_files(paths):
+        print(json.dumps(record, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,354 @@
+"""Registry of Batu tourist attractions scraped from Google Maps.
+
+Each entry holds the Maps URL and the per-place settings that used to be
+hardcoded in the individual ``kode scraping/scraper_*.py`` scripts:
+
+- ``name``: display name, also written to the ``wisata`` column
+- ``url``: Google Maps place URL
+- ``sort``: review sort option selected before scrolling
+- ``target_reviews``: stop after this many reviews
+- ``require_visit_time``: count only reviews with a visit time towards the target
+- ``output_prefix``: file name prefix in ``hasil scraping``
+- ``low_rating_prefix``: file name prefix in ``hasil scraping rating rendah``
+  (``None`` if the place has no low-rating crawl)
+- ``dataset``: dataset key used by the cleaning notebook
+"""
+
+PLACES = {
+    'rest_area_desa_wisata_sidomulyo': {
+        'name': 'Rest Area Desa Wisata Sidomulyo',
+        'url': 'https://www.google.com/maps/place/Rest+Area+Desa+Wisata+Sidomulyo/@-7.8529746,112.5245861,17z/data=!4m16!1m9!3m8!1s0x2e78818ddcc911db:0xa170e3d72dfdb6d3!2sRest+Area+Desa+Wisata+Sidomulyo!8m2!3d-7.8529746!4d112.5271664!9m1!1b1!16s%2Fg%2F11rghnfq1m!3m5!1s0x2e78818ddcc911db:0xa170e3d72dfdb6d3!8m2!3d-7.8529746!4d112.5271664!16s%2Fg%2F11rghnfq1m?entry=ttu&g_ep=EgoyMDI1MDcyOS4wIKXMDSoASAFQAw%3D%3D',
+        'sort': 'Paling relevan',
+        'target_reviews': 2000,
+        'require_visit_time': False,
+        'output_prefix': 'rest_area_desa_wisata_sidomulyo',
+        'low_rating_prefix': None,
+        'dataset': 'wisata_bunga_sidomulyo',
+    },
+    'wisata_bunga_sidomulyo': {
+        'name': 'Wisata Bunga Sidomulyo',
+        'url': 'https://www.google.com/maps/place/Wisata+Bunga+Sidomulyo/@-7.8629154,112.5218554,17z/data=!4m8!3m7!1s0x2e7880b4e3492419:0x1a974a92b77ecfda!8m2!3d-7.8629154!4d112.526721!9m1!1b1!16s%2Fg%2F1hm3_3pyl?entry=ttu&g_ep=EgoyMDI1MDcyOS4wIKXMDSoASAFQAw%3D%3D',
+        'sort': 'Paling relevan',
+        'target_reviews': 2000,
+        'require_visit_time': False,
+        'output_prefix': 'wisata_bunga_sidomulyo',
+        'low_rating_prefix': None,
+        'dataset': 'wisata_bunga_sidomulyo',
+    },
+    'air_terjun_coban_rais': {
+        'name': 'Air Terjun Coban Rais',
+        'url': 'https://www.google.com/maps/place/Air+Terjun+Coban+Rais/@-7.9116767,112.5158539,17z/data=!4m8!3m7!1s0x2e7886b525a4c713:0xd3724f41de186939!8m2!3d-7.9116767!4d112.5184342!9m1!1b1!16s%2Fg%2F11c3k55893?entry=ttu&g_ep=EgoyMDI1MDcyOS4wIKXMDSoASAFQAw%3D%3D',
+        'sort': 'Paling relevan',
+        'target_reviews': 2000,
+        'require_visit_time': False,
+        'output_prefix': 'air_terjun_coban_rais',
+        'low_rating_prefix': 'air_terjun_coban_rais',
+        'dataset': 'coban_rais',
+    },
+    'batu_rafting': {
+        'name': 'Batu Rafting',
+        'url': 'https://www.google.com/maps/place/Batu+Rafting/@-7.8920678,112.529986,17z/data=!3m1!4b1!4m6!3m5!1s0x2e7880ce73f7491b:0x1f26c0b1a9add0de!8m2!3d-7.8920678!4d112.5325663!16s%2Fg%2F11c56r1dph?entry=ttu&g_ep=EgoyMDI1MDgwNi4wIKXMDSoASAFQAw%3D%3D',
+        'sort': 'Paling relevan',
+        'target_reviews': 2000,
+        'require_visit_time': False,
+        'output_prefix': 'batu_rafting',
+        'low_rating_prefix': 'batu_rafting',
+        'dataset': 'batu_rafting',
+    },
+    'batu_economis_park': {
+        'name': 'Batu Economis Park',
+        'url': 'https://www.google.com/maps/place/Batu+Economis+Park/@-7.9126157,112.5460493,17z/data=!4m8!3m7!1s0x2e7881429e90d651:0x9a1524cafe5eac51!8m2!3d-7.9126157!4d112.5486296!9m1!1b1!16s%2Fg%2F11b808yyrq?entry=ttu&g_ep=EgoyMDI1MDcyOS4wIKXMDSoASAFQAw%3D%3D',
+        'sort': 'Paling relevan',
+        'target_reviews': 2000,
+        'require_visit_time': True,
+        'output_prefix': 'batu_economis_park',
+        'low_rating_prefix': 'batu_economis_park',
+        'dataset': 'batu_economis_park',
+    },
+    'batu_love_garden_baloga': {
+        'name': 'Batu Love Garden - BALOGA',
+        'url': 'https://www.google.com/maps/place/Batu+Love+Garden+-+BALOGA/@-7.8639275,112.5402616,17z/data=!4m8!3m7!1s0x2e788176c89c5edd:0xc912577baebd778d!8m2!3d-7.8639275!4d112.5428419!9m1!1b1!16s%2Fg%2F11mvpl87m4?entry=ttu&g_ep=EgoyMDI1MDcyOS4wIKXMDSoASAFQAw%3D%3D',
+        'sort': 'Paling relevan',
+        'target_reviews': 2000,
+        'require_visit_time': True,
+        'output_prefix': 'batu_love_garden_baloga',
+        'low_rating_prefix': 'batu_love_garden_baloga',
+        'dataset': 'batu_love_garden',
+    },
+    'batu_night_spectacular': {
+        'name': 'Batu Night Spectacular',
+        'url': 'https://www.google.com/maps/place/Batu+Night+Spectacular/@-7.8965265,112.5321661,17z/data=!3m1!4b1!4m6!3m5!1s0x2e7881303f2c72db:0x953ed7171a77ec21!8m2!3d-7.8965273!4d112.5345306!16s%2Fg%2F11cs693vbv?entry=ttu&g_ep=EgoyMDI1MDcyMC4wIKXMDSoASAFQAw%3D%3D',
+        'sort': 'Paling relevan',
+        'target_reviews': 2000,
+        'require_visit_time': True,
+        'output_prefix': 'batu_night_spectacular',
+        'low_rating_prefix': 'bns',
+        'dataset': 'batu_night_spectacular',
+    },
+    'coban_rais': {
+        'name': 'Coban Rais',
+        'url': 'https://www.google.com/maps/place/Coban+Rais/@-7.9151261,112.5011516,17z/data=!4m8!3m7!1s0x2e7887007c0f5147:0xdb4dc9f18e924eba!8m2!3d-7.9151261!4d112.5060172!9m1!1b1!16s%2Fg%2F11ldmjb1jz?entry=ttu&g_ep=EgoyMDI1MDczMC4wIKXMDSoASAFQAw%3D%3D',
+        'sort': 'Paling relevan',
+        'target_reviews': 2000,
+        'require_visit_time': False,
+        'output_prefix': 'coban_rais',
+        'low_rating_prefix': None,
+        'dataset': 'coban_rais',
+    },
+    'desa_wisata_punten': {
+        'name': 'Desa Wisata Punten',
+        'url': 'https://www.google.com/maps/place/Desa+Wisata+Punten/@-7.8382813,112.5253863,17z/data=!4m8!3m7!1s0x2e787fcfe5a4fa5d:0x697bf7e7ef9e217d!8m2!3d-7.8382813!4d112.5279666!9m1!1b1!16s%2Fg%2F11tm_slmn_?entry=ttu&g_ep=EgoyMDI1MDczMC4wIKXMDSoASAFQAw%3D%3D',
+        'sort': 'Paling relevan',
+        'target_reviews': 1200,
+        'require_visit_time': False,
+        'output_prefix': 'desa_wisata_punten',
+        'low_rating_prefix': None,
+        'dataset': 'desa_wisata_punten',
+    },
+    'desa_wisata_tulungrejo': {
+        'name': 'Desa Wisata Tulungrejo',
+        'url': 'https://www.google.com/maps/place/Desa+Wisata+Tulungrejo/@-7.9627545,112.3371574,17z/data=!4m8!3m7!1s0x2e788fd303d923e9:0x99f459de2b102570!8m2!3d-7.9627545!4d112.3397377!9m1!1b1!16s%2Fg%2F11q4dfwqg0?entry=ttu&g_ep=EgoyMDI1MDcyOS4wIKXMDSoASAFQAw%3D%3D',
+        'sort': 'Paling relevan',
+        'target_reviews': 2000,
+        'require_visit_time': False,
+        'output_prefix': 'desa_wisata_tulungrejo',
+        'low_rating_prefix': None,
+        'dataset': 'desa_wisata_tulungrejo',
+    },
+    'eco_active_park': {
+        'name': 'Eco Active Park',
+        'url': 'https://www.google.com/maps/place/Eco+Active+Park/@-7.8877752,112.5217446,17z/data=!3m1!4b1!4m6!3m5!1s0x2e7881617ff5e4f7:0x63c0ef9654873861!8m2!3d-7.8877752!4d112.5266102!16s%2Fg%2F124ygkv4w?entry=ttu&g_ep=EgoyMDI1MDcyMC4wIKXMDSoASAFQAw%3D%3D',
+        'sort': 'Paling relevan',
+        'target_reviews': 2000,
+        'require_visit_time': True,
+        'output_prefix': 'eco_active_park',
+        'low_rating_prefix': 'ecopark_tulungrejo',
+        'dataset': 'eco_active_park',
+    },
+    'gussari_goa_pinus_batu': {
+        'name': 'Gussari Goa Pinus Batu',
+        'url': 'https://www.google.com/maps/place/Gussari+Goa+Pinus+Batu/@-7.8480284,112.4914226,17z/data=!3m1!4b1!4m8!3m7!1s0x2e7887622e344d61:0xd26d24d63bbbe912!8m2!3d-7.8480284!4d112.4940029!9m1!1b1!16s%2Fg%2F11csqd675p?entry=ttu&g_ep=EgoyMDI1MDczMC4wIKXMDSoASAFQAw%3D%3D',
+        'sort': 'Terbaru',
+        'target_reviews': 2000,
+        'require_visit_time': True,
+        'output_prefix': 'gussari_goa_pinus_batu',
+        'low_rating_prefix': 'goa_pinus',
+        'dataset': 'gussari_goa_pinus_batu',
+    },
+    'paralayang_gunung_banyak': {
+        'name': 'Paralayang Gunung Banyak',
+        'url': 'https://www.google.com/maps/place/Paralayang+Gunung+Banyak,+Batu,+Malang/@-7.8550899,112.4917078,17z/data=!4m8!3m7!1s0x2e788735bbd40639:0x4a4445e74cee55e2!8m2!3d-7.8550899!4d112.4965734!9m1!1b1!16s%2Fg%2F11sk2tks84?entry=ttu&g_ep=EgoyMDI1MDczMC4wIKXMDSoASAFQAw%3D%3D',
+        'sort': 'Paling relevan',
+        'target_reviews': 2000,
+        'require_visit_time': False,
+        'output_prefix': 'paralayang_gunung_banyak',
+        'low_rating_prefix': None,
+        'dataset': 'paralayang_gunung_banyak',
+    },
+    'jatim_park_1': {
+        'name': 'Jatim Park 1',
+        'url': 'https://www.google.com/maps/place/Jawa+Timur+Park+1/@-7.8841663,112.5236276,18z/data=!4m15!1m8!3m7!1s0x2e7880d52e0379d9:0x9c94d817cc2686bb!2sJatim+Park+I,+Jl.+Dewi+Sartika+Atas,+Sisir,+Kec.+Batu,+Kota+Batu,+Jawa+Timur+65314!3b1!8m2!3d-7.8845017!4d112.5248818!16s%2Fg%2F11byl6v0_7!3m5!1s0x2e78872ad61d07b9:0x59a848ad52479780!8m2!3d-7.884152!4d112.5248269!16s%2Fg%2F1q5bkzmkt?entry=ttu&g_ep=EgoyMDI1MDcyMC4wIKXMDSoASAFQAw%3D%3D',
+        'sort': 'Paling relevan',
+        'target_reviews': 2000,
+        'require_visit_time': True,
+        'output_prefix': 'jatim_park_1',
+        'low_rating_prefix': 'jatim_park1',
+        'dataset': 'jatim_park_1',
+    },
+    'jatim_park_2': {
+        'name': 'Jatim Park 2',
+        'url': 'https://www.google.com/maps/place/Jawa+Timur+Park+2/@-7.888021,112.5246786,17z/data=!3m1!4b1!4m6!3m5!1s0x2e7880d6ffffffff:0xf36560f87fd4fd77!8m2!3d-7.888021!4d112.5295442!16s%2Fg%2F121s43xs?entry=ttu&g_ep=EgoyMDI1MDcyMC4wIKXMDSoASAFQAw%3D%3D',
+        'sort': 'Paling relevan',
+        'target_reviews': 2000,
+        'require_visit_time': True,
+        'output_prefix': 'jatim_park_2',
+        'low_rating_prefix': 'jatim_park2',
+        'dataset': 'jatim_park_2',
+    },
+    'jatim_park_3': {
+        'name': 'Jatim Park 3',
+        'url': 'https://www.google.com/maps/place/Jawa+Timur+Park+3/@-7.8971338,112.5505224,17z/data=!3m1!4b1!4m6!3m5!1s0x2e78811848f3a957:0x1b0013b35e7ee3cd!8m2!3d-7.8971338!4d112.5531027!16s%2Fg%2F11dxqfrtx1?entry=ttu&g_ep=EgoyMDI1MDcyMC4wIKXMDSoASAFQAw%3D%3D',
+        'sort': 'Paling relevan',
+        'target_reviews': 2000,
+        'require_visit_time': True,
+        'output_prefix': 'jatim_park_3',
+        'low_rating_prefix': 'jatim_park3',
+        'dataset': 'jatim_park_3',
+    },
+    'lumbung_stroberi': {
+        'name': 'Lumbung Stroberi Official',
+        'url': 'https://www.google.com/maps/place/Lumbung+Stroberi+Official/@-7.8688941,112.539245,17z/data=!3m1!4b1!4m8!3m7!1s0x2e78817feb082c3b:0x9947fcee701ec12d!8m2!3d-7.8688941!4d112.5418253!9m1!1b1!16s%2Fg%2F11h2mn6l0j?entry=ttu&g_ep=EgoyMDI1MDczMC4wIKXMDSoASAFQAw%3D%3D',
+        'sort': 'Paling relevan',
+        'target_reviews': 1800,
+        'require_visit_time': True,
+        'output_prefix': 'lumbung_stroberi',
+        'low_rating_prefix': None,
+        'dataset': 'lumbung_stroberi',
+    },
+    'milenial_glow_garden': {
+        'name': 'Milenial Glow Garden',
+        'url': 'https://www.google.com/maps/place/Milenial+Glow+Garden/@-7.8988554,112.5521659,17z/data=!4m8!3m7!1s0x2e78819fe29eaa1b:0x638da5b520b441e9!8m2!3d-7.8988554!4d112.5547462!9m1!1b1!16s%2Fg%2F11fqcyd5rg?entry=ttu&g_ep=EgoyMDI1MDcyOS4wIKXMDSoASAFQAw%3D%3D',
+        'sort': 'Paling relevan',
+        'target_reviews': 2000,
+        'require_visit_time': True,
+        'output_prefix': 'milenial_glow_garden',
+        'low_rating_prefix': 'milenial_glow_garden',
+        'dataset': 'milenial_glow_garden',
+    },
+    'museum_angkut': {
+        'name': 'Museum Angkut',
+        'url': 'https://www.google.com/maps/place/Museum+Angkut/@-7.878809,112.5173944,17z/data=!3m1!4b1!4m6!3m5!1s0x2e78872dd3cd2c13:0x3295038cd23c1d38!8m2!3d-7.878809!4d112.5199747!16s%2Fg%2F11clyt6fly?entry=ttu&g_ep=EgoyMDI1MDcyMC4wIKXMDSoASAFQAw%3D%3D',
+        'sort': 'Paling relevan',
+        'target_reviews': 2000,
+        'require_visit_time': True,
+        'output_prefix': 'museum_angkut',
+        'low_rating_prefix': 'museum_angkut',
+        'dataset': 'museum_angkut',
+    },
+    'gunung_panderman': {
+        'name': 'Gunung Panderman',
+        'url': 'https://www.google.com/maps/place/Gn.+Panderman/@-7.9041664,112.4863455,15z/data=!3m1!4b1!4m6!3m5!1s0x2e7886ebc769fb39:0xca2ebc285cb2cb3c!8m2!3d-7.9041667!4d112.4966667!16s%2Fg%2F1hb_dgzjk?entry=ttu&g_ep=EgoyMDI1MDcyMC4wIKXMDSoASAFQAw%3D%3D',
+        'sort': 'Paling relevan',
+        'target_reviews': 2000,
+        'require_visit_time': False,
+        'output_prefix': 'gunung_panderman',
+        'low_rating_prefix': None,
+        'dataset': 'gunung_panderman',
+    },
+    'pemandian_air_panas_cangar': {
+        'name': 'Pemandian Air Panas Cangar',
+        'url': 'https://www.google.com/maps/place/Pemandian+Air+Panas+Cangar/@-7.741749,112.5294449,17z/data=!4m8!3m7!1s0x2e787c3aaaaaaaab:0xbe4aabe6601d0db9!8m2!3d-7.741749!4d112.5343105!9m1!1b1!16s%2Fg%2F1pzq9vl1l?entry=ttu&g_ep=EgoyMDI1MDcyOS4wIKXMDSoASAFQAw%3D%3D',
+        'sort': 'Paling relevan',
+        'target_reviews': 2000,
+        'require_visit_time': False,
+        'output_prefix': 'pemandian_air_panas_cangar',
+        'low_rating_prefix': 'permandian_air_panas_cangar',
+        'dataset': 'pemandian_air_panas_cangar',
+    },
+    'wisata_petik_apel_mandiri': {
+        'name': 'Wisata Petik Apel Mandiri',
+        'url': 'https://www.google.com/maps/place/Wisata+Petik+Apel+Mandiri+Kota+Batu/@-7.8313608,112.5265855,17z/data=!4m8!3m7!1s0x2e787e74c4a5a219:0x5fb9b10d22b772e5!8m2!3d-7.8313608!4d112.5291658!9m1!1b1!16s%2Fg%2F11b6zsyrh5?entry=ttu&g_ep=EgoyMDI1MDczMC4wIKXMDSoASAFQAw%3D%3D',
+        'sort': 'Paling relevan',
+        'target_reviews': 1500,
+        'require_visit_time': False,
+        'output_prefix': 'wisata_petik_apel_mandiri',
+        'low_rating_prefix': None,
+        'dataset': 'wisata_petik_apel_mandiri',
+    },
+    'songgoriti_hot_springs': {
+        'name': 'Songgoriti Hot Springs',
+        'url': 'https://www.google.com/maps/place/Songgoriti+Hot+Springs/@-7.8666705,112.4917006,17z/data=!3m1!4b1!4m6!3m5!1s0x2e788784d4c674a1:0xdd0c7c98284487e1!8m2!3d-7.8666705!4d112.4942809!16s%2Fg%2F11sr62v1ly?entry=ttu&g_ep=EgoyMDI1MDcyOS4wIKXMDSoASAFQAw%3D%3D',
+        'sort': 'Paling relevan',
+        'target_reviews': 2000,
+        'require_visit_time': False,
+        'output_prefix': 'songgoriti_hot_springs',
+        'low_rating_prefix': 'songgoriti_hot_spring',
+        'dataset': 'songgoriti_hot_springs',
+    },
+    'taman_dolan': {
+        'name': 'Taman Dolan',
+        'url': 'https://www.google.com/maps/place/Taman+Dolan/@-7.8640962,112.5514312,17z/data=!4m8!3m7!1s0x2e788094ab12625f:0xf1bbc612c0c631e9!8m2!3d-7.8640962!4d112.5540115!9m1!1b1!16s%2Fg%2F11cjj0hz16?entry=ttu&g_ep=EgoyMDI1MDczMC4wIKXMDSoASAFQAw%3D%3D',
+        'sort': 'Paling relevan',
+        'target_reviews': 2000,
+        'require_visit_time': True,
+        'output_prefix': 'taman_dolan',
+        'low_rating_prefix': 'taman_dolan',
+        'dataset': 'taman_dolan',
+    },
+    'taman_pinus_campervan': {
+        'name': 'Taman Pinus Campervan Park',
+        'url': 'https://www.google.com/maps/place/Taman+Pinus+Campervan+Park/@-7.904017,112.5194729,17z/data=!4m8!3m7!1s0x2e7887e3735eaca9:0xa6b9aff595e38f88!8m2!3d-7.904017!4d112.5220532!9m1!1b1!16s%2Fg%2F11qnk0jdms?entry=ttu&g_ep=EgoyMDI1MDczMC4wIKXMDSoASAFQAw%3D%3D',
+        'sort': 'Paling relevan',
+        'target_reviews': 2000,
+        'require_visit_time': True,
+        'output_prefix': 'taman_pinus_campervan',
+        'low_rating_prefix': None,
+        'dataset': 'taman_pinus_campervan',
+    },
+    'taman_selecta': {
+        'name': 'Taman Selecta',
+        'url': 'https://www.google.com/maps/place/Taman+Rekreasi+Selecta/@-7.819509,112.521356,17z/data=!3m1!4b1!4m6!3m5!1s0x2e787e762e0d9487:0xb8804cabf1c12b40!8m2!3d-7.819509!4d112.5262216!16s%2Fg%2F11b7rnf310?entry=ttu&g_ep=EgoyMDI1MDcyMC4wIKXMDSoASAFQAw%3D%3D',
+        'sort': 'Paling relevan',
+        'target_reviews': 2000,
+        'require_visit_time': True,
+        'output_prefix': 'taman_selecta',
+        'low_rating_prefix': 'taman_selecta',
+        'dataset': 'taman_selecta',
+    },
+    'tirta_nirwana_songgoriti': {
+        'name': 'Tirta Nirwana Songgoriti',
+        'url': 'https://www.google.com/maps/place/Tirta+Nirwana+Songgoriti/@-7.865754,112.4883862,17z/data=!4m8!3m7!1s0x2e788745e0ebb909:0xd6017a240610ca96!8m2!3d-7.865754!4d112.4932518!9m1!1b1!16s%2Fg%2F1hm34wk4b?entry=ttu&g_ep=EgoyMDI1MDczMC4wIKXMDSoASAFQAw%3D%3D',
+        'sort': 'Terbaru',
+        'target_reviews': 2000,
+        'require_visit_time': False,
+        'output_prefix': 'tirta_nirwana_songgoriti',
+        'low_rating_prefix': None,
+        'dataset': 'tirta_nirwana_hotspring',
+    },
+    'wisata_bunga_desa_sidomulyo': {
+        'name': 'Wisata Bunga Desa Sidomulyo',
+        'url': 'https://www.google.com/maps/place/Wisata+Bunga+Desa+Sidomulyo/@-7.8440381,112.520716,17z/data=!3m1!4b1!4m6!3m5!1s0x2e787d4f9ee0a669:0x8358f53b25036bcb!8m2!3d-7.8440381!4d112.5232963!16s%2Fg%2F11f73_b04c?entry=ttu&g_ep=EgoyMDI1MDczMC4wIKXMDSoASAFQAw%3D%3D',
+        'sort': 'Paling relevan',
+        'target_reviews': 2000,
+        'require_visit_time': False,
+        'output_prefix': 'wisata_bunga_desa_sidomulyo',
+        'low_rating_prefix': None,
+        'dataset': 'wisata_bunga_sidomulyo',
+    },
+    'wisata_desa_agro_bumiaji': {
+        'name': 'Wisata Desa Agro Bumiaji',
+        'url': 'https://www.google.com/maps/place/Wisata+Desa+Agro+Bumiaji/@-7.8583285,112.5352818,17z/data=!4m8!3m7!1s0x2e7880ba6797300d:0x41ae81cc9b4f8d9f!8m2!3d-7.8583285!4d112.5378621!9m1!1b1!16s%2Fg%2F11b6sn9m4z?entry=ttu&g_ep=EgoyMDI1MDczMC4wIKXMDSoASAFQAw%3D%3D',
+        'sort': 'Paling relevan',
+        'target_reviews': 2000,
+        'require_visit_time': False,
+        'output_prefix': 'wisata_desa_agro_bumiaji',
+        'low_rating_prefix': None,
+        'dataset': 'wisata_desa_agro_bumiaji',
+    },
+    'coban_putri': {
+        'name': 'Coban Putri',
+        'url': 'https://www.google.com/maps/place/Coban+Putri/@-7.9119954,112.5276734,17z/data=!3m1!4b1!4m6!3m5!1s0x2e788186fc5f154f:0xd8c91b109ae0c80b!8m2!3d-7.9119954!4d112.5302537!16s%2Fg%2F11rdb7x0ky?entry=ttu&g_ep=EgoyMDI1MDcyOS4wIKXMDSoASAFQAw%3D%3D',
+        'sort': 'Paling relevan',
+        'target_reviews': 2000,
+        'require_visit_time': False,
+        'output_prefix': 'coban_putri',
+        'low_rating_prefix': None,
+        'dataset': 'coban_putri',
+    },
+    'coban_talun': {
+        'name': 'Coban Talun',
+        'url': 'https://www.google.com/maps/place/wisata+coban+talun/@-7.8016938,112.513765,17z/data=!3m1!4b1!4m6!3m5!1s0x2e787e76eb8ad02b:0xe0eeeb9d29d45786!8m2!3d-7.8016938!4d112.5163453!16s%2Fg%2F11b6d7dr4d?entry=ttu&g_ep=EgoyMDI1MDcyMC4wIKXMDSoASAFQAw%3D%3D',
+        'sort': 'Paling relevan',
+        'target_reviews': 2000,
+        'require_visit_time': True,
+        'output_prefix': 'coban_talun',
+        'low_rating_prefix': 'coban_talun',
+        'dataset': 'coban_talun',
+    },
+    'alun_alun_kota_wisata_batu': {
+        'name': 'Alun Alun Kota Wisata Batu',
+        'url': 'https://www.google.com/maps/place/Alun-Alun+Kota+Wisata+Batu/@-7.8711714,112.524344,17z/data=!3m1!4b1!4m6!3m5!1s0x2e789da3a46807f1:0xea1a51125dafb9b8!8m2!3d-7.8711714!4d112.5269243!16s%2Fg%2F11b6xr9vdl?entry=ttu&g_ep=EgoyMDI1MDcyMC4wIKXMDSoASAFQAw%3D%3D',
+        'sort': 'Paling relevan',
+        'target_reviews': 2000,
+        'require_visit_time': False,
+        'output_prefix': 'alun_alun_kota_wisata_batu',
+        'low_rating_prefix': 'alun_alun_batu',
+        'dataset': 'alun_alun',
+    },
+}
+
+
+def get_place(place_key):
+    """Return the registry entry for a place key (with the key included)"""
+    if place_key not in PLACES:
+        raise KeyError(f"Unknown place: {place_key}. Available: {', '.join(sorted(PLACES))}")
+    place = dict(PLACES[place_key])
+    place['key'] = place_key
+    return place
+
+
+def list_places(low_rating=False):
+    """List registered place keys, optionally only those with a low-rating crawl"""
+    if low_rating:
+        return [key for key, place in PLACES.items() if place['low_rating_prefix']]
+    return list(PLACES)
@@ -0,0 +1,154 @@
+"""Scrape several places in parallel with a pool of headless Firefox workers.
+
+Each worker is a separate process that owns one ``ReviewScraper`` (and so one
+Firefox) and pulls place keys from a shared work queue. Before every place the
+worker checks that its driver still answers and that the Firefox process tree
+stays under the memory cap; otherwise the driver is restarted. During a crawl
+the scraper checks the cap every few scrolls; past it, the crawl stops with
+its checkpoint kept and the worker resumes it on a fresh driver. Results are
+sent back to the parent and merged in the order the places were requested.
+"""
+import multiprocessing
+import os
+import queue
+import traceback
+
+from .places import list_places
+
+# Firefox with dom.ipc.processCount=1 settles around 600-900 MB on a long
+# review panel; restart well before it starts swapping
+DEFAULT_MEMORY_LIMIT_MB = 1500
+
+# Fresh-driver resumes of one place after memory stops (not counted as retries)
+MAX_MEMORY_RESTARTS = 10
+
+
+def default_worker_count():
+    """Half the cores: each Firefox keeps roughly two busy"""
+    return max(1, (os.cpu_count() or 2) // 2)
+
+
+def _ensure_healthy_driver(scraper, worker_id, memory_limit_mb):
+    """Restart the worker's driver if it died or grew past the memory cap"""
+    from .driver import get_driver_memory_mb, is_driver_alive
+
+    if scraper.driver is None or not is_driver_alive(scraper.driver):
+        print(f"[worker {worker_id}] Driver not responding, restarting...")
+        scraper.restart()
+        return
+
+    if memory_limit_mb:
+        memory_mb = get_driver_memory_mb(scraper.driver)
+        if memory_mb is not None and memory_mb > memory_limit_mb:
+            print(f"[worker {worker_id}] Firefox uses {memory_mb:.0f} MB (cap {memory_limit_mb} MB), restarting...")
+            scraper.restart()
+
+
+def _worker_main(worker_id, task_queue, result_queue, mode, memory_limit_mb, max_retries, scraper_options):
+    """Worker process: scrape places from the queue until a None sentinel"""
+    from .driver import is_driver_alive
+    from .engine import ReviewScraper
+
+    # Each worker gets its own lean profile directory (Firefox locks a profile in use)
+    scraper = ReviewScraper(profile_slot=worker_id, memory_limit_mb=memory_limit_mb, **scraper_options)
+    try:
+        while True:
+            place_key = task_queue.get()
+            if place_key is None:
+                break
+
+            reviews = []
+            error = None
+            attempt = 0
+            memory_restarts = 0
+            while True:
+                try:
+                    _ensure_healthy_driver(scraper, worker_id, memory_limit_mb)
+                    # A retry picks up the checkpoint the failed or stopped attempt left behind
+                    resume = True if attempt or memory_restarts else None
+                    reviews = scraper.scrape_place(place_key, mode=mode, resume=resume)
+                    error = None
+                except Exception as e:
+                    error = f"{e.__class__.__name__}: {e}"
+                    traceback.print_exc()
+
+                if error is None and scraper.memory_exceeded and memory_restarts < MAX_MEMORY_RESTARTS:
+                    memory_restarts += 1
+                    print(f"[worker {worker_id}] Resuming {place_key} on a fresh driver "
+                          f"(memory restart {memory_restarts}/{MAX_MEMORY_RESTARTS})...")
+                    scraper.restart()
+                    continue
+
+                # A driver that died mid-place means a partial result; retry it
+                if error is None and is_driver_alive(scraper.driver):
+                    break
+                if attempt >= max_retries:
+                    break
+                attempt += 1
+                # _ensure_healthy_driver restarts the dead driver on the next attempt
+                print(f"[worker {worker_id}] Retrying {place_key} with a fresh driver...")
+
+            result_queue.put((place_key, worker_id, reviews, error))
+    finally:
+        scraper.close()
+
+
+def run_pool(place_keys=None, mode='main', workers=None, headless=True,
+             memory_limit_mb=DEFAULT_MEMORY_LIMIT_MB, max_retries=1, **scraper_options):
+    """Scrape places with ``workers`` parallel browsers.
+
+    Returns a dict of place key -> list of reviews, ordered like
+    ``place_keys``. Places that failed are logged and map to an empty list.
+    Extra keyword arguments are passed to each worker's ``ReviewScraper``.
+    """
+    if place_keys is None:
+        place_keys = list_places(low_rating=mode == 'low_rating')
+    place_keys = list(place_keys)
+    if not place_keys:
+        return {}
+
+    workers = min(workers or default_worker_count(), len(place_keys))
+    scraper_options = dict(scraper_options, headless=headless)
+
+    # spawn: Selenium/Firefox state must not be inherited through fork
+    ctx = multiprocessing.get_context('spawn')
+    task_queue = ctx.Queue()
+    result_queue = ctx.Queue()
+
+    for place_key in place_keys:
+        task_queue.put(place_key)
+    for _ in range(workers):
+        task_queue.put(None)
+
+    print(f"Starting {workers} browser workers for {len(place_keys)} places...")
+    processes = []
+    for worker_id in range(workers):
+        process = ctx.Process(
+            target=_worker_main,
+            args=(worker_id, task_queue, result_queue, mode, memory_limit_mb, max_retries, scraper_options),
+            name=f"wisata-scraper-{worker_id}",
+        )
+        process.start()
+        processes.append(process)
+
+    collected = {}
+    while len(collected) < len(place_keys):
+        try:
+            place_key, worker_id, reviews, error = result_queue.get(timeout=30)
+        except queue.Empty:
+            if not any(process.is_alive() for process in processes):
+                print("All workers exited before finishing the queue")
+                break
+            continue
+
+        collected[place_key] = reviews
+        if error:
+            print(f"[worker {worker_id}] {place_key} failed: {error}")
+        else:
+            print(f"[worker {worker_id}] {place_key} done: {len(reviews)} reviews "
+                  f"({len(collected)}/{len(place_keys)})")
+
+    for process in processes:
+        process.join()
+
+    return {place_key: collected.get(place_key, []) for place_key in place_keys}
@@ -0,0 +1,266 @@
+"""Raw review element text, kept so parsed files can be regenerated offline.
+
+Every review the scraper reads from the page is appended, before parsing, to
+a gzip-compressed JSONL file per run (``<prefix>_<label>_raw_<ts>.jsonl.gz``
+in ``hasil scraping/raw``) keyed by review id. When a parsing bug turns up,
+fix ``parse_review_text`` and rerun::
+
+    python -m wisata_scraper --reparse --all
+
+instead of scraping every affected place again. A record holds either the
+element text and aria rating (``raw_text``, ``aria_rating``) or, for reviews
+decoded from captured payloads, the positional payload entry and its layout
+(``payload_layout``, ``payload_entry``). Owner responses are not stored.
+"""
+import glob
+import gzip
+import json
+import os
+import re
+import zlib
+from datetime import datetime
+
+from .output import LOW_RATING_OUTPUT_FOLDER, OUTPUT_FOLDER
+
+RAW_FOLDER = os.path.join(OUTPUT_FOLDER, 'raw')
+LOW_RATING_LABEL = '1to3stars'
+MODE_LOW_RATING = 'low_rating'  # engine.MODE_LOW_RATING, without importing Selenium
+
+RAW_FILE_RE = re.compile(r'^(?P<prefix>.+)_(?P<label>[A-Za-z0-9]+)_raw_(?P<timestamp>\d{8}_\d{6})\.jsonl\.gz$')
+
+
+class RawTextSink:
+    """Append-only gzip JSONL of raw review text, flushed once per scroll.
+
+    Flushes use Z_SYNC_FLUSH, so an interrupted run leaves every flushed
+    record readable even though the gzip trailer is missing.
+    """
+
+    def __init__(self, path, place_key, mode):
+        self.path = path
+        self.place_key = place_key
+        self.mode = mode
+        self.count = 0
+        self._pending = []
+        self._file = None
+
+    def write(self, review_id, raw, known=False, scraped_at=None):
+        """Queue one review's raw fields (from ``raw_fields`` or ``payload_raw_fields``)"""
+        record = {
+            'review_id': review_id,
+            'place': self.place_key,
+            'mode': self.mode,
+        }
+        record.update(raw)
+        if scraped_at:
+            record['scraped_at'] = scraped_at
+        if known:
+            record['known'] = True
+        self._pending.append(json.dumps(record, ensure_ascii=False))
+        self.count += 1
+
+    def flush(self):
+        if not self._pending:
+            return
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            self._file = gzip.open(self.path, 'at', encoding='utf-8')
+        self._file.write('\n'.join(self._pending) + '\n')
+        self._file.flush()
+        self._pending = []
+
+    def close(self):
+        """Flush and close; returns the file path (None if nothing was written)"""
+        self.flush()
+        if self._file is None:
+            return None
+        self._file.close()
+        self._file = None
+        print(f"Raw text saved to {self.path} ({self.count} reviews)")
+        return self.path
+
+
+def raw_fields(raw_text, aria_rating=''):
+    """Raw fields of a review read from the page"""
+    return {'raw_text': raw_text, 'aria_rating': aria_rating}
+
+
+def payload_raw_fields(layout_name, entry):
+    """Raw fields of a review decoded from a captured payload entry"""
+    return {'payload_layout': layout_name, 'payload_entry': entry}
+
+
+def parse_raw_record(record):
+    """The parsed review of a raw record, whichever kind it is (None if unparseable)"""
+    if 'payload_entry' in record:
+        from .payload import PAYLOAD_LAYOUTS, decode_review_entry
+
+        layout = PAYLOAD_LAYOUTS.get(record.get('payload_layout'))
+        if layout is None:
+            return None
+        review_data = decode_review_entry(record['payload_entry'], layout)
+        if review_data:
+            review_data.pop('review_id', None)
+        return review_data
+
+    from .parsing import parse_review_text
+
+    return parse_review_text(record.get('raw_text'), record.get('aria_rating', ''))
+
+
+def raw_prefix(place, mode):
+    return place['low_rating_prefix'] if mode == MODE_LOW_RATING else place['output_prefix']
+
+
+def open_raw_sink(place, mode, label, raw_folder=RAW_FOLDER, timestamp=None):
+    """Raw sink for one run; ``label`` is ALL/NEW for main crawls, 1to3stars for low-rating ones.
+
+    Pass the parsed sink's ``timestamp`` so reparse regenerates that same file.
+    """
+    timestamp = timestamp or datetime.now().strftime('%Y%m%d_%H%M%S')
+    path = os.path.join(raw_folder, f"{raw_prefix(place, mode)}_{label}_raw_{timestamp}.jsonl.gz")
+    return RawTextSink(path, place['key'], mode)
+
+
+def iter_raw_records(path):
+    """Records of a raw file, including the flushed part of an unfinished one"""
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    buffer = b''
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(1 << 16)
+            if not chunk:
+                break
+            while chunk:
+                buffer += decompressor.decompress(chunk)
+                # Appending to the file later starts a new gzip member
+                chunk = decompressor.unused_data
+                if decompressor.eof:
+                    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+                else:
+                    chunk = b''
+            *lines, buffer = buffer.split(b'\n')
+            for line in lines:
+                if line.strip():
+                    yield json.loads(line)
+    buffer += decompressor.flush()
+    for line in buffer.split(b'\n'):
+        if line.strip():
+            try:
+                yield json.loads(line)
+            except ValueError:
+                pass
+
+
+RECORD_KEYS = ('review_id', 'place', 'mode', 'scraped_at', 'known')
+
+
+def load_raw_fields(path):
+    """Raw fields of every review a raw file holds (id -> fields), for copying into another run"""
+    raw = {}
+    for record in iter_raw_records(path):
+        if record.get('known'):
+            continue
+        raw[record.get('review_id')] = {key: value for key, value in record.items() if key not in RECORD_KEYS}
+    return raw
+
+
+def list_raw_files(raw_folder=RAW_FOLDER):
+    return sorted(glob.glob(os.path.join(glob.escape(raw_folder), '*_raw_*.jsonl.gz')))
+
+
+def reparse_records(records, place, mode, scraped_at=None):
+    """Parsed reviews from raw records, as the scraper would have kept them.
+
+    ``scraped_at`` stands in for records written before they carried one.
+    """
+    from .fingerprint import review_fingerprint
+    from .parsing import filter_low_rating
+
+    latest = {}
+    for record in records:
+        latest[record.get('review_id')] = record
+
+    reviews = []
+    for review_id, record in latest.items():
+        if record.get('known'):
+            continue
+        review_data = parse_raw_record(record)
+        if mode == MODE_LOW_RATING:
+            review_data, _ = filter_low_rating(review_data, place['name'])
+        if not review_data:
+            continue
+        if isinstance(review_id, str):
+            review_data['review_id'] = review_id
+        review_data['fingerprint'] = review_fingerprint(
+            place['dataset'], review_data.get('reviewer_name'),
+            review_data.get('rating'), review_data.get('review_text'))
+        review_data['scraped_at'] = record.get('scraped_at') or scraped_at
+        reviews.append(review_data)
+    return reviews
+
+
+def parsed_path(place, mode, label, timestamp, output_folder=None):
+    """The CSV a run's parsed reviews go to (same name stem the scraper used)"""
+    if mode == MODE_LOW_RATING:
+        folder = output_folder or LOW_RATING_OUTPUT_FOLDER
+        name = f"{place['low_rating_prefix']}_reviews_1to3stars_with_text_{timestamp}.csv"
+    else:
+        folder = output_folder or OUTPUT_FOLDER
+        name = f"{place['output_prefix']}_{label}_reviews_{timestamp}.csv"
+    return os.path.join(folder, name)
+
+
+def reparse(place_keys=None, raw_folder=RAW_FOLDER, output_folder=None):
+    """Regenerate the parsed CSV of every raw file (optionally only some places).
+
+    Each run's CSV is written under the name the scraper gave it. Saved files
+    of the same run (CSV, JSONL or Parquet) are never deleted: they are kept
+    as ``<file>.orig``, and a run whose raw file rebuilds fewer reviews than
+    were saved (reviews from older runs without a raw record) is skipped and
+    left as it is. With ``output_folder`` everything goes there instead.
+    Returns the written paths.
+    """
+    from .output import LOW_RATING_COLUMNS, REVIEW_COLUMNS, read_reviews
+    from .places import get_place
+    from .records import ReviewBuffer
+
+    written = []
+    for path in list_raw_files(raw_folder):
+        match = RAW_FILE_RE.match(os.path.basename(path))
+        if not match:
+            continue
+        records = list(iter_raw_records(path))
+        if not records:
+            continue
+        place_key, mode = records[0].get('place'), records[0].get('mode')
+        if place_keys is not None and place_key not in place_keys:
+            continue
+        try:
+            place = get_place(place_key)
+        except KeyError as e:
+            print(f"Skipping {path}: {e}")
+            continue
+
+        run_started = datetime.strptime(match.group('timestamp'), '%Y%m%d_%H%M%S').isoformat()
+        reviews = reparse_records(records, place, mode, scraped_at=run_started)
+        columns = LOW_RATING_COLUMNS if mode == MODE_LOW_RATING else REVIEW_COLUMNS
+        target = parsed_path(place, mode, match.group('label'), match.group('timestamp'), output_folder)
+
+        stem = os.path.splitext(target)[0]
+        saved = [stem + extension for extension in ('.csv', '.jsonl', '.parquet') if os.path.exists(stem + extension)]
+        saved_rows = max((len(read_reviews(glob.escape(saved_path))) for saved_path in saved), default=0)
+        if len(reviews) < saved_rows:
+            print(f"Skipping {os.path.basename(path)}: it rebuilds {len(reviews)} of the {saved_rows} saved "
+                  f"reviews in {os.path.basename(saved[0])}; the saved files are left as they are")
+            continue
+        for saved_path in saved:
+            # The first original is kept; later reparses only replace their own CSV
+            if not os.path.exists(saved_path + '.orig'):
+                os.replace(saved_path, saved_path + '.orig')
+
+        os.makedirs(os.path.dirname(target) or '.', exist_ok=True)
+        ReviewBuffer(reviews).to_frame(columns).to_csv(target, index=False, encoding='utf-8-sig')
+        print(f"{os.path.basename(path)}: {len(records)} raw -> {len(reviews)} reviews in {target}")
+        written.append(target)
+    return written
@@ -0,0 +1,146 @@
+"""Review records and a column-wise buffer for holding many of them.
+
+A parsed review used to stay a dict until it was saved: about 280 bytes per
+review before the strings themselves, and another pass through
+``pd.DataFrame(list_of_dicts)`` to save it. ``ReviewBuffer`` keeps kept
+reviews as one list per field (ratings in a byte array), about 65 bytes per
+review, and turns into a DataFrame or Arrow table column by column.
+``Review`` is the fixed-field record it hands back; it answers ``get``,
+``[]`` and ``dict()`` like the dicts the scraper code works with.
+"""
+from array import array
+
+# output.LOW_RATING_COLUMNS; REVIEW_COLUMNS is the same without 'wisata'
+REVIEW_FIELDS = ['reviewer_name', 'rating', 'date', 'visit_time', 'review_text', 'wisata',
+                 'review_id', 'fingerprint', 'scraped_at']
+FIELD_DEFAULTS = {'rating': 0, 'fingerprint': None}
+
+
+def _rating(value):
+    try:
+        return int(value or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+class Review:
+    """One parsed review with a fixed set of fields (missing ones are '')"""
+
+    __slots__ = REVIEW_FIELDS
+
+    def __init__(self, **fields):
+        for name in REVIEW_FIELDS:
+            setattr(self, name, fields.get(name, FIELD_DEFAULTS.get(name, '')))
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**{name: value for name, value in data.items() if name in REVIEW_FIELDS})
+
+    def keys(self):
+        return list(REVIEW_FIELDS)
+
+    def __getitem__(self, name):
+        try:
+            return getattr(self, name)
+        except (AttributeError, TypeError):
+            raise KeyError(name)
+
+    def __setitem__(self, name, value):
+        try:
+            setattr(self, name, value)
+        except (AttributeError, TypeError):
+            raise KeyError(name)
+
+    def __contains__(self, name):
+        return name in REVIEW_FIELDS
+
+    def get(self, name, default=None):
+        return getattr(self, name, default) if name in REVIEW_FIELDS else default
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in REVIEW_FIELDS}
+
+    def __eq__(self, other):
+        if isinstance(other, Review):
+            return self.to_dict() == other.to_dict()
+        return NotImplemented
+
+    def __repr__(self):
+        return f"Review({self.reviewer_name!r}, rating={self.rating}, date={self.date!r})"
+
+
+class ReviewBuffer:
+    """Append-only column store of reviews.
+
+    ``append`` takes a dict (or a Review); iterating or indexing gives
+    ``Review`` objects built on the fly. Fields a review does not have are
+    stored as '' (0 for rating, None for fingerprint).
+    """
+
+    def __init__(self, reviews=()):
+        self.columns = {name: [] for name in REVIEW_FIELDS}
+        self.columns['rating'] = array('b')
+        self.extend(reviews)
+
+    def __len__(self):
+        return len(self.columns['rating'])
+
+    def append(self, review):
+        get = review.get
+        for name, column in self.columns.items():
+            if name == 'rating':
+                column.append(_rating(get('rating')))
+            else:
+                value = get(name)
+                column.append(FIELD_DEFAULTS.get(name, '') if value is None else value)
+
+    def extend(self, reviews):
+        for review in reviews:
+            self.append(review)
+
+    def row(self, index):
+        return Review(**{name: column[index] for name, column in self.columns.items()})
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return self.row(index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self.row(index)
+
+    def to_frame(self, columns=None):
+        """DataFrame of the given columns (default: all fields), built column by column"""
+        import numpy as np
+        import pandas as pd
+
+        data = {}
+        for name in columns or REVIEW_FIELDS:
+            if name == 'rating':
+                data[name] = np.frombuffer(self.columns['rating'], dtype=np.int8).astype('int64')
+            elif name in self.columns:
+                data[name] = self.columns[name]
+            else:
+                data[name] = [''] * len(self)
+        return pd.DataFrame(data, columns=list(data))
+
+    def to_arrow(self, columns=None):
+        """pyarrow Table of the given columns (needs pyarrow)"""
+        import pyarrow as pa
+
+        arrays = {}
+        for name in columns or REVIEW_FIELDS:
+            if name == 'rating':
+                arrays[name] = pa.array(self.columns['rating'].tolist(), type=pa.int64())
+            elif name == 'fingerprint':
+                arrays[name] = pa.array(self.columns['fingerprint'], type=pa.int64())
+            elif name in self.columns:
+                # review_id is an int for elements without a data-review-id
+                arrays[name] = pa.array([value if isinstance(value, str) else str(value)
+                                         for value in self.columns[name]], type=pa.string())
+            else:
+                arrays[name] = pa.array([''] * len(self), type=pa.string())
+        return pa.table(arrays)
@@ -0,0 +1,628 @@
+"""Offline replay of the Maps review panel for testing and benchmarking.
+
+A local HTTP server serves a stand-in place page with the same hooks the
+scraper relies on (the 'Ulasan' tab, the 'Urutkan' menu, the scrollable
+``m6QErb DxyBCb`` feed, ``div[data-review-id]`` cards with an aria-label
+rating). Review cards come from a snapshot HTML file and are paged in ten at a
+time, after a simulated network latency, whenever the feed is scrolled near
+the bottom. 'Lainnya' buttons reveal the full text after a short delay and
+owner responses sit inside the cards like on Maps. The real ``ReviewScraper``
+then runs against it in Firefox, so no network is needed.
+
+A snapshot is either a saved review panel (outer HTML copied from the
+browser's inspector) or one built from reviews already in hasil scraping::
+
+    python -m wisata_scraper.replay build "hasil scraping/museum_angkut_*.csv" -o replay_snapshots/museum_angkut.html
+    python -m wisata_scraper.replay bench replay_snapshots/museum_angkut.html --config default --config prune_dom
+    python -m wisata_scraper.replay serve replay_snapshots/museum_angkut.html   # look at it in a browser
+
+Offline, Firefox and geckodriver must already be installed (set
+``GECKODRIVER_PATH`` or reuse the cached path from an earlier online run).
+Capture mode is not simulated: the pages are plain JSON, not the review-list
+RPCs, so ``--capture`` falls back to the DOM here.
+
+Verified without a browser: snapshot building and the paging server
+(tests/test_replay.py). The browser half (``run_replay`` and ``bench``) is
+unverified: it has not been run against Firefox yet, and its test is skipped
+where Firefox or geckodriver is missing. No benchmark numbers exist for it.
+"""
+import argparse
+import html
+import json
+import os
+import re
+import resource
+import threading
+import time
+from html.parser import HTMLParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+REPLAY_FOLDER = 'replay_snapshots'
+REPLAY_PLACE_KEY = 'replay'
+
+DEFAULT_PAGE_SIZE = 10          # reviews per page, like the Maps review list
+DEFAULT_LATENCY_MS = 400
+DEFAULT_EXPAND_DELAY_MS = 50
+DEFAULT_TRUNCATE_CHARS = 160    # built snapshots cut longer texts behind 'Lainnya'
+DEFAULT_OWNER_EVERY = 7         # every 7th built card gets an owner response
+
+SORT_ORDERS = {
+    'Paling relevan': 'relevant',
+    'Terbaru': 'newest',
+    'Rating tertinggi': 'highest',
+    'Rating terendah': 'lowest',
+}
+
+BENCH_CONFIGS = {
+    'default': {},
+    'prune_dom': {'prune_dom': True},
+    'per_element': {'bulk_extract': False},
+    'per_review_expand': {'batch_expand': False},
+    'lean': {'lean': True},
+}
+
+RATING_LABEL_RE = re.compile(r'aria-label="\s*(\d)\s*(?:bintang|star)', re.IGNORECASE)
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="id">
+<head>
+<meta charset="utf-8">
+<title>{title} - Google Maps (replay)</title>
+<style>
+body {{ margin: 0; font-family: sans-serif; font-size: 14px; }}
+#panel {{ display: none; width: 440px; }}
+#sort-menu {{ display: none; border: 1px solid #ccc; }}
+.m6QErb.DxyBCb {{ height: 700px; overflow-y: auto; border: 1px solid #ddd; }}
+.jftiEf {{ padding: 12px; border-bottom: 1px solid #eee; min-height: 120px; }}
+.CDe7pd {{ margin: 8px 0 0 16px; color: #555; }}
+</style>
+</head>
+<body>
+<h1 class="DUwDvf">{title}</h1>
+<div role="tablist">
+<button role="tab" aria-label="Ikhtisar {title}">Ikhtisar</button>
+<button role="tab" id="reviews-tab" aria-label="Ulasan untuk {title}">Ulasan</button>
+</div>
+<div id="panel">
+<button id="sort-button" class="g88MCb" aria-label="Urutkan ulasan">Urutkan</button>
+<div id="sort-menu" role="menu">{sort_options}</div>
+<div id="feed" class="m6QErb DxyBCb" role="feed" tabindex="-1"></div>
+</div>
+<script>
+(function() {{
+    var expandDelay = {expand_delay};
+    var feed = document.getElementById('feed');
+    var panel = document.getElementById('panel');
+    var menu = document.getElementById('sort-menu');
+    var state = {{sort: 'relevant', page: 0, loading: false, done: false, generation: 0}};
+
+    function nearBottom() {{
+        return feed.scrollTop + feed.clientHeight >= feed.scrollHeight - 300;
+    }}
+    function loadPage() {{
+        if (state.loading || state.done) {{
+            return;
+        }}
+        state.loading = true;
+        var generation = state.generation;
+        var xhr = new XMLHttpRequest();
+        xhr.open('GET', '/reviews?sort=' + state.sort + '&page=' + state.page);
+        xhr.onload = function() {{
+            if (generation !== state.generation) {{
+                return;
+            }}
+            var data = JSON.parse(xhr.responseText);
+            var holder = document.createElement('div');
+            holder.innerHTML = data.cards.join('');
+            while (holder.firstChild) {{
+                feed.appendChild(holder.firstChild);
+            }}
+            state.page += 1;
+            state.done = data.done;
+            state.loading = false;
+            if (nearBottom()) {{
+                loadPage();
+            }}
+        }};
+        xhr.onerror = function() {{
+            state.loading = false;
+        }};
+        xhr.send();
+    }}
+    function reset(sort) {{
+        state.sort = sort;
+        state.page = 0;
+        state.done = false;
+        state.loading = false;
+        state.generation += 1;
+        feed.innerHTML = '';
+        feed.scrollTop = 0;
+        loadPage();
+    }}
+
+    feed.addEventListener('scroll', function() {{
+        if (nearBottom()) {{
+            loadPage();
+        }}
+    }});
+    document.addEventListener('click', function(event) {{
+        var option = event.target.closest('[role="menuitemradio"]');
+        if (option) {{
+            menu.style.display = 'none';
+            // Like Maps, re-selecting the current order keeps the list
+            if (option.getAttribute('aria-checked') === 'true') {{
+                return;
+            }}
+            var options = menu.querySelectorAll('[role="menuitemradio"]');
+            for (var i = 0; i < options.length; i++) {{
+                options[i].setAttribute('aria-checked', options[i] === option ? 'true' : 'false');
+            }}
+            reset(option.getAttribute('data-sort'));
+            return;
+        }}
+        var button = event.target.closest('button');
+        if (!button) {{
+            return;
+        }}
+        if (button.id === 'reviews-tab') {{
+            panel.style.display = 'block';
+            if (!feed.firstChild) {{
+                reset(state.sort);
+            }}
+        }} else if (button.id === 'sort-button') {{
+            menu.style.display = 'block';
+        }} else if (/Lainnya|More/.test(button.textContent)) {{
+            setTimeout(function() {{
+                var text = button.parentElement.querySelector('[data-full-text]');
+                if (text) {{
+                    text.textContent = text.getAttribute('data-full-text');
+                }}
+                button.remove();
+            }}, expandDelay);
+        }}
+    }});
+}})();
+</script>
+</body>
+</html>
+"""
+
+SORT_OPTION_TEMPLATE = ('<div role="menuitemradio" class="fxNQSd" data-index="{index}" data-sort="{sort}" '
+                        'aria-checked="{checked}">{label}</div>')
+
+SNAPSHOT_TEMPLATE = """<!DOCTYPE html>
+<html lang="id">
+<head><meta charset="utf-8"><title>{title}</title></head>
+<body>
+<div class="m6QErb DxyBCb" role="feed">
+{cards}
+</div>
+</body>
+</html>
+"""
+
+
+class _CardSplitter(HTMLParser):
+    """Outer HTML of every top-level ``div[data-review-id]`` in a document"""
+
+    def __init__(self, text):
+        super().__init__(convert_charrefs=False)
+        self.text = text
+        self.line_offsets = [0]
+        # getpos() counts '\n' only, unlike str.splitlines
+        for line in text.split('\n'):
+            self.line_offsets.append(self.line_offsets[-1] + len(line) + 1)
+        self.cards = []
+        self._depth = 0
+        self._start = None
+
+    def _offset(self):
+        line, column = self.getpos()
+        return self.line_offsets[line - 1] + column
+
+    def handle_starttag(self, tag, attrs):
+        if tag != 'div':
+            return
+        if self._depth:
+            self._depth += 1
+        elif dict(attrs).get('data-review-id'):
+            self._depth = 1
+            self._start = self._offset()
+
+    def handle_endtag(self, tag):
+        if tag != 'div' or not self._depth:
+            return
+        self._depth -= 1
+        if not self._depth:
+            end = self.text.index('>', self._offset()) + 1
+            self.cards.append(self.text[self._start:end])
+
+
+def split_cards(text):
+    """Review cards (outer HTML strings) of a snapshot document, in page order"""
+    splitter = _CardSplitter(text)
+    splitter.feed(text)
+    splitter.close()
+    return splitter.cards
+
+
+def load_snapshot(path):
+    with open(path, encoding='utf-8') as f:
+        return split_cards(f.read())
+
+
+def card_rating(card):
+    """Star rating from a card's aria-label, 0 if there is none"""
+    match = RATING_LABEL_RE.search(card)
+    return int(match.group(1)) if match else 0
+
+
+def card_review_id(card):
+    match = re.search(r'data-review-id="([^"]*)"', card)
+    return html.unescape(match.group(1)) if match else None
+
+
+def _is_missing(value):
+    return value is None or value != value or str(value).strip() in ('', 'Tidak diketahui')
+
+
+def build_card(review_id, reviewer_name, rating, date, review_text, visit_time=None,
+               owner_response=None, local_guide=False, truncate=DEFAULT_TRUNCATE_CHARS):
+    """Review card HTML shaped like the Maps one (nested data-review-id included)"""
+    escape = html.escape
+    review_id = escape(str(review_id))
+    subtitle = 'Local Guide · 24 ulasan · 57 foto' if local_guide else '3 ulasan'
+    text = '' if _is_missing(review_text) else str(review_text)
+
+    if truncate and len(text) > truncate:
+        body = (f'<span class="wiI7pd" data-full-text="{escape(text)}">{escape(text[:truncate].rstrip())}…</span>'
+                f'<button class="w8nwRe kyuRq" aria-label="Lihat lainnya">Lainnya</button>')
+    else:
+        body = f'<span class="wiI7pd">{escape(text)}</span>'
+
+    parts = [
+        f'<div class="jftiEf fontBodyMedium" data-review-id="{review_id}">',
+        f'<div class="jJc9Ad" data-review-id="{review_id}">',
+        f'<div class="d4r55">{escape(str(reviewer_name))}</div>',
+        f'<div class="RfnDt">{subtitle}</div>',
+        f'<div class="DU9Pgb"><span class="kvMYJc" role="img" aria-label="{int(rating)} bintang"></span>'
+        f'<span class="rsqaWe">{escape(str(date) if not _is_missing(date) else "2 bulan lalu")}</span></div>',
+        f'<div class="MyEned">{body}</div>',
+    ]
+    if not _is_missing(visit_time):
+        parts.append(f'<div class="PBK6be"><div>Waktu kunjungan</div><div>{escape(str(visit_time))}</div></div>')
+    parts.append('<div class="GBkF3d"><button>Suka</button><button>Bagikan</button></div>')
+    if owner_response:
+        parts.append(
+            '<div class="CDe7pd"><div class="nM6d2c">Tanggapan dari pemilik</div>'
+            '<div class="DZSIDd">1 bulan lalu</div>'
+            f'<div class="wiI7pd" data-full-text="{escape(owner_response)}">{escape(owner_response[:60])}…</div>'
+            '<button class="w8nwRe">Lainnya</button></div>'
+        )
+    parts.append('</div></div>')
+    return ''.join(parts)
+
+
+def build_snapshot(sources, output_path, limit=None, owner_every=DEFAULT_OWNER_EVERY,
+                   truncate=DEFAULT_TRUNCATE_CHARS, title='Replay'):
+    """Write a snapshot of review cards built from saved reviews; returns the card count"""
+    from .fingerprint import stable_hash64
+    from .output import read_reviews
+
+    df = read_reviews(sources)
+    if limit:
+        df = df.head(limit)
+
+    cards = []
+    for position, row in enumerate(df.to_dict('records')):
+        review_id = row.get('review_id')
+        if _is_missing(review_id):
+            text = '\x1f'.join(str(row.get(column)) for column in ('reviewer_name', 'rating', 'review_text'))
+            review_id = f"replay-{stable_hash64(str(position) + text) & 0xFFFFFFFFFFFFFFFF:016x}"
+        owner_response = None
+        if owner_every and position % owner_every == owner_every - 1:
+            owner_response = ('Terima kasih atas ulasan dan kunjungan Anda, kami tunggu kedatangan '
+                              'berikutnya bersama keluarga tercinta.')
+        rating = row.get('rating')
+        cards.append(build_card(
+            review_id,
+            row.get('reviewer_name') if not _is_missing(row.get('reviewer_name')) else 'Pengunjung',
+            int(rating) if not _is_missing(rating) else 5,
+            row.get('date'),
+            row.get('review_text'),
+            visit_time=row.get('visit_time'),
+            owner_response=owner_response,
+            local_guide=position % 3 == 0,
+            truncate=truncate,
+        ))
+
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(SNAPSHOT_TEMPLATE.format(title=html.escape(title), cards='\n'.join(cards)))
+    return len(cards)
+
+
+class ReplayServer:
+    """Local HTTP server paging snapshot cards into the stand-in place page"""
+
+    def __init__(self, cards, title='Replay', page_size=DEFAULT_PAGE_SIZE, latency_ms=DEFAULT_LATENCY_MS,
+                 expand_delay_ms=DEFAULT_EXPAND_DELAY_MS, host='127.0.0.1', port=0):
+        self.cards = list(cards)
+        self.page_size = page_size
+        self.latency = latency_ms / 1000
+        self.page = PAGE_TEMPLATE.format(
+            title=html.escape(title),
+            expand_delay=int(expand_delay_ms),
+            sort_options=''.join(SORT_OPTION_TEMPLATE.format(index=index, sort=sort, label=label,
+                                                             checked='true' if sort == 'relevant' else 'false')
+                                 for index, (label, sort) in enumerate(SORT_ORDERS.items())),
+        ).encode('utf-8')
+        ratings = [card_rating(card) for card in self.cards]
+        positions = range(len(self.cards))
+        self.orders = {
+            'relevant': list(positions),
+            # Snapshots carry no absolute dates; keep the captured order
+            'newest': list(positions),
+            'highest': sorted(positions, key=lambda i: -ratings[i]),
+            'lowest': sorted(positions, key=lambda i: ratings[i] or 6),
+        }
+        self.pages_served = 0
+        self.served_ids = set()
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/place"
+
+    def page_cards(self, sort, page):
+        """Cards of one page and whether it was the last one"""
+        order = self.orders.get(sort, self.orders['relevant'])
+        start = page * self.page_size
+        chosen = [self.cards[i] for i in order[start:start + self.page_size]]
+        with self._lock:
+            self.pages_served += 1
+            self.served_ids.update(card_review_id(card) for card in chosen)
+        return chosen, start + self.page_size >= len(order)
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlparse(self.path)
+                if url.path == '/place':
+                    self._send(server.page, 'text/html; charset=utf-8')
+                elif url.path == '/reviews':
+                    query = parse_qs(url.query)
+                    try:
+                        page = int(query.get('page', ['0'])[0])
+                    except ValueError:
+                        page = 0
+                    time.sleep(server.latency)
+                    cards, done = server.page_cards(query.get('sort', ['relevant'])[0], page)
+                    body = json.dumps({'cards': cards, 'done': done}, ensure_ascii=False)
+                    self._send(body.encode('utf-8'), 'application/json; charset=utf-8')
+                else:
+                    self.send_error(404)
+
+            def _send(self, body, content_type):
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('Cache-Control', 'no-store')
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.stop()
+        return False
+
+
+class _MemorySampler(threading.Thread):
+    """Peak RSS of the driver's process tree, sampled in the background"""
+
+    def __init__(self, driver, interval=0.5):
+        super().__init__(daemon=True)
+        self.driver = driver
+        self.interval = interval
+        self.peak_mb = None
+        self._stop_event = threading.Event()
+
+    def run(self):
+        from .driver import get_driver_memory_mb
+
+        while not self._stop_event.is_set():
+            memory_mb = get_driver_memory_mb(self.driver)
+            if memory_mb is not None:
+                self.peak_mb = max(self.peak_mb or 0, memory_mb)
+            self._stop_event.wait(self.interval)
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+        return self.peak_mb
+
+
+def run_replay(snapshot_path, mode='main', target_reviews=None, page_size=DEFAULT_PAGE_SIZE,
+               latency_ms=DEFAULT_LATENCY_MS, base_place='museum_angkut', **scraper_options):
+    """Scrape a snapshot through the real ReviewScraper; returns a result dict.
+
+    The replay place is registered under ``REPLAY_PLACE_KEY`` (a copy of
+    ``base_place`` pointing at the local server) for the duration of the run.
+    Reviews are not saved and no checkpoint is written.
+    """
+    from .engine import MODE_LOW_RATING, ReviewScraper
+    from .places import PLACES
+
+    cards = load_snapshot(snapshot_path)
+    if not cards:
+        raise ValueError(f"No div[data-review-id] cards found in {snapshot_path}")
+
+    options = {'headless': True, 'checkpoint_folder': None}
+    options.update(scraper_options)
+
+    with ReplayServer(cards, title=PLACES[base_place]['name'], page_size=page_size,
+                      latency_ms=latency_ms) as server:
+        PLACES[REPLAY_PLACE_KEY] = dict(
+            PLACES[base_place],
+            url=server.url,
+            target_reviews=target_reviews or len(cards),
+            require_visit_time=False,
+            output_prefix=REPLAY_PLACE_KEY,
+            low_rating_prefix=REPLAY_PLACE_KEY if mode == MODE_LOW_RATING else None,
+        )
+        scraper = ReviewScraper(**options)
+        try:
+            scraper.start()
+            sampler = _MemorySampler(scraper.driver)
+            sampler.start()
+            started = time.perf_counter()
+            try:
+                reviews = scraper.scrape_place(REPLAY_PLACE_KEY, mode=mode, save=False)
+            finally:
+                seconds = time.perf_counter() - started
+                peak_browser_mb = sampler.stop()
+        finally:
+            scraper.close()
+            PLACES.pop(REPLAY_PLACE_KEY, None)
+
+    snapshot = scraper.metrics.snapshot(final=True)
+    open_seconds = snapshot['phases'].get('open_place', {}).get('seconds', 0.0)
+    crawl_seconds = max(seconds - open_seconds, 1e-9)
+    collected_ids = {review.get('review_id') for review in reviews}
+    webdriver_calls = snapshot['webdriver_calls']
+
+    return {
+        'snapshot': snapshot_path,
+        'cards': len(cards),
+        'served': len(server.served_ids),
+        'pages_served': server.pages_served,
+        'reviews': len(reviews),
+        'missing': len(server.served_ids - collected_ids) if mode != MODE_LOW_RATING else None,
+        'startup_seconds': round(scraper.startup_seconds or 0.0, 3),
+        'seconds': round(seconds, 3),
+        'crawl_seconds': round(crawl_seconds, 3),
+        'reviews_per_second': round(len(reviews) / crawl_seconds, 2),
+        'webdriver_calls': webdriver_calls,
+        'round_trips_per_review': round(webdriver_calls / len(reviews), 2) if reviews else None,
+        'idle_seconds': snapshot['idle_seconds'],
+        'peak_browser_rss_mb': round(peak_browser_mb, 1) if peak_browser_mb is not None else None,
+        # ru_maxrss is in kB on Linux
+        'peak_python_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        'phases': snapshot['phases'],
+    }
+
+
+def run_benchmarks(snapshot_path, configs=('default',), repeat=1, json_path=None, **replay_options):
+    """Run ``run_replay`` once per config and repeat; prints a table and returns the results"""
+    results = []
+    for name in configs:
+        for run in range(repeat):
+            print(f"\n### Replay benchmark: {name} (run {run + 1}/{repeat})")
+            result = run_replay(snapshot_path, **dict(replay_options, **BENCH_CONFIGS[name]))
+            result['config'] = name
+            results.append(result)
+            if json_path:
+                os.makedirs(os.path.dirname(json_path) or '.', exist_ok=True)
+                with open(json_path, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(result, ensure_ascii=False, sort_keys=True) + '\n')
+
+    print(f"\n{'config':12s} {'reviews':>8s} {'missing':>8s} {'rev/s':>8s} {'rt/review':>10s} "
+          f"{'idle s':>8s} {'browser MB':>11s} {'python MB':>10s}")
+    for result in results:
+        print(f"{result['config']:12s} {result['reviews']:8d} {str(result['missing']):>8s} "
+              f"{result['reviews_per_second']:8.2f} {str(result['round_trips_per_review']):>10s} "
+              f"{result['idle_seconds']:8.1f} {str(result['peak_browser_rss_mb']):>11s} "
+              f"{result['peak_python_rss_mb']:10.1f}")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay saved review panels from a local server")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    build = commands.add_parser('build', help="build a snapshot from saved reviews")
+    build.add_argument('sources', nargs='+', help="review files or glob patterns (csv/jsonl/parquet)")
+    build.add_argument('-o', '--output', default=os.path.join(REPLAY_FOLDER, 'snapshot.html'),
+                       help=f"snapshot HTML to write (default: {REPLAY_FOLDER}/snapshot.html)")
+    build.add_argument('--limit', type=int, default=None, help="use only the first N reviews")
+    build.add_argument('--owner-every', type=int, default=DEFAULT_OWNER_EVERY,
+                       help="add an owner response to every Nth card (0 = none)")
+    build.add_argument('--truncate', type=int, default=DEFAULT_TRUNCATE_CHARS,
+                       help="hide text past this many characters behind 'Lainnya' (0 = never)")
+
+    serve = commands.add_parser('serve', help="serve a snapshot until interrupted")
+    serve.add_argument('snapshot')
+    serve.add_argument('--port', type=int, default=8765)
+    serve.add_argument('--latency-ms', type=int, default=DEFAULT_LATENCY_MS)
+
+    bench = commands.add_parser('bench', help="scrape a snapshot and report throughput")
+    bench.add_argument('snapshot')
+    bench.add_argument('--config', action='append', choices=sorted(BENCH_CONFIGS),
+                       help="scraper configuration to run (repeatable, default: default)")
+    bench.add_argument('--repeat', type=int, default=1)
+    bench.add_argument('--target', type=int, default=None, help="stop after N reviews (default: all cards)")
+    bench.add_argument('--low-rating', action='store_true', help="run the 'Rating terendah' crawl")
+    bench.add_argument('--latency-ms', type=int, default=DEFAULT_LATENCY_MS)
+    bench.add_argument('--page-size', type=int, default=DEFAULT_PAGE_SIZE)
+    bench.add_argument('--headed', action='store_true', help="show the browser")
+    bench.add_argument('--json', metavar='PATH', help="append one JSON line per run to PATH")
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        count = build_snapshot(args.sources, args.output, limit=args.limit,
+                               owner_every=args.owner_every, truncate=args.truncate)
+        print(f"Wrote {count} review cards to {args.output}")
+        return 0 if count else 1
+
+    if args.command == 'serve':
+        cards = load_snapshot(args.snapshot)
+        with ReplayServer(cards, latency_ms=args.latency_ms, port=args.port) as server:
+            print(f"Serving {len(cards)} review cards at {server.url} (Ctrl+C to stop)")
+            try:
+                while True:
+                    time.sleep(3600)
+            except KeyboardInterrupt:
+                pass
+        return 0
+
+    from .engine import MODE_LOW_RATING, MODE_MAIN
+
+    run_benchmarks(
+        args.snapshot,
+        configs=args.config or ['default'],
+        repeat=args.repeat,
+        json_path=args.json,
+        mode=MODE_LOW_RATING if args.low_rating else MODE_MAIN,
+        target_reviews=args.target,
+        latency_ms=args.latency_ms,
+        page_size=args.page_size,
+        headless=not args.headed,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,328 @@
+"""One SQLite file holding every review of every place and run.
+
+The scraper upserts reviews as it collects them and the cleaning notebook
+upserts its cleaned columns, so questions like "1-2 star Selecta reviews
+mentioning antre" are one indexed query instead of loading and merging every
+CSV in hasil scraping::
+
+    python -m wisata_scraper.store import          # backfill from the saved files
+    python -m wisata_scraper.store query --dataset taman_selecta --max-rating 2 --text "antre*"
+
+Rows are keyed by the review fingerprint (see fingerprint.py), so a review
+seen in several runs or in both the main and the low-rating crawl is stored
+once; a later scrape refreshes its relative date and ``scraped_at``. The
+scraped text is kept in ``review_text`` (indexed by FTS5) and the cleaned
+fields in ``*_clean`` columns, so rescraping never overwrites cleaning.
+WAL mode lets pool workers and the notebook write at the same time.
+"""
+import argparse
+import os
+import sqlite3
+import time
+from datetime import datetime
+
+import pandas as pd
+
+from .output import OUTPUT_FOLDER
+
+STORE_PATH = os.path.join(OUTPUT_FOLDER, 'reviews.sqlite')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS reviews (
+    fingerprint INTEGER PRIMARY KEY,
+    dataset TEXT NOT NULL,
+    wisata TEXT,
+    place TEXT,
+    mode TEXT,
+    review_id TEXT,
+    reviewer_name TEXT,
+    rating INTEGER,
+    date TEXT,
+    visit_time TEXT,
+    review_text TEXT,
+    scraped_at TEXT,
+    reviewer_name_clean TEXT,
+    visit_time_clean TEXT,
+    review_text_clean TEXT,
+    date_earliest TEXT,
+    date_latest TEXT,
+    cleaned_at TEXT,
+    updated_at TEXT
+);
+CREATE INDEX IF NOT EXISTS reviews_dataset_rating ON reviews(dataset, rating);
+CREATE INDEX IF NOT EXISTS reviews_scraped_at ON reviews(scraped_at);
+CREATE INDEX IF NOT EXISTS reviews_review_id ON reviews(review_id);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS reviews_fts USING fts5(
+    review_text, content='reviews', content_rowid='fingerprint', tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS reviews_fts_insert AFTER INSERT ON reviews BEGIN
+    INSERT INTO reviews_fts(rowid, review_text) VALUES (new.fingerprint, new.review_text);
+END;
+CREATE TRIGGER IF NOT EXISTS reviews_fts_delete AFTER DELETE ON reviews BEGIN
+    INSERT INTO reviews_fts(reviews_fts, rowid, review_text) VALUES ('delete', old.fingerprint, old.review_text);
+END;
+CREATE TRIGGER IF NOT EXISTS reviews_fts_update AFTER UPDATE OF review_text ON reviews BEGIN
+    INSERT INTO reviews_fts(reviews_fts, rowid, review_text) VALUES ('delete', old.fingerprint, old.review_text);
+    INSERT INTO reviews_fts(rowid, review_text) VALUES (new.fingerprint, new.review_text);
+END;
+"""
+
+# A newer scrape of the same review refreshes its relative date; an older
+# file imported later does not roll it back
+UPSERT_SCRAPED_SQL = """
+INSERT INTO reviews (fingerprint, dataset, wisata, place, mode, review_id, reviewer_name, rating,
+                     date, visit_time, review_text, scraped_at, updated_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(fingerprint) DO UPDATE SET
+    wisata = COALESCE(reviews.wisata, excluded.wisata),
+    place = COALESCE(excluded.place, reviews.place),
+    mode = COALESCE(excluded.mode, reviews.mode),
+    review_id = COALESCE(excluded.review_id, reviews.review_id),
+    date = excluded.date,
+    visit_time = COALESCE(excluded.visit_time, reviews.visit_time),
+    scraped_at = excluded.scraped_at,
+    updated_at = excluded.updated_at
+WHERE COALESCE(excluded.scraped_at, '') >= COALESCE(reviews.scraped_at, '')
+"""
+
+# Reviews only known from the cleaned frame get the cleaned text as review_text
+UPSERT_CLEANED_SQL = """
+INSERT INTO reviews (fingerprint, dataset, wisata, reviewer_name, rating, date, visit_time, review_text,
+                     scraped_at, reviewer_name_clean, visit_time_clean, review_text_clean,
+                     date_earliest, date_latest, cleaned_at, updated_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(fingerprint) DO UPDATE SET
+    wisata = excluded.wisata,
+    reviewer_name_clean = excluded.reviewer_name_clean,
+    visit_time_clean = excluded.visit_time_clean,
+    review_text_clean = excluded.review_text_clean,
+    date_earliest = excluded.date_earliest,
+    date_latest = excluded.date_latest,
+    cleaned_at = excluded.cleaned_at,
+    updated_at = excluded.updated_at
+"""
+
+
+def _value(value):
+    """A value SQLite can bind: NaN/NaT/'' become None, numpy scalars Python ones"""
+    if value is None or pd.isna(value):
+        return None
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    if hasattr(value, 'item'):
+        value = value.item()
+    if value == '':
+        return None
+    return value
+
+
+def _text(value):
+    value = _value(value)
+    return None if value is None else str(value)
+
+
+def _date(value):
+    value = _value(value)
+    return None if value is None else value[:10]
+
+
+def _rating(value):
+    value = _value(value)
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class ReviewStore:
+    """Connection to the review database, created on first use"""
+
+    def __init__(self, path=STORE_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.connection = sqlite3.connect(path, timeout=30)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+        return False
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def __len__(self):
+        return self.connection.execute('SELECT COUNT(*) FROM reviews').fetchone()[0]
+
+    def upsert_scraped(self, reviews, dataset, wisata=None, place=None, mode=None):
+        """Insert or refresh reviews as scraped (dicts with a ``fingerprint``); returns the row count"""
+        now = datetime.now().isoformat(timespec='seconds')
+        rows = []
+        for review in reviews:
+            fingerprint = _value(review.get('fingerprint'))
+            if fingerprint is None:
+                continue
+            rows.append((
+                int(fingerprint), dataset, _text(review.get('wisata')) or wisata, place, mode,
+                _text(review.get('review_id')), _text(review.get('reviewer_name')), _rating(review.get('rating')),
+                _text(review.get('date')), _text(review.get('visit_time')), _text(review.get('review_text')),
+                _text(review.get('scraped_at')), now,
+            ))
+        with self.connection:
+            self.connection.executemany(UPSERT_SCRAPED_SQL, rows)
+        return len(rows)
+
+    def upsert_frame(self, df, dataset, wisata=None, place=None, mode=None):
+        """upsert_scraped for a DataFrame of saved reviews (e.g. from catalog.load_dataset)"""
+        return self.upsert_scraped(df.to_dict('records'), dataset, wisata, place, mode)
+
+    def upsert_cleaned(self, df_clean, dataset):
+        """Store the cleaned columns of a frame from cleaning.clean_dataset; returns the row count"""
+        now = datetime.now().isoformat(timespec='seconds')
+        columns = ['fingerprint', 'wisata', 'reviewer_name', 'rating', 'date', 'visit_time', 'review_text',
+                   'scraped_at', 'date_earliest', 'date_latest']
+        frame = df_clean.reindex(columns=columns)
+        rows = []
+        for (fingerprint, wisata, reviewer_name, rating, date, visit_time, review_text,
+             scraped_at, date_earliest, date_latest) in frame.itertuples(index=False, name=None):
+            fingerprint = _value(fingerprint)
+            if fingerprint is None:
+                continue
+            reviewer_name, visit_time, review_text = _text(reviewer_name), _text(visit_time), _text(review_text)
+            rows.append((
+                int(fingerprint), dataset, _text(wisata), reviewer_name, _rating(rating), _text(date),
+                visit_time, review_text, _text(scraped_at), reviewer_name, visit_time, review_text,
+                _date(date_earliest), _date(date_latest), now, now,
+            ))
+        with self.connection:
+            self.connection.executemany(UPSERT_CLEANED_SQL, rows)
+        return len(rows)
+
+    def search(self, dataset=None, min_rating=None, max_rating=None, text=None,
+               since=None, until=None, limit=None):
+        """Reviews matching every given filter, as a DataFrame.
+
+        ``text`` is an FTS5 query on the scraped text ('antre*' also finds
+        'antrean'); ``since``/``until`` keep reviews whose resolved date range
+        overlaps them (only rows the cleaner has seen have one).
+        """
+        clauses = []
+        params = []
+        source = 'reviews'
+        if text:
+            source = 'reviews JOIN reviews_fts ON reviews_fts.rowid = reviews.fingerprint'
+            clauses.append('reviews_fts MATCH ?')
+            params.append(text)
+        if dataset:
+            clauses.append('reviews.dataset = ?')
+            params.append(dataset)
+        if min_rating is not None:
+            clauses.append('reviews.rating >= ?')
+            params.append(min_rating)
+        if max_rating is not None:
+            clauses.append('reviews.rating <= ?')
+            params.append(max_rating)
+        if since:
+            clauses.append('reviews.date_latest >= ?')
+            params.append(str(since)[:10])
+        if until:
+            clauses.append('reviews.date_earliest <= ?')
+            params.append(str(until)[:10])
+
+        sql = f"SELECT reviews.* FROM {source}"
+        if clauses:
+            sql += ' WHERE ' + ' AND '.join(clauses)
+        sql += ' ORDER BY reviews.scraped_at DESC'
+        if limit:
+            sql += f' LIMIT {int(limit)}'
+        return pd.read_sql_query(sql, self.connection, params=params)
+
+
+class StoreSink:
+    """Queues a place's reviews during a crawl and upserts them on every flush"""
+
+    def __init__(self, store, place, mode):
+        self.store = store
+        self.place = place
+        self.mode = mode
+        self.count = 0
+        self._pending = []
+
+    def write(self, review):
+        self._pending.append(review)
+
+    def flush(self):
+        if not self._pending:
+            return
+        try:
+            self.count += self.store.upsert_scraped(self._pending, self.place['dataset'], self.place['name'],
+                                                    self.place['key'], self.mode)
+        except sqlite3.Error as e:
+            # The files written alongside stay complete; the store can be backfilled later
+            print(f"Could not write to review store: {e}")
+        self._pending = []
+
+    def close(self):
+        self.flush()
+        self.store.close()
+        if self.count:
+            print(f"Upserted {self.count} reviews into {self.store.path}")
+
+
+def open_store_sink(place, mode, path=STORE_PATH):
+    return StoreSink(ReviewStore(path), place, mode)
+
+
+def import_sources(path=STORE_PATH, folders=None):
+    """Backfill the store from every saved run the cleaning catalog finds; returns the row count"""
+    from .catalog import SOURCE_FOLDERS, discover_sources, load_dataset
+
+    total = 0
+    with ReviewStore(path) as store:
+        for dataset_key, paths in discover_sources(folders or SOURCE_FOLDERS).items():
+            df, _ = load_dataset(dataset_key, paths)
+            if df is not None:
+                total += store.upsert_frame(df, dataset_key)
+        print(f"{total} reviews upserted, {len(store)} in {path}")
+    return total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Consolidated SQLite store of all scraped reviews")
+    parser.add_argument('--db', default=STORE_PATH, help=f"database path (default: {STORE_PATH})")
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('import', help="upsert every saved run in hasil scraping / hasil scraping rating rendah")
+    query = commands.add_parser('query', help="search stored reviews")
+    query.add_argument('--dataset', help="dataset key, e.g. taman_selecta")
+    query.add_argument('--min-rating', type=int)
+    query.add_argument('--max-rating', type=int)
+    query.add_argument('--text', help="FTS5 query on the review text, e.g. 'antre*'")
+    query.add_argument('--since', help="reviews dated on or after YYYY-MM-DD")
+    query.add_argument('--until', help="reviews dated on or before YYYY-MM-DD")
+    query.add_argument('--limit', type=int, default=20)
+    args = parser.parse_args(argv)
+
+    if args.command == 'import':
+        import_sources(args.db)
+        return 0
+
+    with ReviewStore(args.db) as store:
+        started = time.perf_counter()
+        results = store.search(args.dataset, args.min_rating, args.max_rating, args.text,
+                               args.since, args.until, args.limit)
+        seconds = time.perf_counter() - started
+    for row in results.itertuples(index=False):
+        print(f"[{row.rating}] {row.dataset} {row.date}: {(row.review_text or '')[:120]}")
+    print(f"{len(results)} reviews in {seconds * 1000:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
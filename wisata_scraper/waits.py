@@ -0,0 +1,270 @@
+"""Event-driven waits for the review panel instead of fixed time.sleep calls.
+
+Most review batches land well under a second after a scroll, so sleeping a
+fixed 1-3 s per step wastes most of a crawl. These helpers return as soon as
+the page shows the change we are waiting for (more ``[data-review-id]`` nodes,
+a taller panel, an expand button gone) and only use the full timeout when
+nothing happens, e.g. at the end of the review list.
+"""
+import time
+
+from . import metrics
+from .driver import safe_execute_script
+
+# Resolves from inside the page as soon as the review count or the panel
+# height grows, so a successful wait costs a single WebDriver round-trip
+REVIEW_GROWTH_SCRIPT = """
+var container = arguments[0];
+var oldCount = arguments[1];
+var oldHeight = arguments[2];
+var timeoutMs = arguments[3];
+var done = arguments[arguments.length - 1];
+
+function state() {
+    return {
+        count: document.querySelectorAll('div[data-review-id]').length,
+        height: container ? container.scrollHeight : 0
+    };
+}
+function grown(s) {
+    return s.count > oldCount || s.height > oldHeight;
+}
+
+var finished = false;
+var observer = null;
+var timer = null;
+function finish(grew) {
+    if (finished) {
+        return;
+    }
+    finished = true;
+    if (observer) {
+        observer.disconnect();
+    }
+    if (timer) {
+        clearTimeout(timer);
+    }
+    var s = state();
+    s.grew = grew;
+    done(s);
+}
+
+if (grown(state())) {
+    finish(true);
+    return;
+}
+observer = new MutationObserver(function() {
+    if (grown(state())) {
+        finish(true);
+    }
+});
+observer.observe(container || document.body, {childList: true, subtree: true});
+timer = setTimeout(function() { finish(false); }, timeoutMs);
+"""
+
+PANEL_STATE_SCRIPT = """
+var container = arguments[0];
+return {
+    count: document.querySelectorAll('div[data-review-id]').length,
+    height: container ? container.scrollHeight : 0
+};
+"""
+
+EXPAND_DONE_SCRIPT = """
+var buttons = arguments[0].querySelectorAll('button');
+for (var i = 0; i < buttons.length; i++) {
+    var text = buttons[i].textContent || '';
+    if (text.indexOf('Lainnya') !== -1 || text.indexOf('More') !== -1) {
+        return false;
+    }
+}
+return true;
+"""
+
+# True once no review clicked by extract.EXPAND_BATCH_SCRIPT still shows the
+# button that was clicked
+EXPAND_BATCH_DONE_SCRIPT = """
+var nodes = document.querySelectorAll('div[data-scrape-expanding]');
+for (var i = 0; i < nodes.length; i++) {
+    var button = nodes[i].querySelector('button[data-scrape-clicked]');
+    if (!button) {
+        continue;
+    }
+    var text = button.textContent || '';
+    if (text.indexOf('Lainnya') !== -1 || text.indexOf('More') !== -1) {
+        return false;
+    }
+}
+return true;
+"""
+
+# The place page is usable once its 'Ulasan' tab is rendered
+REVIEWS_TAB_READY_SCRIPT = """
+var candidates = document.querySelectorAll("button, div[role='tab']");
+for (var i = 0; i < candidates.length; i++) {
+    var label = (candidates[i].getAttribute('aria-label') || '') + ' ' + (candidates[i].textContent || '');
+    if (label.indexOf('Ulasan') !== -1) {
+        return true;
+    }
+}
+return false;
+"""
+
+# Before a sort option is clicked, every rendered review is tagged with its
+# own id so the wait below can tell the re-sorted list from the old one
+MARK_STALE_REVIEWS_SCRIPT = """
+var nodes = document.querySelectorAll('div[data-review-id]');
+for (var i = 0; i < nodes.length; i++) {
+    nodes[i].setAttribute('data-scrape-stale', nodes[i].getAttribute('data-review-id'));
+}
+return nodes.length;
+"""
+
+# True once the sort menu is closed, the feed is there and it shows reviews;
+# with arguments[0], the first review must also be a new one (a fresh node,
+# or a recycled node holding another review)
+SORT_APPLIED_SCRIPT = """
+var requireFresh = arguments[0];
+var items = document.querySelectorAll("div[role='menuitemradio']");
+for (var i = 0; i < items.length; i++) {
+    if (items[i].getClientRects().length) {
+        return false;
+    }
+}
+if (!document.querySelector("div[role='feed'], div.m6QErb.DxyBCb")) {
+    return false;
+}
+var first = document.querySelector('div[data-review-id]');
+if (!first) {
+    return false;
+}
+return !requireFresh || first.getAttribute('data-scrape-stale') !== first.getAttribute('data-review-id');
+"""
+
+
+class WaitProfile:
+    """Timeout and polling backoff for one kind of wait.
+
+    Polling starts at ``initial_interval`` seconds and is multiplied by
+    ``backoff`` after every miss, capped at ``max_interval``.
+    """
+
+    def __init__(self, timeout=3.0, initial_interval=0.05, backoff=1.5, max_interval=0.5):
+        self.timeout = timeout
+        self.initial_interval = initial_interval
+        self.backoff = backoff
+        self.max_interval = max_interval
+
+    def with_timeout(self, timeout):
+        """Copy of this profile with a different timeout"""
+        return WaitProfile(timeout, self.initial_interval, self.backoff, self.max_interval)
+
+    def intervals(self):
+        """Sleep intervals between polls, with backoff"""
+        interval = self.initial_interval
+        while True:
+            yield interval
+            interval = min(interval * self.backoff, self.max_interval)
+
+    def __repr__(self):
+        return (f"WaitProfile(timeout={self.timeout}, initial_interval={self.initial_interval}, "
+                f"backoff={self.backoff}, max_interval={self.max_interval})")
+
+
+# Scroll loads: the old code slept 3-4 s per scroll attempt
+DEFAULT_WAIT_PROFILE = WaitProfile(timeout=3.0)
+# Expanding a review is client-side only, the text is already on the page
+EXPAND_WAIT_PROFILE = WaitProfile(timeout=1.0, initial_interval=0.03, max_interval=0.2)
+# Opening a place page and re-sorting its reviews: the old code slept 5 s and 3 + 2 s
+PAGE_WAIT_PROFILE = WaitProfile(timeout=10.0, initial_interval=0.1, max_interval=0.5)
+SORT_WAIT_PROFILE = WaitProfile(timeout=5.0, initial_interval=0.1, max_interval=0.5)
+
+
+def wait_until(predicate, profile=DEFAULT_WAIT_PROFILE):
+    """Poll ``predicate`` with backoff until it returns something truthy.
+
+    Returns the predicate's value, or None when the timeout expires.
+    """
+    deadline = time.monotonic() + profile.timeout
+    for interval in profile.intervals():
+        try:
+            result = predicate()
+        except:
+            result = None
+        if result:
+            return result
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        metrics.sleep(min(interval, remaining))
+
+
+def get_panel_state(driver, scrollable_div=None):
+    """Current review count and panel scrollHeight, or None if the driver is gone"""
+    return safe_execute_script(driver, PANEL_STATE_SCRIPT, scrollable_div)
+
+
+def _has_grown(state, before):
+    return bool(state) and (state['count'] > before['count'] or state['height'] > before['height'])
+
+
+@metrics.timed('wait_for_review_growth', idle=True)
+def wait_for_review_growth(driver, scrollable_div, before, profile=DEFAULT_WAIT_PROFILE):
+    """Wait until more reviews are rendered or the panel grows past ``before``.
+
+    ``before`` is a state dict from ``get_panel_state``. A MutationObserver in
+    the page resolves the wait as soon as new nodes arrive; if async scripts
+    are unavailable we fall back to polling. Returns True if content grew.
+    """
+    before = before or {'count': 0, 'height': 0}
+    timeout_ms = int(profile.timeout * 1000)
+    try:
+        # WebDriver's default script timeout is 30 s, well above our profiles
+        state = driver.execute_async_script(
+            REVIEW_GROWTH_SCRIPT, scrollable_div, before['count'], before['height'], timeout_ms
+        )
+        if state is not None:
+            grew = bool(state.get('grew'))
+        else:
+            grew = None
+    except:
+        grew = None
+
+    if grew is None:
+        grew = bool(wait_until(lambda: _has_grown(get_panel_state(driver, scrollable_div), before), profile))
+    if not grew:
+        metrics.count('growth_timeouts')
+    return grew
+
+
+@metrics.timed('wait_for_expanded', idle=True)
+def wait_for_expanded(driver, element, profile=EXPAND_WAIT_PROFILE):
+    """Wait until the review's 'Lainnya' button is gone after a click"""
+    return bool(wait_until(lambda: safe_execute_script(driver, EXPAND_DONE_SCRIPT, element), profile))
+
+
+@metrics.timed('wait_for_batch_expanded', idle=True)
+def wait_for_batch_expanded(driver, profile=EXPAND_WAIT_PROFILE):
+    """Wait until every review clicked by one batched expansion shows its full text"""
+    return bool(wait_until(lambda: safe_execute_script(driver, EXPAND_BATCH_DONE_SCRIPT), profile))
+
+
+@metrics.timed('wait_for_reviews_tab', idle=True)
+def wait_for_reviews_tab(driver, profile=PAGE_WAIT_PROFILE):
+    """Wait until a freshly opened place page shows its 'Ulasan' tab"""
+    return bool(wait_until(lambda: safe_execute_script(driver, REVIEWS_TAB_READY_SCRIPT), profile))
+
+
+def mark_reviews_stale(driver):
+    """Tag the rendered reviews before a sort change; returns how many were tagged"""
+    return safe_execute_script(driver, MARK_STALE_REVIEWS_SCRIPT) or 0
+
+
+@metrics.timed('wait_for_sort_applied', idle=True)
+def wait_for_sort_applied(driver, require_fresh=True, profile=SORT_WAIT_PROFILE):
+    """Wait until the sort menu closed and the feed shows (re-sorted) reviews.
+
+    Pass ``require_fresh=False`` when the clicked option was already
+    selected: Maps then keeps the list it has.
+    """
+    return bool(wait_until(lambda: safe_execute_script(driver, SORT_APPLIED_SCRIPT, require_fresh), profile))